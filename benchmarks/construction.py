@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""Benchmark the per-entity construction cost of `pylobid` entities.
+
+Entities are built from already fetched LOBID-JSON with
+`process_data(data=...)`, so only the processing cost is measured.
+
+    python benchmarks/construction.py
+"""
+import argparse
+import os
+import sys
+import timeit
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [os.path.join(ROOT, "src"), ROOT]
+
+from pylobid import pylobid as pl  # noqa: E402
+from tests.fixtures import TEST_ENTITY_JSON  # noqa: E402
+
+ENTITIES = {item["gndIdentifier"]: item for item in TEST_ENTITY_JSON}
+
+
+def build(cls, data):
+    entity = cls()
+    entity.process_data(data=dict(data))
+    return entity
+
+
+def build_place():
+    place = build(pl.PyLobidPlace, ENTITIES["4066009-6"])
+    return place.coords, place.alt_names
+
+
+def build_person():
+    person = build(pl.PyLobidPerson, ENTITIES["118610961"])
+    return person.birth_place, person.alt_names
+
+
+def build_factory():
+    return build(pl.PyLobidClient, ENTITIES["300109849"]).factory()
+
+
+CASES = {
+    "place": build_place,
+    "person": build_person,
+    "factory": build_factory,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=2000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for name, case in CASES.items():
+        best = min(timeit.repeat(case, number=args.number, repeat=args.repeat))
+        print(f"{name:<10} {best / args.number * 1e6:10.1f} us/entity")
+
+
+if __name__ == "__main__":
+    main()
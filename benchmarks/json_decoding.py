@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""Compare the JSON decoders of `pylobid.jsonlib` on LOBID payloads.
+
+Full-size GND documents are decoded from their raw bytes by every installed
+backend, next to `requests.Response.json()`, the decoding path used before.
+A dump of the documents is read with `iter_records` once per backend as
+well. The documents are taken from tests/lobid_documents.jsonl if it was
+recorded from lobid.org with `--record`, else from tests/gnd_documents.jsonl:
+the complete DNB records of a person, two places and two corporate bodies
+in the LOBID-GND layout, without the labels lobid.org adds to linked
+entities. `--fixtures` uses the trimmed `TEST_ENTITY_JSON` documents.
+
+    python benchmarks/json_decoding.py
+    python benchmarks/json_decoding.py --record
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import timeit
+
+import requests
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [os.path.join(ROOT, "src"), ROOT]
+
+from pylobid import dump, jsonlib  # noqa: E402
+from pylobid.transport import HTTPS_BASE_URL, PyLobidTransport  # noqa: E402
+from tests.fixtures import TEST_ENTITY_JSON  # noqa: E402
+
+RECORDED = os.path.normpath(os.path.join(ROOT, "tests", "lobid_documents.jsonl"))
+GND_DOCUMENTS = os.path.normpath(os.path.join(ROOT, "tests", "gnd_documents.jsonl"))
+DOCUMENTS = {
+    "person": "118584596",
+    "place": "4066009-6",
+    "org": "600902-5",
+    "work": "300109849",
+}
+
+
+def record(path: str) -> None:
+    """Fetch the documents from lobid.org and write them as JSON lines."""
+    lines = []
+    with PyLobidTransport(base_url=HTTPS_BASE_URL) as transport:
+        for gnd_id in DOCUMENTS.values():
+            response = transport.get(f"{HTTPS_BASE_URL}/{gnd_id}.json")
+            response.raise_for_status()
+            item = json.loads(response.content)
+            lines.append(json.dumps(item, ensure_ascii=False, separators=(",", ":")))
+            print(f"recorded {gnd_id}, {len(response.content)} bytes")
+    with open(path, "w", encoding="utf-8") as output:
+        output.writelines(line + "\n" for line in lines)
+
+
+def kind(item: dict) -> str:
+    types = item.get("type", [])
+    for name, ent_type in [
+        ("person", "Person"),
+        ("place", "PlaceOrGeographicName"),
+        ("org", "CorporateBody"),
+        ("work", "Work"),
+    ]:
+        if ent_type in types:
+            return name
+    return "other"
+
+
+def load_payloads(fixtures: bool) -> dict:
+    """Return the raw payloads by name, recorded or from `TEST_ENTITY_JSON`."""
+    if fixtures:
+        entities = {item["gndIdentifier"]: item for item in TEST_ENTITY_JSON}
+        return {
+            name: json.dumps(entities[gnd_id], ensure_ascii=False).encode("utf-8")
+            for name, gnd_id in DOCUMENTS.items()
+        }
+    path = RECORDED if os.path.exists(RECORDED) else GND_DOCUMENTS
+    payloads = {}
+    with open(path, "rb") as lines:
+        for line in lines:
+            item = json.loads(line)
+            payloads[f"{kind(item)} {item['gndIdentifier']}"] = line.rstrip()
+    return payloads
+
+
+def response_json(payload: bytes):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = payload
+    return lambda: response.json()
+
+
+def per_call_us(function, number: int) -> float:
+    """Return the best of five mean durations of `number` calls in µs."""
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+
+
+def read_dump(path: str) -> int:
+    return sum(1 for _ in dump.iter_records(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=2000)
+    parser.add_argument("--dump-lines", type=int, default=20000)
+    parser.add_argument(
+        "--record", action="store_true", help="record the documents from lobid.org"
+    )
+    parser.add_argument(
+        "--fixtures", action="store_true", help="use the trimmed test fixtures"
+    )
+    args = parser.parse_args()
+    if args.record:
+        record(RECORDED)
+    payloads = load_payloads(args.fixtures)
+    backends = jsonlib.available_backends()
+    previous = jsonlib.backend
+    columns = ["response.json()"] + backends
+    print(f"{'payload':<18}{'bytes':>8}" + "".join(f"{x:>17}" for x in columns))
+    try:
+        for name, payload in payloads.items():
+            timings = [per_call_us(response_json(payload), args.number)]
+            for backend in backends:
+                jsonlib.set_backend(backend)
+                loads = jsonlib.loads
+                timings.append(per_call_us(lambda: loads(payload), args.number))
+            cells = "".join(f"{x:>14.1f} us" for x in timings)
+            print(f"{name:<18}{len(payload):>8}{cells}")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "dump.jsonl")
+            lines = list(payloads.values())
+            with open(path, "wb") as output:
+                for position in range(args.dump_lines):
+                    output.write(lines[position % len(lines)] + b"\n")
+            size = os.path.getsize(path) / 2**20
+            print(f"\ndump of {args.dump_lines} lines, {size:.1f} MiB")
+            for backend in backends:
+                jsonlib.set_backend(backend)
+                start = time.perf_counter()
+                read_dump(path)
+                elapsed = time.perf_counter() - start
+                print(f"{backend:<10}{elapsed:8.3f} s{size / elapsed:10.1f} MiB/s")
+    finally:
+        jsonlib.set_backend(previous)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""Measure the memory held per entity by full entities and compact records.
+
+Persons are built with `fetch_related=True` from a `MemorySource`, so each
+one holds its own copies of the place documents, as fetched ones do.
+
+    python benchmarks/memory.py
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [os.path.join(ROOT, "src"), ROOT]
+
+from pylobid import pylobid as pl  # noqa: E402
+from pylobid.sources import MemorySource  # noqa: E402
+from tests.fixtures import TEST_ENTITY_JSON  # noqa: E402
+
+ENTITIES = {item["gndIdentifier"]: item for item in TEST_ENTITY_JSON}
+SOURCE = MemorySource(TEST_ENTITY_JSON)
+LINES = {gnd_id: json.dumps(item) for gnd_id, item in ENTITIES.items()}
+
+
+def documents(gnd_id: str, number: int):
+    for _ in range(number):
+        # decode every document from its own line, like a dump or a response
+        yield json.loads(LINES[gnd_id])
+
+
+def build_entity(data: dict):
+    entity = pl.PyLobidClient(source=SOURCE, offline=True, fetch_related=True)
+    entity.process_data(data=data)
+    return entity.factory()
+
+
+def build_record(data: dict):
+    return build_entity(data).to_record()
+
+
+def retained(build, gnd_id: str, number: int) -> float:
+    """Return the bytes held per entity by a list of `number` entities."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        entities = [build(data) for data in documents(gnd_id, number)]
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del entities
+    return (after - before) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=2000)
+    args = parser.parse_args()
+    print(f"{'entity':<10}{'full B':>10}{'record B':>10}{'ratio':>8}")
+    for name, gnd_id in [
+        ("person", "118584596"),
+        ("place", "4066009-6"),
+        ("org", "600902-5"),
+        ("work", "300109849"),
+    ]:
+        full = retained(build_entity, gnd_id, args.number)
+        compact = retained(build_record, gnd_id, args.number)
+        print(f"{name:<10}{full:10.0f}{compact:10.0f}{full / compact:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+"""Benchmark the main `pylobid` code paths against a local stub API.
+
+Every case is timed per operation. The report shows latency percentiles,
+throughput and the peak memory allocated by one operation. Results can
+be saved as JSON and compared with an earlier run, which exits non-zero
+if a case got slower than the threshold.
+
+    python benchmarks/suite.py --save before.json
+    python benchmarks/suite.py --compare before.json
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [os.path.join(ROOT, "src"), ROOT]
+
+from pylobid import cache  # noqa: E402
+from pylobid import pylobid as pl  # noqa: E402
+from pylobid import transport  # noqa: E402
+from pylobid.testing import StubLobidServer  # noqa: E402
+from tests.fixtures import TEST_ENTITY_JSON  # noqa: E402
+
+try:
+    import wtforms
+except ModuleNotFoundError:
+    wtforms = None
+else:
+    from pylobid import validators
+
+ENTITIES = {item["gndIdentifier"]: item for item in TEST_ENTITY_JSON}
+ID_URLS = [
+    f"https://d-nb.info/gnd/{item['gndIdentifier']}" for item in TEST_ENTITY_JSON
+] * 1500
+
+
+def from_data(cls, gnd_id):
+    entity = cls()
+    entity.process_data(data=json.loads(json.dumps(ENTITIES[gnd_id])))
+    return entity
+
+
+def validator_case():
+    class PlaceForm(wtforms.Form):
+        gnd = wtforms.StringField("GND Id", [validators.GNDPlaceEntity()])
+
+    def validate():
+        form = PlaceForm(data={"gnd": "https://d-nb.info/gnd/4066009-6"})
+        if not form.validate():
+            raise AssertionError(form.errors)
+
+    return validate
+
+
+def extract_ids():
+    client = pl.PyLobidClient()
+    return [client.extract_id(url) for url in ID_URLS]
+
+
+CASES = {
+    "construction": lambda: pl.PyLobidClient("4066009-6"),
+    "factory": lambda: from_data(pl.PyLobidClient, "300109849").factory(),
+    "person": lambda: pl.PyLobidPerson("118584596"),
+    "person_related": lambda: pl.PyLobidPerson("118584596", fetch_related=True),
+    "coords": lambda: from_data(pl.PyLobidPlace, "4066009-6").coords,
+    f"extract_id_{len(ID_URLS)}": extract_ids,
+}
+if wtforms is not None:
+    CASES["validator"] = validator_case()
+
+
+def percentile(values: list, share: float) -> float:
+    """Return the nearest-rank percentile of sorted values."""
+    return values[min(len(values) - 1, int(share * len(values)))]
+
+
+def peak_allocation(case, number: int) -> int:
+    """Return the largest peak of traced memory of a single call in bytes."""
+    reset_peak = getattr(tracemalloc, "reset_peak", tracemalloc.clear_traces)
+    tracemalloc.start()
+    try:
+        peak = 0
+        for _ in range(number):
+            reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            case()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def measure(case, number: int, warmup: int, alloc_number: int) -> dict:
+    """Time `number` calls of `case` after `warmup` calls."""
+    for _ in range(warmup):
+        case()
+    timings = []
+    start = time.perf_counter()
+    for _ in range(number):
+        begin = time.perf_counter_ns()
+        case()
+        timings.append(time.perf_counter_ns() - begin)
+    elapsed = time.perf_counter() - start
+    timings.sort()
+    return {
+        "number": number,
+        "mean_us": sum(timings) / number / 1e3,
+        "p50_us": percentile(timings, 0.50) / 1e3,
+        "p90_us": percentile(timings, 0.90) / 1e3,
+        "p99_us": percentile(timings, 0.99) / 1e3,
+        "max_us": timings[-1] / 1e3,
+        "ops_per_s": number / elapsed,
+        "alloc_peak_kib": peak_allocation(case, alloc_number) / 1024,
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args) -> dict:
+    """Run the selected cases against a stub server."""
+    previous = transport.get_default_transport(), cache.get_default_cache()
+    server = StubLobidServer(TEST_ENTITY_JSON, latency=args.latency).start()
+    if args.http2:
+        stub_transport = transport.HTTP2Transport(base_url=server.base_url)
+    else:
+        stub_transport = transport.PyLobidTransport(
+            base_url=server.base_url, keep_alive=not args.no_keep_alive
+        )
+    transport.set_default_transport(stub_transport)
+    cache.set_default_cache(cache.EntityCache() if args.cache else None)
+    results = {}
+    try:
+        for name, case in CASES.items():
+            if args.keyword and not any(x in name for x in args.keyword):
+                continue
+            results[name] = measure(case, args.number, args.warmup, args.alloc_number)
+            print_row(name, results[name])
+    finally:
+        transport.set_default_transport(previous[0])
+        cache.set_default_cache(previous[1])
+        stub_transport.close()
+        server.stop()
+    return {
+        "meta": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "settings": {
+                "number": args.number,
+                "latency": args.latency,
+                "cache": args.cache,
+                "keep_alive": not args.no_keep_alive,
+                "http2": args.http2,
+            },
+        },
+        "results": results,
+    }
+
+
+def print_header() -> None:
+    print(
+        f"{'case':<18}{'p50 us':>10}{'p90 us':>10}{'p99 us':>10}"
+        f"{'ops/s':>10}{'peak KiB':>10}"
+    )
+
+
+def print_row(name: str, result: dict) -> None:
+    print(
+        f"{name:<18}{result['p50_us']:10.1f}{result['p90_us']:10.1f}"
+        f"{result['p99_us']:10.1f}{result['ops_per_s']:10.1f}"
+        f"{result['alloc_peak_kib']:10.1f}"
+    )
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """Print the p50 change of every case and return the regressed cases."""
+    regressions = []
+    print(f"\n{'case':<18}{'before':>10}{'after':>10}{'change':>10}")
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        change = result["p50_us"] / before["p50_us"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<18}{before['p50_us']:10.1f}{result['p50_us']:10.1f}"
+            f"{change:+10.1%}{flag}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=200)
+    parser.add_argument("-w", "--warmup", type=int, default=10)
+    parser.add_argument("--alloc-number", type=int, default=20)
+    parser.add_argument("-k", "--keyword", action="append", help="select cases")
+    parser.add_argument("--latency", type=float, default=0.0, help="stub latency")
+    parser.add_argument("--cache", action="store_true", help="use an entity cache")
+    parser.add_argument("--no-keep-alive", action="store_true")
+    parser.add_argument("--http2", action="store_true", help="use HTTP2Transport")
+    parser.add_argument("--save", help="write the results to a JSON file")
+    parser.add_argument("--compare", help="compare with saved results")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+    print_header()
+    current = run(args)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as output:
+            json.dump(current, output, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline:
+            regressions = compare(json.load(baseline), current, args.threshold)
+        if regressions:
+            sys.exit(f"Regressions: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""Asyncio client for the LOBID-API."""
+import asyncio
+from typing import AsyncIterator, Iterable
+
+try:
+    import httpx
+except ModuleNotFoundError:
+    httpx = None
+
+from pylobid import pylobid
+from . import jsonlib
+from .cache import _copy_json
+from .singleflight import AsyncSingleFlight
+from .transport import DEFAULT_BASE_URL
+
+
+class AsyncPyLobidClient:
+    """Asynchronous counterpart of `PyLobidClient` built on `httpx`.
+
+    At most `max_concurrency` requests are in flight at any time, all of them
+    sharing one pooled `httpx.AsyncClient`. Entities are returned as the same
+    `PyLobidPlace`, `PyLobidOrg`, `PyLobidPerson` and `PyLobidWork` instances
+    `PyLobidClient.factory()` returns. Concurrent fetches of the same entity
+    share one request.
+
+    :param fetch_related: fetch related place entities of persons
+    :type fetch_related: bool, optional
+    :param max_concurrency: The maximum number of requests in flight
+    :type max_concurrency: int, optional
+    :param base_url: The LOBID-GND base URL, defaults to http://lobid.org/gnd
+    :type base_url: str, optional
+    :param timeout: Timeout in seconds passed to every request
+    :type timeout: float, optional
+    """
+
+    def __init__(
+        self,
+        fetch_related: bool = False,
+        max_concurrency: int = 10,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = None,
+    ) -> None:
+        """Class constructor."""
+        if httpx is None:
+            raise ModuleNotFoundError(
+                "AsyncPyLobidClient requires httpx, install it with "
+                "`pip install pylobid[async]`"
+            )
+        self.BASE_URL = base_url.rstrip("/")
+        self.fetch_related = fetch_related
+        self.max_concurrency = max_concurrency
+        self.session = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+        )
+        self._semaphore = None
+        self.in_flight = AsyncSingleFlight()
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding the requests in flight."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def extract_id(self, url: str) -> str:
+        """Extract the GND-ID from an GND-URL.
+
+        :param url: A GND-URL, e.g. http://d-nb.info/gnd/118650130
+        :type url: str
+
+        :raises: GNDIdError if no GND-ID is found.
+        :return: The GND-ID, e.g. 118650130
+        :rtype: str
+        """
+        return pylobid.PyLobidClient().extract_id(url)
+
+    async def get_entity_json(self, url: str) -> dict:
+        """Get the LOBID-JSON response of a given GND-URL.
+
+        :param url: A GND_URL or GND-ID
+        :type url: str
+
+        :raises: GNDIdError, GNDNotFoundError, GNDAPIError
+        :return: The matching JSON representation fetched from LOBID
+        :rtype: dict
+        """
+        gnd_id = self.extract_id(url)
+        if not pylobid.is_valid_gnd_id(gnd_id):
+            raise pylobid.GNDIdError(f'"{gnd_id}" is not a valid GND-ID')
+        data, _ = await self.in_flight.do(
+            gnd_id, lambda: self._fetch_json(gnd_id), copy=_copy_json
+        )
+        return data
+
+    async def _fetch_json(self, gnd_id: str) -> dict:
+        async with self.semaphore:
+            response = await self.session.get(
+                f"{self.BASE_URL}/{gnd_id}", headers={"Accept": "application/json"}
+            )
+        if response.status_code == 404:
+            raise pylobid.GNDNotFoundError(
+                f'Could not find a GND Entity for ID "{gnd_id}"'
+            )
+        if not response.is_success:
+            raise pylobid.GNDAPIError(f"GND API error code: {response.status_code}")
+        return jsonlib.loads(response.content)
+
+    async def get(self, url: str):
+        """Fetch an entity and return a matching instance.
+
+        :param url: A GND_URL or GND-ID
+        :type url: str
+
+        :raises: GNDIdError, GNDNotFoundError, GNDAPIError
+        :return: An matching object for the GND URL or Id
+        :rtype: `PyLobidPlace`, `PyLobidOrg`, `PyLobidPerson`, `PyLobidWork`
+        """
+        client = pylobid.PyLobidClient()
+        client.process_data(data=await self.get_entity_json(url))
+        entity = client.factory()
+        if self.fetch_related and entity.is_person:
+            born_id = entity.place_of_values().get("id")
+            died_id = entity.place_of_values(place_of="Death").get("id")
+            if born_id == died_id:
+                born = died = await self._place_json(born_id)
+            else:
+                born, died = await asyncio.gather(
+                    self._place_json(born_id), self._place_json(died_id)
+                )
+            entity.fetch_related = True
+            entity.set_related_places(born=born, died=died)
+        return entity
+
+    async def resolve_many(
+        self, ids: Iterable, return_exceptions: bool = False
+    ) -> AsyncIterator:
+        """Fetch many entities concurrently, yielding them as they complete.
+
+        :param ids: GND_URIs/URLs or GND-IDs
+        :type ids: Iterable
+        :param return_exceptions: yield exceptions instead of raising them
+        :type return_exceptions: bool, optional
+
+        :return: The matching entities (or exceptions) in completion order
+        :rtype: AsyncIterator
+        """
+        ids = iter(ids)
+        pending = set()
+        window = 2 * self.max_concurrency
+        try:
+            while True:
+                for item in ids:
+                    pending.add(asyncio.ensure_future(self.get(item)))
+                    if len(pending) >= window:
+                        break
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        yield task.result()
+                    elif return_exceptions:
+                        yield error
+                    else:
+                        raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _place_json(self, place_id: str) -> dict:
+        if place_id is None:
+            return {}
+        return await self.get_entity_json(place_id)
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncPyLobidClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        return f"<AsyncPyLobidClient {self.BASE_URL}>"
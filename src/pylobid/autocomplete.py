@@ -0,0 +1,224 @@
+"""An offline autocomplete index over the names of LOBID entities."""
+import json
+import os
+import re
+import sys
+import unicodedata
+from array import array
+from bisect import bisect_left
+from typing import Iterable
+
+from .dump import iter_records
+
+INDEX_MAGIC = b"PYLOBAC1"
+SEPARATOR = "\x00"
+
+
+def normalize(name: str) -> str:
+    """Normalize a name for prefix matching.
+
+    Accents are stripped, the case is folded and every run of punctuation
+    and whitespace becomes a single space, e.g. 'Baden (Niederösterreich)'
+    becomes 'baden niederosterreich'.
+
+    :param name: A name, e.g. a `preferredName`
+    :type name: str
+
+    :return: The normalized name
+    :rtype: str
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(x for x in decomposed if not unicodedata.combining(x))
+    return " ".join(re.split(r"[\W_]+", stripped.casefold())).strip()
+
+
+def _entity_fields(entity) -> tuple:
+    if isinstance(entity, dict):
+        gnd_id = entity.get("gndIdentifier") or entity["id"].rsplit("/", 1)[-1]
+        return (
+            gnd_id,
+            entity.get("preferredName", ""),
+            entity.get("variantName", []),
+            entity.get("type", []),
+        )
+    return entity.gnd_id, entity.pref_name, entity.alt_names, entity.ent_type
+
+
+class NameIndex:
+    """A sorted array of normalized names mapped to GND-IDs.
+
+    Every `preferredName` and `variantName` of an entity is indexed. Prefix
+    queries are two binary searches plus a scan of the matching range.
+
+    :param entities: LOBID-JSON documents, entities or records, see \
+    `pylobid.records`, to index
+    :type entities: Iterable
+    """
+
+    def __init__(self, entities: Iterable = ()) -> None:
+        """Class constructor."""
+        self.gnd_ids = []
+        self.labels = []
+        self.types = []
+        self.type_masks = array("Q")
+        self.keys = []
+        self.entries = array("I")
+        type_bits = {}
+        pairs = []
+        for entity in entities:
+            gnd_id, label, alt_names, types = _entity_fields(entity)
+            position = len(self.gnd_ids)
+            self.gnd_ids.append(gnd_id)
+            self.labels.append(label)
+            mask = 0
+            for item in types:
+                if item not in type_bits:
+                    if len(type_bits) == 64:
+                        raise ValueError("NameIndex supports up to 64 types")
+                    type_bits[item] = 1 << len(type_bits)
+                    self.types.append(item)
+                mask |= type_bits[item]
+            self.type_masks.append(mask)
+            keys = {normalize(x) for x in [label] + list(alt_names) if x}
+            pairs.extend((sys.intern(key), position) for key in keys if key)
+        pairs.sort()
+        self.keys = [key for key, _ in pairs]
+        self.entries = array("I", (position for _, position in pairs))
+
+    @classmethod
+    def from_dump(cls, path: str, types: Iterable = None) -> "NameIndex":
+        """Build an index over the entities of a JSON-lines dump.
+
+        :param path: The path of a `.jsonl` or `.jsonl.gz` file
+        :type path: str
+        :param types: LOBID types to index, e.g. ['PlaceOrGeographicName']
+        :type types: Iterable, optional
+
+        :return: The built index
+        :rtype: NameIndex
+        """
+        return cls(iter_records(path, types=types))
+
+    def _matches(self, prefix: str, types: Iterable, limit: int) -> list:
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        mask = 0
+        if types:
+            bits = {x: 1 << position for position, x in enumerate(self.types)}
+            mask = sum(bits.get(x, 0) for x in set(types))
+            if not mask:
+                return []
+        found = []
+        seen = set()
+        keys = self.keys
+        position = bisect_left(keys, prefix)
+        while position < len(keys) and keys[position].startswith(prefix):
+            entry = self.entries[position]
+            position += 1
+            if entry in seen or (mask and not self.type_masks[entry] & mask):
+                continue
+            seen.add(entry)
+            found.append(entry)
+            if len(found) == limit:
+                break
+        return found
+
+    def complete(self, prefix: str, types: Iterable = None, limit: int = 10) -> list:
+        """Return the GND-IDs of the entities with a name starting with `prefix`.
+
+        :param prefix: The typed text, normalized like the names
+        :type prefix: str
+        :param types: LOBID types to keep, e.g. ['Person']
+        :type types: Iterable, optional
+        :param limit: The maximum number of GND-IDs, `None` for all
+        :type limit: int, optional
+
+        :return: The GND-IDs, ordered by the matching normalized name
+        :rtype: list
+        """
+        return [self.gnd_ids[x] for x in self._matches(prefix, types, limit)]
+
+    def suggest(self, prefix: str, types: Iterable = None, limit: int = 10) -> list:
+        """Return GND-IDs and preferred names like `complete` for display.
+
+        :param prefix: The typed text, normalized like the names
+        :type prefix: str
+        :param types: LOBID types to keep, e.g. ['Person']
+        :type types: Iterable, optional
+        :param limit: The maximum number of suggestions, `None` for all
+        :type limit: int, optional
+
+        :return: Tuples of the GND-ID and the preferred name
+        :rtype: list
+        """
+        return [
+            (self.gnd_ids[x], self.labels[x])
+            for x in self._matches(prefix, types, limit)
+        ]
+
+    def save(self, path: str) -> None:
+        """Write the index to a file.
+
+        :param path: The path of the index file
+        :type path: str
+        """
+        blobs = [
+            SEPARATOR.join(self.keys).encode("utf-8"),
+            self.entries.tobytes(),
+            SEPARATOR.join(self.gnd_ids).encode("utf-8"),
+            SEPARATOR.join(self.labels).encode("utf-8"),
+            self.type_masks.tobytes(),
+        ]
+        header = {
+            "byteorder": sys.byteorder,
+            "types": self.types,
+            "names": len(self.keys),
+            "entities": len(self.gnd_ids),
+            "lengths": [len(x) for x in blobs],
+        }
+        with open(os.fspath(path), "wb") as index:
+            index.write(INDEX_MAGIC)
+            index.write(json.dumps(header).encode("utf-8") + b"\n")
+            for blob in blobs:
+                index.write(blob)
+
+    @classmethod
+    def load(cls, path: str) -> "NameIndex":
+        """Read an index written by `save`.
+
+        :param path: The path of the index file
+        :type path: str
+
+        :raises: ValueError if the file is not an index
+        :return: The loaded index
+        :rtype: NameIndex
+        """
+        with open(os.fspath(path), "rb") as index:
+            if index.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+                raise ValueError(f"{path} is not a name index")
+            header = json.loads(index.readline())
+            blobs = [index.read(length) for length in header["lengths"]]
+        self = cls()
+        self.types = header["types"]
+        self.keys = cls._split(blobs[0], header["names"])
+        self.entries = array("I")
+        self.entries.frombytes(blobs[1])
+        self.gnd_ids = cls._split(blobs[2], header["entities"])
+        self.labels = cls._split(blobs[3], header["entities"])
+        self.type_masks = array("Q")
+        self.type_masks.frombytes(blobs[4])
+        if header["byteorder"] != sys.byteorder:
+            self.entries.byteswap()
+            self.type_masks.byteswap()
+        return self
+
+    @staticmethod
+    def _split(blob: bytes, count: int) -> list:
+        return blob.decode("utf-8").split(SEPARATOR) if count else []
+
+    def __len__(self) -> int:
+        return len(self.gnd_ids)
+
+    def __repr__(self) -> str:
+        return f"<NameIndex {len(self)} entities, {len(self.keys)} names>"
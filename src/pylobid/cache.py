@@ -0,0 +1,362 @@
+"""Caches for LOBID entity JSON."""
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from . import jsonlib
+
+
+def _copy_json(value):
+    """Return a deep copy of decoded JSON data."""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+class EntityCache:
+    """A thread-safe LRU cache with a time-to-live, keyed by GND-ID.
+
+    Entries are copied on the way in and out, so callers may modify the
+    returned data (as `PyLobidPerson` does) without touching the cache.
+    Expired entries with an ETag or Last-Modified value are kept (until
+    evicted) so they can be revalidated with a conditional request.
+
+    :param maxsize: The maximum number of cached entities
+    :type maxsize: int, optional
+    :param ttl: Seconds an entry stays valid, `None` never expires entries
+    :type ttl: float, optional
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0) -> None:
+        """Class constructor."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, gnd_id: str) -> dict:
+        """Return the cached LOBID-JSON of a GND-ID.
+
+        :param gnd_id: A GND-ID, e.g. 118650130
+        :type gnd_id: str
+
+        :return: A copy of the cached data, `None` if missing or expired
+        :rtype: dict
+        """
+        with self._lock:
+            entry = self._data.get(gnd_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, data, etag, last_modified = entry
+            if expires is not None and expires < time.monotonic():
+                if etag is None and last_modified is None:
+                    del self._data[gnd_id]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(gnd_id)
+            self.hits += 1
+        return _copy_json(data)
+
+    def get_stale(self, gnd_id: str) -> tuple:
+        """Return an expired entry which can be revalidated.
+
+        :param gnd_id: A GND-ID, e.g. 118650130
+        :type gnd_id: str
+
+        :return: A tuple of the data, ETag and Last-Modified values, \
+        `None` if there is no entry with an ETag or Last-Modified value
+        :rtype: tuple
+        """
+        with self._lock:
+            entry = self._data.get(gnd_id)
+            if entry is None or (entry[2] is None and entry[3] is None):
+                return None
+            _, data, etag, last_modified = entry
+        return _copy_json(data), etag, last_modified
+
+    def set(
+        self, gnd_id: str, data: dict, etag: str = None, last_modified: str = None
+    ) -> None:
+        """Cache the LOBID-JSON of a GND-ID, evicting the least recently used.
+
+        :param gnd_id: A GND-ID, e.g. 118650130
+        :type gnd_id: str
+        :param data: The LOBID-JSON to cache
+        :type data: dict
+        :param etag: The ETag header of the response
+        :type etag: str, optional
+        :param last_modified: The Last-Modified header of the response
+        :type last_modified: str, optional
+        """
+        data = _copy_json(data)
+        with self._lock:
+            self._data[gnd_id] = (self._expires(), data, etag, last_modified)
+            self._data.move_to_end(gnd_id)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def touch(self, gnd_id: str) -> None:
+        """Mark an entry as fresh again, e.g. after a 304 Not Modified.
+
+        :param gnd_id: A GND-ID, e.g. 118650130
+        :type gnd_id: str
+        """
+        with self._lock:
+            entry = self._data.get(gnd_id)
+            if entry is not None:
+                self._data[gnd_id] = (self._expires(),) + entry[1:]
+                self._data.move_to_end(gnd_id)
+
+    def _expires(self) -> float:
+        return None if self.ttl is None else time.monotonic() + self.ttl
+
+    def invalidate(self, gnd_id: str) -> None:
+        """Remove a GND-ID from the cache.
+
+        :param gnd_id: A GND-ID, e.g. 118650130
+        :type gnd_id: str
+        """
+        with self._lock:
+            self._data.pop(gnd_id, None)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    @property
+    def stats(self) -> dict:
+        """Return hit/miss statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._data),
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"<EntityCache {len(self)}/{self.maxsize}>"
+
+
+class SQLiteEntityCache:
+    """A persistent entity cache stored in a local SQLite database.
+
+    Entities are stored zlib-compressed together with their ETag and
+    Last-Modified values. Expired entries are revalidated with a conditional
+    request, so an unchanged entity costs a 304 instead of its payload. The
+    database runs in WAL mode and may be shared by several processes.
+
+    :param path: The path of the database file
+    :type path: str
+    :param ttl: Seconds an entry stays fresh, `None` never expires entries
+    :type ttl: float, optional
+    :param compress_level: The zlib compression level, 0-9
+    :type compress_level: int, optional
+    :param timeout: Seconds to wait for a lock held by another process
+    :type timeout: float, optional
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 7 * 24 * 3600.0,
+        compress_level: int = 6,
+        timeout: float = 30.0,
+    ) -> None:
+        """Class constructor."""
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.compress_level = compress_level
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        with self.connection as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entities ("
+                "gnd_id TEXT PRIMARY KEY, data BLOB NOT NULL, etag TEXT, "
+                "last_modified TEXT, expires REAL) WITHOUT ROWID"
+            )
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Return the database connection of the current thread and process."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, gnd_id: str) -> dict:
+        """Return the cached LOBID-JSON of a GND-ID.
+
+        :param gnd_id: A GND-ID, e.g. 118650130
+        :type gnd_id: str
+
+        :return: The cached data, `None` if missing or expired
+        :rtype: dict
+        """
+        row = self.connection.execute(
+            "SELECT data, expires FROM entities WHERE gnd_id = ?", (gnd_id,)
+        ).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            if row[1] is not None and row[1] < time.time():
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self.hits += 1
+        return self._decode(row[0])
+
+    def get_stale(self, gnd_id: str) -> tuple:
+        """Return an expired entry which can be revalidated.
+
+        :param gnd_id: A GND-ID, e.g. 118650130
+        :type gnd_id: str
+
+        :return: A tuple of the data, ETag and Last-Modified values, \
+        `None` if there is no entry with an ETag or Last-Modified value
+        :rtype: tuple
+        """
+        row = self.connection.execute(
+            "SELECT data, etag, last_modified FROM entities WHERE gnd_id = ? "
+            "AND (etag IS NOT NULL OR last_modified IS NOT NULL)",
+            (gnd_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return self._decode(row[0]), row[1], row[2]
+
+    def set(
+        self, gnd_id: str, data: dict, etag: str = None, last_modified: str = None
+    ) -> None:
+        """Store the LOBID-JSON of a GND-ID.
+
+        :param gnd_id: A GND-ID, e.g. 118650130
+        :type gnd_id: str
+        :param data: The LOBID-JSON to cache
+        :type data: dict
+        :param etag: The ETag header of the response
+        :type etag: str, optional
+        :param last_modified: The Last-Modified header of the response
+        :type last_modified: str, optional
+        """
+        payload = zlib.compress(
+            json.dumps(data, separators=(",", ":")).encode("utf-8"),
+            self.compress_level,
+        )
+        with self.connection as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?, ?)",
+                (gnd_id, payload, etag, last_modified, self._expires()),
+            )
+
+    def touch(self, gnd_id: str) -> None:
+        """Mark an entry as fresh again, e.g. after a 304 Not Modified.
+
+        :param gnd_id: A GND-ID, e.g. 118650130
+        :type gnd_id: str
+        """
+        with self.connection as connection:
+            connection.execute(
+                "UPDATE entities SET expires = ? WHERE gnd_id = ?",
+                (self._expires(), gnd_id),
+            )
+
+    def invalidate(self, gnd_id: str) -> None:
+        """Remove a GND-ID from the cache.
+
+        :param gnd_id: A GND-ID, e.g. 118650130
+        :type gnd_id: str
+        """
+        with self.connection as connection:
+            connection.execute("DELETE FROM entities WHERE gnd_id = ?", (gnd_id,))
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self.connection as connection:
+            connection.execute("DELETE FROM entities")
+        with self._lock:
+            self.hits = self.misses = self.expirations = 0
+
+    def close(self) -> None:
+        """Close the database connection of the current thread."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    @property
+    def stats(self) -> dict:
+        """Return hit/miss statistics of this process."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "expirations": self.expirations,
+                "size": len(self),
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _expires(self) -> float:
+        return None if self.ttl is None else time.time() + self.ttl
+
+    def _decode(self, payload: bytes) -> dict:
+        return jsonlib.loads(zlib.decompress(payload))
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM entities").fetchone()[0]
+
+    def __repr__(self) -> str:
+        return f"<SQLiteEntityCache {self.path}>"
+
+
+_default_cache = EntityCache()
+
+
+def get_default_cache() -> EntityCache:
+    """Return the process-wide entity cache.
+
+    :return: The shared cache, `None` if caching is disabled
+    :rtype: EntityCache
+    """
+    return _default_cache
+
+
+def set_default_cache(cache: EntityCache) -> None:
+    """Replace the process-wide cache used by clients created afterwards.
+
+    :param cache: The new shared cache, `None` disables caching
+    :type cache: EntityCache
+    """
+    global _default_cache
+    _default_cache = cache
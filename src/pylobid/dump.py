@@ -0,0 +1,269 @@
+"""Readers for LOBID-GND JSON-lines dumps."""
+import argparse
+import contextlib
+import gzip
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+from typing import BinaryIO, Iterable, Iterator
+
+from . import jsonlib
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def open_dump(path: str) -> BinaryIO:
+    """Open a (gzipped) JSON-lines dump for binary reading.
+
+    :param path: The path of a `.jsonl` or `.jsonl.gz` file
+    :type path: str
+
+    :return: A binary file object, decompressing gzipped dumps on the fly
+    :rtype: BinaryIO
+    """
+    with open(path, "rb") as dump:
+        magic = dump.read(2)
+    if magic == GZIP_MAGIC:
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def iter_records(path: str, types: Iterable = None) -> Iterator:
+    """Stream the LOBID-JSON documents of a dump at constant memory.
+
+    Lines which do not mention any of the requested types are skipped
+    before they are decoded. Lines without an `id`, e.g. the action lines
+    of Elasticsearch bulk files, are skipped as well.
+
+    :param path: The path of a `.jsonl` or `.jsonl.gz` file
+    :type path: str
+    :param types: LOBID types to keep, e.g. ['Person', 'PlaceOrGeographicName']
+    :type types: Iterable, optional
+
+    :return: The matching LOBID-JSON documents in file order
+    :rtype: Iterator
+    """
+    types = set(types) if types else None
+    needles = [f'"{x}"'.encode("utf-8") for x in types] if types else None
+    with open_dump(os.fspath(path)) as dump:
+        for line in dump:
+            if needles is not None and not any(x in line for x in needles):
+                continue
+            line = line.strip()
+            if not line:
+                continue
+            data = jsonlib.loads(line)
+            if "id" not in data:
+                continue
+            if types is not None and types.isdisjoint(data.get("type", [])):
+                continue
+            yield data
+
+
+INDEX_MAGIC = b"PYLOBIX1"
+INDEX_RECORD = struct.Struct("<16sQI")
+INDEX_CHUNK_SIZE = 1 << 20
+
+
+def _record_id(data: dict) -> str:
+    gnd_id = data.get("gndIdentifier")
+    if gnd_id is None:
+        gnd_id = data["id"].rstrip("/").rsplit("/", 1)[-1]
+    return gnd_id
+
+
+def _sorted_records(chunk: bytearray) -> list:
+    width = INDEX_RECORD.size
+    data = bytes(chunk)
+    return sorted(data[start:start + width] for start in range(0, len(data), width))
+
+
+def _iter_run(run: BinaryIO) -> Iterator:
+    width = INDEX_RECORD.size
+    run.seek(0)
+    while True:
+        block = run.read(width * 4096)
+        if not block:
+            return
+        for start in range(0, len(block), width):
+            yield block[start:start + width]
+
+
+def build_index(
+    dump_path: str, index_path: str = None, chunk_size: int = INDEX_CHUNK_SIZE
+) -> str:
+    """Build a sorted offset index over an uncompressed JSON-lines dump.
+
+    The index maps every GND-ID to the byte offset and length of its line.
+    It consists of the `INDEX_MAGIC` header followed by fixed-width records
+    sorted by GND-ID, so `DumpSource` can binary search it in place.
+
+    The packed records are collected in chunks of `chunk_size` records;
+    every full chunk is sorted and spilled to a temporary file, and the
+    sorted runs are merged into the index, so memory stays bounded by one
+    chunk whatever the size of the dump.
+
+    :param dump_path: The path of a `.jsonl` file
+    :type dump_path: str
+    :param index_path: The path of the index, defaults to `<dump_path>.idx`
+    :type index_path: str, optional
+    :param chunk_size: The number of index records sorted in memory at once
+    :type chunk_size: int, optional
+
+    :raises: ValueError if the dump is gzipped or a GND-ID is too long
+    :return: The path of the written index
+    :rtype: str
+    """
+    dump_path = os.fspath(dump_path)
+    index_path = f"{dump_path}.idx" if index_path is None else os.fspath(index_path)
+    chunk_bytes = max(chunk_size, 1) * INDEX_RECORD.size
+    chunk = bytearray()
+    runs = []
+    with contextlib.ExitStack() as stack:
+        dump = stack.enter_context(open(dump_path, "rb"))
+        if dump.read(2) == GZIP_MAGIC:
+            raise ValueError(f"Decompress {dump_path} before indexing it")
+        dump.seek(0)
+        offset = 0
+        for line in dump:
+            start = offset
+            offset += len(line)
+            line = line.rstrip()
+            if not line:
+                continue
+            data = jsonlib.loads(line)
+            if "id" not in data:
+                continue
+            key = _record_id(data).encode("utf-8")
+            if len(key) > 16:
+                raise ValueError(f"GND-ID {key!r} exceeds 16 bytes")
+            chunk += INDEX_RECORD.pack(key, start, len(line))
+            if len(chunk) >= chunk_bytes:
+                run = stack.enter_context(tempfile.TemporaryFile())
+                run.writelines(_sorted_records(chunk))
+                runs.append(run)
+                chunk = bytearray()
+        records = _sorted_records(chunk)
+        del chunk
+        with open(index_path, "wb") as index:
+            index.write(INDEX_MAGIC)
+            if runs:
+                index.writelines(heapq.merge(records, *map(_iter_run, runs)))
+            else:
+                index.write(b"".join(records))
+    return index_path
+
+
+class DumpSource:
+    """Serve LOBID-JSON documents from a memory-mapped dump and its index.
+
+    Neither the dump nor the index is read into memory; a lookup is a binary
+    search over the mapped index and the decoding of a single line. Pass an
+    instance as `source` to `PyLobidClient` to use it instead of the
+    LOBID-API, either exclusively (`offline=True`) or as a first tier.
+
+    :param dump_path: The path of an uncompressed `.jsonl` file
+    :type dump_path: str
+    :param index_path: The path of the index, defaults to `<dump_path>.idx` \
+    which is built if it does not exist yet
+    :type index_path: str, optional
+    """
+
+    def __init__(self, dump_path: str, index_path: str = None) -> None:
+        """Class constructor."""
+        self.dump_path = os.fspath(dump_path)
+        if index_path is None:
+            index_path = f"{self.dump_path}.idx"
+        self.index_path = os.fspath(index_path)
+        if not os.path.exists(self.index_path):
+            build_index(self.dump_path, self.index_path)
+        self._dump = self._map(self.dump_path)
+        self._index = self._map(self.index_path)
+        if self._index is not None and self._index[:8] != INDEX_MAGIC:
+            self.close()
+            raise ValueError(f"{self.index_path} is not a dump index")
+        size = 0 if self._index is None else len(self._index) - len(INDEX_MAGIC)
+        self._size = size // INDEX_RECORD.size
+
+    @staticmethod
+    def _map(path: str) -> mmap.mmap:
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return None
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _find(self, gnd_id: str) -> tuple:
+        key = gnd_id.encode("utf-8").ljust(16, b"\x00")
+        index = self._index
+        start = len(INDEX_MAGIC)
+        width = INDEX_RECORD.size
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high) // 2
+            position = start + middle * width
+            if index[position:position + 16] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self._size:
+            return None
+        found, offset, length = INDEX_RECORD.unpack_from(index, start + low * width)
+        if found != key:
+            return None
+        return offset, length
+
+    def get(self, gnd_id: str) -> dict:
+        """Return the LOBID-JSON of a GND-ID.
+
+        :param gnd_id: A GND-ID, e.g. 118650130
+        :type gnd_id: str
+
+        :return: A freshly decoded document, `None` if not in the dump
+        :rtype: dict
+        """
+        location = self._find(gnd_id) if self._size else None
+        if location is None:
+            return None
+        offset, length = location
+        return jsonlib.loads(self._dump[offset:offset + length])
+
+    def close(self) -> None:
+        """Unmap the dump and the index."""
+        for mapped in (self._dump, self._index):
+            if mapped is not None:
+                mapped.close()
+        self._dump = self._index = None
+        self._size = 0
+
+    def __contains__(self, gnd_id: str) -> bool:
+        return bool(self._size) and self._find(gnd_id) is not None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __enter__(self) -> "DumpSource":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<DumpSource {self.dump_path}>"
+
+
+def main(argv: list = None) -> None:
+    """Build the offset index of a dump from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m pylobid.dump",
+        description="Build the offset index of a LOBID-GND JSON-lines dump.",
+    )
+    parser.add_argument("dump", help="path of the uncompressed .jsonl dump")
+    parser.add_argument("-o", "--output", help="path of the index file")
+    args = parser.parse_args(argv)
+    print(build_index(args.dump, args.output))
+
+
+if __name__ == "__main__":
+    main()
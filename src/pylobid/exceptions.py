@@ -0,0 +1,13 @@
+"""Exceptions raised by the pylobid package."""
+
+
+class GNDIdError(ValueError):
+    """Exception raised if the GND-ID is invalid."""
+
+
+class GNDNotFoundError(Exception):
+    """Exception raised if the API returns Not Found for a GND-ID."""
+
+
+class GNDAPIError(Exception):
+    """Broad exception if something unexpected happens."""
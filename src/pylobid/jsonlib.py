@@ -0,0 +1,81 @@
+"""The JSON decoder used for API responses, dumps and cached entities.
+
+The fastest installed backend is selected on import: `orjson`, then
+`simdjson` (pysimdjson), then the standard library `json`. All of them
+decode the raw bytes of a response or dump line, without decoding them to
+a `str` first. Call `loads` through the module, e.g. `jsonlib.loads(data)`,
+so `set_backend` takes effect everywhere. orjson is installed with
+`pip install pylobid[fast]`.
+
+    from pylobid import jsonlib
+    jsonlib.set_backend("json")
+"""
+import json
+from typing import Callable
+
+
+def _orjson() -> Callable:
+    import orjson
+
+    return orjson.loads
+
+
+def _simdjson() -> Callable:
+    import simdjson
+
+    return simdjson.loads
+
+
+def _json() -> Callable:
+    return json.loads
+
+
+BACKENDS = {"orjson": _orjson, "simdjson": _simdjson, "json": _json}
+
+backend = "json"
+loads = json.loads
+
+
+def available_backends() -> list:
+    """Return the names of the installed backends, fastest first.
+
+    :return: The backend names, e.g. ['orjson', 'json']
+    :rtype: list
+    """
+    names = []
+    for name, load in BACKENDS.items():
+        try:
+            load()
+        except ModuleNotFoundError:
+            continue
+        names.append(name)
+    return names
+
+
+def set_backend(name: str = None) -> str:
+    """Select the JSON decoder.
+
+    :param name: 'orjson', 'simdjson' or 'json', defaults to the fastest \
+    installed backend
+    :type name: str, optional
+
+    :raises: ValueError if the backend is unknown, ModuleNotFoundError if \
+    it is not installed
+    :return: The name of the selected backend
+    :rtype: str
+    """
+    global backend, loads
+    if name is not None and name not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend {name!r}, use one of {list(BACKENDS)}")
+    for item in [name] if name else BACKENDS:
+        try:
+            decoder = BACKENDS[item]()
+        except ModuleNotFoundError:
+            if name:
+                raise
+            continue
+        backend, loads = item, decoder
+        return item
+
+
+set_backend()
@@ -0,0 +1,261 @@
+"""Instrumentation hooks for pylobid clients.
+
+Clients emit a 'request' event for every `get_entity_json` call and
+'process' and 'factory' events for `process_data` and `factory`, but only
+while a callback is subscribed; otherwise the cost is a single truthiness
+check. Events are dicts with the keys `event`, `entity_type`, `outcome` and
+`duration` (seconds), plus `gnd_id`, `status` and `bytes` for requests.
+Request outcomes are 'source', 'cache_hit', 'not_modified', 'fetched',
+'coalesced' (shared the request of a concurrent call), 'not_found' and
+'error', the other events report 'ok' or 'error'.
+
+    registry = MetricsRegistry().install()
+    PyLobidClient("118650130")
+    registry.counter("request", outcome="fetched")
+"""
+import functools
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Callable
+
+ENTITY_TYPES = ("Person", "CorporateBody", "Work", "PlaceOrGeographicName")
+
+subscribers = []
+_local = threading.local()
+
+
+def subscribe(callback: Callable) -> Callable:
+    """Call `callback(event)` for every emitted event.
+
+    :param callback: A callable taking the event dict
+    :type callback: Callable
+
+    :return: The callback, so this can be used as a decorator
+    :rtype: Callable
+    """
+    subscribers.append(callback)
+    return callback
+
+
+def unsubscribe(callback: Callable) -> None:
+    """Stop calling a subscribed callback.
+
+    :param callback: A subscribed callable
+    :type callback: Callable
+    """
+    if callback in subscribers:
+        subscribers.remove(callback)
+
+
+def emit(event: str, **fields) -> None:
+    """Pass an event to all subscribed callbacks.
+
+    :param event: The event name, e.g. 'request'
+    :type event: str
+    """
+    fields["event"] = event
+    for callback in list(subscribers):
+        callback(fields)
+
+
+def entity_type(data: dict) -> str:
+    """Return the label of the entity type of LOBID-JSON.
+
+    :param data: LOBID-JSON, may be `None`
+    :type data: dict
+
+    :return: The type `factory()` dispatches on, e.g. 'Person', the first \
+    listed type for other entities or 'unknown'
+    :rtype: str
+    """
+    types = (data or {}).get("type") or ["unknown"]
+    for item in ENTITY_TYPES:
+        if item in types:
+            return item
+    return types[0]
+
+
+def instrument(event: str) -> Callable:
+    """Emit an event with the duration of each call of a client method.
+
+    Nested calls of the same event, e.g. `super().process_data()`, are only
+    reported once, by the outermost call.
+
+    :param event: The event name, e.g. 'process'
+    :type event: str
+
+    :return: A decorator for client methods
+    :rtype: Callable
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not subscribers:
+                return method(self, *args, **kwargs)
+            active = getattr(_local, "active", None)
+            if active is not None and event in active:
+                return method(self, *args, **kwargs)
+            if active is None:
+                active = _local.active = set()
+            active.add(event)
+            start = time.perf_counter()
+            outcome = "ok"
+            try:
+                result = method(self, *args, **kwargs)
+            except Exception:
+                outcome = "error"
+                raise
+            finally:
+                active.discard(event)
+                emit(
+                    event,
+                    entity_type=entity_type(self.__dict__.get("_ent_dict")),
+                    outcome=outcome,
+                    duration=time.perf_counter() - start,
+                )
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+class MetricsRegistry:
+    """Aggregate events into counters and latency histograms.
+
+    Counters are labelled by event, entity type and outcome, histograms by
+    event and entity type. Subscribe an instance with `install()`.
+
+    :param buckets: Upper bounds in seconds of the histogram buckets
+    :type buckets: tuple, optional
+    """
+
+    BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, buckets: tuple = BUCKETS) -> None:
+        """Class constructor."""
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.clear()
+
+    def __call__(self, event: dict) -> None:
+        """Record an event."""
+        labels = (event["event"], event["entity_type"])
+        duration = event["duration"]
+        with self._lock:
+            self.counters[labels + (event["outcome"],)] += 1
+            self.bytes[labels] += event.get("bytes") or 0
+            histogram = self.histograms.get(labels)
+            if histogram is None:
+                histogram = self.histograms[labels] = {
+                    "buckets": [0] * (len(self.buckets) + 1),
+                    "count": 0,
+                    "sum": 0.0,
+                }
+            histogram["buckets"][bisect_left(self.buckets, duration)] += 1
+            histogram["count"] += 1
+            histogram["sum"] += duration
+
+    def counter(
+        self, event: str, entity_type: str = None, outcome: str = None
+    ) -> int:
+        """Return the number of matching events.
+
+        :param event: The event name, e.g. 'request'
+        :type event: str
+        :param entity_type: Only count this entity type, e.g. 'Person'
+        :type entity_type: str, optional
+        :param outcome: Only count this outcome, e.g. 'not_found'
+        :type outcome: str, optional
+
+        :return: The number of matching events
+        :rtype: int
+        """
+        total = 0
+        with self._lock:
+            for (name, type_, result), count in self.counters.items():
+                if name != event or entity_type not in (None, type_):
+                    continue
+                if outcome in (None, result):
+                    total += count
+        return total
+
+    def histogram(self, event: str, entity_type: str = None) -> dict:
+        """Return the cumulative latency histogram of an event.
+
+        :param event: The event name, e.g. 'request'
+        :type event: str
+        :param entity_type: Only include this entity type, e.g. 'Person'
+        :type entity_type: str, optional
+
+        :return: A dict with the cumulative counts per bucket bound \
+        (`inf` last), the number of events and their total duration
+        :rtype: dict
+        """
+        counts = [0] * (len(self.buckets) + 1)
+        total = 0
+        duration = 0.0
+        with self._lock:
+            for (name, type_), histogram in self.histograms.items():
+                if name != event or entity_type not in (None, type_):
+                    continue
+                counts = [x + y for x, y in zip(counts, histogram["buckets"])]
+                total += histogram["count"]
+                duration += histogram["sum"]
+        cumulative = {}
+        running = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            running += count
+            cumulative[bound] = running
+        return {"buckets": cumulative, "count": total, "sum": duration}
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Return the share of requests answered by the entity cache."""
+        requests = self.counter("request")
+        if not requests:
+            return 0.0
+        return self.counter("request", outcome="cache_hit") / requests
+
+    def snapshot(self) -> dict:
+        """Return all counters, histograms and byte totals."""
+        histograms = {}
+        for event, type_ in list(self.histograms):
+            histograms[f"{event}:{type_}"] = self.histogram(event, type_)
+        with self._lock:
+            counters = {":".join(key): count for key, count in self.counters.items()}
+            transferred = {":".join(key): count for key, count in self.bytes.items()}
+        return {
+            "counters": counters,
+            "histograms": histograms,
+            "bytes": transferred,
+            "cache_hit_ratio": self.cache_hit_ratio,
+        }
+
+    def clear(self) -> None:
+        """Reset all metrics."""
+        with self._lock:
+            self.counters = defaultdict(int)
+            self.bytes = defaultdict(int)
+            self.histograms = {}
+
+    def install(self) -> "MetricsRegistry":
+        """Subscribe this registry to all events."""
+        subscribe(self)
+        return self
+
+    def uninstall(self) -> None:
+        """Unsubscribe this registry."""
+        unsubscribe(self)
+
+    def __enter__(self) -> "MetricsRegistry":
+        return self.install()
+
+    def __exit__(self, *args) -> None:
+        self.uninstall()
+
+    def __repr__(self) -> str:
+        return f"<MetricsRegistry {sum(self.counters.values())} events>"
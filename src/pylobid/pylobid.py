@@ -1,26 +1,41 @@
 import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Iterable, Iterator
 
 import requests
-from jsonpath_ng import parse
 
-from .utils import extract_coords
+from . import jsonlib, metrics, records
+from .cache import EntityCache, _copy_json, get_default_cache
+from .dump import iter_records
+from .exceptions import GNDAPIError, GNDIdError, GNDNotFoundError
+from .singleflight import SingleFlight
+from .sources import EntitySource
+from .transport import PyLobidTransport, get_default_transport
+from .utils import (
+    compile_path,
+    extract_coords,
+    extract_point,
+    find_key,
+    points_array,
+    project,
+)
 
+# concurrent fetches of the same entity share one request
+_in_flight = SingleFlight()
 
-class GNDIdError(ValueError):
-    """Exception raised if the GND-ID is invalid."""
 
-
-class GNDNotFoundError(Exception):
-    """Exception raised if the API returns Not Found for a GND-ID."""
-
-
-class GNDAPIError(Exception):
-    """Broad exception if something unexpected happens."""
+def _copy_result(result: tuple) -> tuple:
+    return (_copy_json(result[0]),) + result[1:]
 
 
 class PyLobidClient:
     """Main Class to interact with LOBID-API."""
 
+    @metrics.instrument("factory")
     def factory(self):
         """Return a matching instance for the GND URL or ID.
 
@@ -38,21 +53,63 @@ class PyLobidClient:
         if not self.ent_type:
             raise ValueError(f"Unknown type for {self.gnd_url}")
         if self.is_person:
-            output = PyLobidPerson(gnd_id=None, fetch_related=self.fetch_related)
+            output = PyLobidPerson(
+                gnd_id=None, fetch_related=self.fetch_related, **self.client_options
+            )
             output.process_data(data=self.ent_dict)
         elif self.is_org:
-            output = PyLobidOrg(gnd_id=None)
+            output = PyLobidOrg(gnd_id=None, **self.client_options)
             output.process_data(data=self.ent_dict)
         elif self.is_work:
-            output = PyLobidWork(gnd_id=None)
+            output = PyLobidWork(gnd_id=None, **self.client_options)
             output.process_data(data=self.ent_dict)
         elif self.is_place:
-            output = PyLobidPlace(gnd_id=None)
+            output = PyLobidPlace(gnd_id=None, **self.client_options)
             output.process_data(data=self.ent_dict)
         else:
             return self
         return output
 
+    def to_record(self) -> records.EntityRecord:
+        """Return a compact record of the entity which drops the LOBID-JSON.
+
+        The record offers the same properties as the instance `factory()`
+        returns, see `pylobid.records`.
+
+        :return: An matching record for the entity
+        :rtype: `PlaceRecord`, `OrgRecord`, `PersonRecord`, `WorkRecord`
+        """
+        if self.ent_dict == {}:
+            raise ValueError(f"No data found for {self.gnd_url}")
+        return records.from_json(self.ent_dict)
+
+    @property
+    def client_options(self) -> dict:
+        """Return the options to pass on to derived clients."""
+        return {
+            "transport": self.transport,
+            "cache": self.cache,
+            "use_cache": self.use_cache,
+            "source": self.source,
+            "offline": self.offline,
+            "fields": self.fields,
+        }
+
+    @property
+    def coords_xpath(self):
+        """Return the compiled `$..hasGeometry` JSONPath."""
+        return compile_path("$..hasGeometry")
+
+    @property
+    def pref_alt_names_xpath(self):
+        """Return the compiled `$.variantName` JSONPath."""
+        return compile_path("$.variantName")
+
+    @property
+    def pref_name_xpath(self):
+        """Return the compiled `$.preferredName` JSONPath."""
+        return compile_path("$.preferredName")
+
     @property
     def gnd_id(self) -> str:
         """Return the GND ID, e.g. 118650130."""
@@ -130,25 +187,371 @@ class PyLobidClient:
         self.__gnd_id = self.extract_id(url)
         return self.gnd_url
 
-    def get_entity_json(self, url: str = None) -> dict:
+    def get_entity_json(self, url: str = None, use_cache: bool = None) -> dict:
         """Get the LOBID-JSON response of a given GND-URL.
 
         :param url: A GND_URL
         :type url: str, optional
+        :param use_cache: look up and store the entity in the cache, \
+        defaults to the `use_cache` value of the client
+        :type use_cache: bool, optional
 
-        :raises: GNDNotFoundError, GNDAPIError
-        :return: The matching JSON representation fetched from LOBID
+        :raises: GNDIdError, GNDNotFoundError, GNDAPIError
+        :return: The matching JSON representation fetched from LOBID, \
+        trimmed to `fields` after decoding if set
         :rtype: dict
         """
+        if metrics.subscribers:
+            data = self._emit_request(url, use_cache)
+        else:
+            data = self._get_entity_json(url, use_cache)[0]
+        return data if self.fields is None else project(data, self.fields)
+
+    def _emit_request(self, url: str, use_cache: bool) -> dict:
+        start = time.perf_counter()
+        data, outcome, response = None, "error", None
+        try:
+            data, outcome, response = self._get_entity_json(url, use_cache)
+        except GNDNotFoundError:
+            outcome = "not_found"
+            raise
+        finally:
+            metrics.emit(
+                "request",
+                gnd_id=self.gnd_id,
+                entity_type=metrics.entity_type(data),
+                outcome=outcome,
+                duration=time.perf_counter() - start,
+                status=None if response is None else response.status_code,
+                bytes=0 if response is None else len(response.content),
+            )
+        return data
+
+    def _get_entity_json(self, url: str, use_cache: bool) -> tuple:
+        # returns the data, the outcome reported to `metrics` and the response
         url = self.gnd_url if url is None else self.get_entity_lobid_url(url)
-        response = requests.get(url, headers={"Accept": "application/json"})
+        if not is_valid_gnd_id(self.gnd_id):
+            raise GNDIdError(f'"{self.gnd_id}" is not a valid GND-ID')
+        if self.source is not None:
+            data = self.source.get(self.gnd_id)
+            if data is not None:
+                return data, "source", None
+        if self.offline:
+            raise GNDNotFoundError(
+                f'Could not find a GND Entity for ID "{self.gnd_id}"'
+            )
+        use_cache = self.use_cache if use_cache is None else use_cache
+        cache = self.cache if use_cache else None
+        if cache is not None:
+            data = cache.get(self.gnd_id)
+            if data is not None:
+                return data, "cache_hit", None
+        result, shared = _in_flight.do(
+            url, lambda: self._fetch_entity_json(url, cache), copy=_copy_result
+        )
+        return (result[0], "coalesced", None) if shared else result
+
+    def _fetch_entity_json(self, url: str, cache: EntityCache) -> tuple:
+        headers = {"Accept": "application/json"}
+        stale = None if cache is None else cache.get_stale(self.gnd_id)
+        if stale is not None:
+            data, etag, last_modified = stale
+            if etag is not None:
+                headers["If-None-Match"] = etag
+            if last_modified is not None:
+                headers["If-Modified-Since"] = last_modified
+        response = self.transport.get(url, headers=headers)
+        if response.status_code == 304 and stale is not None:
+            cache.touch(self.gnd_id)
+            return data, "not_modified", response
         if response.status_code == 404:
             raise GNDNotFoundError(
                 f'Could not find a GND Entity for ID "{self.gnd_id}"'
             )
         if not response.ok:
             raise GNDAPIError(f"GND API error code: {response.status_code}")
-        return response.json()
+        data = jsonlib.loads(response.content)
+        if cache is not None:
+            cache.set(
+                self.gnd_id,
+                data,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return data, "fetched", response
+
+    def get_search_json(
+        self, query: str, size: int = 10, start: int = 0, filter: str = None
+    ) -> dict:
+        """Get the LOBID-JSON response of a search query.
+
+        :param query: A LOBID search query, e.g. 'gndIdentifier:118650130'
+        :type query: str
+        :param size: The maximum number of results
+        :type size: int, optional
+        :param start: The offset of the first result
+        :type start: int, optional
+        :param filter: A LOBID filter query, e.g. 'type:Person'
+        :type filter: str, optional
+
+        :raises: GNDAPIError
+        :return: The search response with the matching entities in 'member'
+        :rtype: dict
+        """
+        params = {"q": query, "format": "json", "size": size, "from": start}
+        if filter is not None:
+            params["filter"] = filter
+        response = self.transport.get(
+            f"{self.BASE_URL}/search",
+            params=params,
+            headers={"Accept": "application/json"},
+        )
+        if not response.ok:
+            raise GNDAPIError(f"GND API error code: {response.status_code}")
+        return jsonlib.loads(response.content)
+
+    def get_entities_json(
+        self,
+        gnd_ids: list,
+        chunk_size: int = 100,
+        max_workers: int = 1,
+        use_cache: bool = None,
+    ) -> dict:
+        """Get the LOBID-JSON of many GND-IDs with one search request per chunk.
+
+        :param gnd_ids: GND-IDs as returned by `extract_id`
+        :type gnd_ids: list
+        :param chunk_size: The number of IDs looked up per request
+        :type chunk_size: int, optional
+        :param max_workers: The number of chunks requested in parallel
+        :type max_workers: int, optional
+        :param use_cache: look up and store the entities in the cache, \
+        defaults to the `use_cache` value of the client
+        :type use_cache: bool, optional
+
+        :raises: GNDAPIError
+        :return: A dict mapping the found GND-IDs to their LOBID-JSON, \
+        invalid GND-IDs (see `is_valid_gnd_id`) are never requested, \
+        trimmed to `fields` after decoding if set
+        :rtype: dict
+        """
+        use_cache = self.use_cache if use_cache is None else use_cache
+        cache = self.cache if use_cache else None
+        found = {}
+        missing = []
+        for gnd_id in dict.fromkeys(gnd_ids):
+            if not is_valid_gnd_id(gnd_id):
+                continue
+            data = None if self.source is None else self.source.get(gnd_id)
+            if data is None and cache is not None:
+                data = cache.get(gnd_id)
+            if data is None:
+                missing.append(gnd_id)
+            else:
+                found[gnd_id] = data
+        if self.offline:
+            return found
+        chunks = [
+            missing[start:start + chunk_size]
+            for start in range(0, len(missing), chunk_size)
+        ]
+
+        def search(chunk):
+            query = " OR ".join(f'"{gnd_id}"' for gnd_id in chunk)
+            return self.get_search_json(f"gndIdentifier:({query})", size=len(chunk))
+
+        if max_workers > 1 and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(search, chunks))
+        else:
+            results = map(search, chunks)
+        for result in results:
+            for data in result.get("member", []):
+                gnd_id = self.extract_id(data["id"])
+                found[gnd_id] = data
+                if cache is not None:
+                    cache.set(gnd_id, data)
+        if self.fields is not None:
+            found = {key: project(data, self.fields) for key, data in found.items()}
+        return found
+
+    @classmethod
+    def fetch_many(
+        cls,
+        ids: list,
+        chunk_size: int = 100,
+        fetch_related: bool = False,
+        transport: PyLobidTransport = None,
+        max_workers: int = 4,
+        source: EntitySource = None,
+        offline: bool = False,
+        fields: Iterable = None,
+    ) -> tuple:
+        """Fetch many entities with one search request per chunk of IDs.
+
+        The IDs are normalized with `extract_id` and looked up with queries
+        like `gndIdentifier:("118650130" OR "4066009-6")`. Every result is
+        dispatched like `factory()` does. With `fetch_related` the places of
+        birth and death of all persons are fetched afterwards with
+        `fetch_related_places`, so every distinct place is fetched once.
+
+        :param ids: GND_URIs/URLs or GND-IDs
+        :type ids: list
+        :param chunk_size: The number of IDs looked up per request
+        :type chunk_size: int, optional
+        :param fetch_related: fetch related place entities of persons
+        :type fetch_related: bool, optional
+        :param transport: HTTP transport to use, defaults to the shared one
+        :type transport: PyLobidTransport, optional
+        :param max_workers: The number of chunks requested in parallel
+        :type max_workers: int, optional
+        :param source: source consulted before the LOBID-API
+        :type source: EntitySource, optional
+        :param offline: only look up entities in `source`
+        :type offline: bool, optional
+        :param fields: top-level keys of the LOBID-JSON to keep after \
+        decoding, see `PyLobidClient`, also applied to the related places
+        :type fields: Iterable, optional
+
+        :return: A dict mapping the found GND-IDs to their typed entities \
+        (in input order) and a list of the IDs which are invalid, not found \
+        or of a document without a type, which is kept as an untyped \
+        `PyLobidClient` in the dict
+        :rtype: tuple
+        """
+        client = cls(
+            transport=transport, source=source, offline=offline, fields=fields
+        )
+        gnd_ids = []
+        not_found = []
+        for item in ids:
+            try:
+                gnd_ids.append(client.extract_id(item))
+            except (GNDIdError, TypeError):
+                not_found.append(item)
+        gnd_ids = list(dict.fromkeys(gnd_ids))
+        found = client.get_entities_json(
+            gnd_ids, chunk_size=chunk_size, max_workers=max_workers
+        )
+        entities = {}
+        for gnd_id in gnd_ids:
+            if gnd_id not in found:
+                not_found.append(gnd_id)
+                continue
+            entity = PyLobidClient(**client.client_options)
+            entity.process_data(data=found[gnd_id])
+            try:
+                entities[gnd_id] = entity.factory()
+            except ValueError:
+                entities[gnd_id] = entity
+                not_found.append(gnd_id)
+        if fetch_related:
+            fetch_related_places(
+                entities.values(), chunk_size=chunk_size, max_workers=max_workers
+            )
+        return entities, not_found
+
+    @classmethod
+    def search(
+        cls,
+        q: str,
+        filter: str = None,
+        types: Iterable = None,
+        page_size: int = 100,
+        limit: int = None,
+        stream: bool = True,
+        transport: PyLobidTransport = None,
+        fields: Iterable = None,
+    ) -> Iterator:
+        """Search LOBID-GND and iterate over the matching typed entities.
+
+        Results are read incrementally from the `format=jsonl` output of the
+        API, so large result sets are never held in memory. If the API does
+        not answer the JSON lines request (or `stream` is False) the results
+        are paged with `from`/`size` instead. Every result is dispatched like
+        `factory()` does.
+
+        :param q: A LOBID search query, e.g. 'Wien' or 'preferredName:Wien'
+        :type q: str
+        :param filter: A LOBID filter query, e.g. 'dateOfBirth:1756'
+        :type filter: str, optional
+        :param types: LOBID types to keep, e.g. ['Person', 'PlaceOrGeographicName']
+        :type types: Iterable, optional
+        :param page_size: The number of results per page when paging
+        :type page_size: int, optional
+        :param limit: The maximum number of entities to return
+        :type limit: int, optional
+        :param stream: read the `format=jsonl` output, page otherwise
+        :type stream: bool, optional
+        :param transport: HTTP transport to use, defaults to the shared one
+        :type transport: PyLobidTransport, optional
+        :param fields: top-level keys of the LOBID-JSON to keep after \
+        decoding, see `PyLobidClient`
+        :type fields: Iterable, optional
+
+        :raises: GNDAPIError
+        :return: The matching entities in the order of the API
+        :rtype: Iterator
+        """
+        client = cls(transport=transport, fields=fields)
+        filters = [] if filter is None else [f"({filter})"]
+        if types:
+            filters.append(f"type:({' OR '.join(types)})")
+        filter = " AND ".join(filters) or None
+        if limit is not None and limit <= 0:
+            return
+        results = None
+        if stream:
+            results = client._search_lines(q, filter)
+        if results is None:
+            results = client._search_pages(q, filter, page_size, limit)
+        try:
+            for count, data in enumerate(results, 1):
+                if client.fields is not None:
+                    data = project(data, client.fields)
+                entity = PyLobidClient(**client.client_options)
+                entity.process_data(data=data)
+                yield entity.factory()
+                if count == limit:
+                    return
+        finally:
+            results.close()
+
+    def _search_lines(self, query: str, filter: str = None) -> Iterator:
+        params = {"q": query, "format": "jsonl"}
+        if filter is not None:
+            params["filter"] = filter
+        response = self.transport.get(
+            f"{self.BASE_URL}/search", params=params, stream=True
+        )
+        if not response.ok:
+            response.close()
+            return None
+
+        def lines():
+            with response:
+                for line in response.iter_lines():
+                    if line.strip():
+                        yield jsonlib.loads(line)
+
+        return lines()
+
+    def _search_pages(
+        self, query: str, filter: str, page_size: int, limit: int
+    ) -> Iterator:
+        start = 0
+        while True:
+            size = page_size if limit is None else min(page_size, limit - start)
+            result = self.get_search_json(
+                query, size=size, start=start, filter=filter
+            )
+            members = result.get("member", [])
+            yield from members
+            start += len(members)
+            if not members or start >= result.get("totalItems", 0):
+                return
+            if limit is not None and start >= limit:
+                return
 
     def get_same_as(self) -> list:
         """Get the list of alternative norm-data-ids.
@@ -176,11 +579,7 @@ class PyLobidClient:
         :return: a list of alternative names
         :rtype: list
         """
-        ent_dict = self.ent_dict
-        return next(
-            iter([match.value for match in self.pref_alt_names_xpath.find(ent_dict)]),
-            [],
-        )
+        return self.ent_dict.get("variantName", [])
 
     def __str__(self) -> str:
         return self.BASE_URL
@@ -188,18 +587,139 @@ class PyLobidClient:
     def __repr__(self) -> str:
         return f"<PyLobidClient {self.gnd_url}>"
 
-    def __init__(self, gnd_id: str = None, fetch_related: bool = False) -> None:
-        """Class constructor."""
-        self.BASE_URL = "http://lobid.org/gnd"
+    def __init__(
+        self,
+        gnd_id: str = None,
+        fetch_related: bool = False,
+        transport: PyLobidTransport = None,
+        cache: EntityCache = None,
+        use_cache: bool = True,
+        lazy: bool = False,
+        source: EntitySource = None,
+        offline: bool = False,
+        fields: Iterable = None,
+    ) -> None:
+        """Class constructor.
+
+        :param gnd_id: any kind of GND_URI/URL
+        :type gnd_id: str, optional
+        :param fetch_related: fetch related place entities of persons
+        :type fetch_related: bool, optional
+        :param transport: HTTP transport to use, defaults to the shared one
+        :type transport: PyLobidTransport, optional
+        :param cache: entity cache to use, defaults to the shared one
+        :type cache: EntityCache, SQLiteEntityCache, optional
+        :param use_cache: look up and store fetched entities in the cache
+        :type use_cache: bool, optional
+        :param lazy: only validate `gnd_id` and defer fetching the entity \
+        until its data is first accessed
+        :type lazy: bool, optional
+        :param source: source consulted before the LOBID-API, e.g. a \
+        `DumpSource`, `MemorySource` or `ChainedSource`
+        :type source: EntitySource, optional
+        :param offline: never fall back to the LOBID-API, entities missing \
+        in `source` raise GNDNotFoundError
+        :type offline: bool, optional
+        :param fields: top-level keys of the LOBID-JSON to keep, e.g. \
+        ['preferredName', 'variantName', 'hasGeometry']; `id`, \
+        `gndIdentifier` and `type` are always kept. Properties relying on \
+        other keys return their empty defaults. Related places of persons \
+        are reduced to the same keys. This only trims the dict the client \
+        keeps: the LOBID-API has no projection, so the full document is \
+        still downloaded, decoded and cached, and then copied into the \
+        smaller dict.
+        :type fields: Iterable, optional
+        """
+        self._pending = False
+        self._lazy = lazy
+        self._entity = None
+        self.transport = transport or get_default_transport()
+        self.cache = cache if cache is not None else get_default_cache()
+        self.use_cache = use_cache
+        self.source = source
+        self.offline = offline
+        self.fields = None if fields is None else tuple(fields)
+        self.BASE_URL = self.transport.base_url
         self.ID_PATTERN = r"([0-9]\w*-*\w*)"
-        self.coords_xpath = parse("$..hasGeometry")
         self.coords_regex = r"[+|-]\d+(?:\.\d*)?"
-        self.pref_alt_names_xpath = parse("$.variantName")
         self.fetch_related = fetch_related
         self.__gnd_id = None
         self.ent_dict = {}
-        self.process_data(gnd_id=gnd_id)
+        if lazy and gnd_id is not None:
+            _ = self.get_entity_lobid_url(gnd_id)
+            self._loading = False
+            self._load_lock = threading.RLock()
+            self._pending = True
+        else:
+            self.process_data(gnd_id=gnd_id)
+
+    @property
+    def ent_dict(self) -> dict:
+        """Return the LOBID-JSON of the entity, fetching it first if deferred."""
+        if self._pending:
+            self.load()
+        return self._ent_dict
+
+    @ent_dict.setter
+    def ent_dict(self, value: dict) -> None:
+        self._ent_dict = value
+
+    @property
+    def is_loaded(self) -> bool:
+        """Return False if fetching the entity data is still deferred."""
+        return not self._pending
 
+    def load(self, data: dict = None) -> None:
+        """Fetch and process the entity data of a lazy instance (if not done yet).
+
+        :param data: the already fetched ent_dict, e.g. from a batch request
+        :type data: dict, optional
+
+        :raises: GNDIdError, GNDNotFoundError, GNDAPIError
+        """
+        if not self._pending:
+            return
+        # other threads wait for the load in progress, the loading thread
+        # itself reads the data being set while it is still pending
+        with self._load_lock:
+            if not self._pending or self._loading:
+                return
+            self._loading = True
+            try:
+                if data is None:
+                    self.process_data(gnd_id=self.gnd_id)
+                else:
+                    self.process_data(data=data)
+                self._pending = False
+            finally:
+                self._loading = False
+
+    def __getattr__(self, name: str):
+        # attributes set by `process_data`, e.g. `birth_place` of lazy persons,
+        # and for lazy handles like `ref()` those of the `factory()` entity
+        if not name.startswith("_"):
+            if self.__dict__.get("_pending"):
+                self.load()
+                # still pending while the data is set by this thread
+                if not self._pending:
+                    return getattr(self, name)
+            else:
+                entity = self._typed_entity()
+                if entity is not None:
+                    return getattr(entity, name)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def _typed_entity(self):
+        if type(self) is not PyLobidClient or not self.__dict__.get("_lazy"):
+            return None
+        if self._entity is None and self.ent_type:
+            entity = self.factory()
+            self._entity = None if entity is self else entity
+        return self._entity
+
+    @metrics.instrument("process")
     def process_data(self, gnd_id: str = None, data: dict = None) -> None:
         """Fetch and/or process entity data.
 
@@ -229,9 +749,7 @@ class PyLobidPlace(PyLobidClient):
         :return: A string containing coordinates
         :rtype: str
         """
-        coords_str = (
-            f"{[match.value for match in self.coords_xpath.find(self.ent_dict)]}"
-        )
+        coords_str = f"{find_key(self.ent_dict, 'hasGeometry')}"
         return coords_str
 
     def get_coords(self) -> list:
@@ -248,6 +766,20 @@ class PyLobidPlace(PyLobidClient):
         """Return a list of coordinates."""
         return self.get_coords()
 
+    def get_point(self) -> tuple:
+        """Get the coordinates as floats.
+
+        :return: A tuple of longitude and latitude like (9.68978, 51.21097), \
+        `None` if the place has no coordinates
+        :rtype: tuple
+        """
+        return extract_point(self.ent_dict)
+
+    @property
+    def point(self) -> tuple:
+        """Return a (longitude, latitude) tuple of floats."""
+        return self.get_point()
+
     def __repr__(self) -> str:
         return f"<PyLobidPlace {self.gnd_url}>"
 
@@ -357,7 +889,9 @@ class PyLobidPerson(PyLobidClient):
         :rtype: dict
         """
         place_id = self.place_of_values(place_of).get("id")
-        return {} if place_id is None else PyLobidPlace(place_id).ent_dict
+        if place_id is None:
+            return {}
+        return PyLobidPlace(place_id, **self.client_options).ent_dict
 
     def get_coords_str(self, place_of: str = "Birth") -> str:
         """Get a string of coordinates.
@@ -371,7 +905,7 @@ class PyLobidPerson(PyLobidClient):
         """
         place_of_key = "pylobid_born" if place_of == "Birth" else "pylobid_died"
         ent_dict = self.ent_dict.get(place_of_key, {})
-        coords_str = f"{[match.value for match in self.coords_xpath.find(ent_dict)]}"
+        coords_str = f"{find_key(ent_dict, 'hasGeometry')}"
         return coords_str
 
     def get_coords(self, place_of: str = "Birth") -> list:
@@ -387,6 +921,20 @@ class PyLobidPerson(PyLobidClient):
         coords_str = self.get_coords_str(place_of=place_of)
         return extract_coords(coords_str)
 
+    def get_point(self, place_of: str = "Birth") -> tuple:
+        """Get the coordinates of the PlaceOfBirth|Death as floats.
+
+        :param place_of: Passed in value concatenates to 'PlaceOfBirth|Death' \
+        defaults to 'Birth'
+        :type place_of: str
+
+        :return: A tuple of longitude and latitude like (9.68978, 51.21097), \
+        `None` if the place is unknown or has no coordinates
+        :rtype: tuple
+        """
+        place_of_key = "pylobid_born" if place_of == "Birth" else "pylobid_died"
+        return extract_point(self.ent_dict.get(place_of_key, {}))
+
     def get_place_alt_name(self, place_of: str = "Birth") -> list:
         """Get the list of alternative names.
 
@@ -398,11 +946,35 @@ class PyLobidPerson(PyLobidClient):
         :rtype: list
         """
         place_of_key = "pylobid_born" if place_of == "Birth" else "pylobid_died"
-        ent_dict = self.ent_dict.get(place_of_key, {})
-        return next(
-            iter([match.value for match in self.pref_alt_names_xpath.find(ent_dict)]),
-            [],
-        )
+        return self.ent_dict.get(place_of_key, {}).get("variantName", [])
+
+    def set_related_places(self, born: dict = None, died: dict = None) -> None:
+        """Attach the LOBID-JSON of the PlaceOfBirth|Death.
+
+        Sets `pylobid_born` and `pylobid_died` and (re)computes `birth_place`
+        and `death_place`, e.g. for places fetched by some other means.
+
+        :param born: The LOBID-JSON of the PlaceOfBirth
+        :type born: dict, optional
+        :param died: The LOBID-JSON of the PlaceOfDeath
+        :type died: dict, optional
+        """
+        if self.is_person:
+            self.ent_dict.update(pylobid_born=born or {}, pylobid_died=died or {})
+        self.birth_place = {
+            "person_id": self.gnd_id,
+            "name": self.place_of_values().get("label", ""),
+            "id": self.place_of_values().get("id", ""),
+            "coords": self.get_coords(),
+            "alt_names": self.get_place_alt_name(),
+        }
+        self.death_place = {
+            "person_id": self.gnd_id,
+            "name": self.place_of_values(place_of="Death").get("label", ""),
+            "id": self.place_of_values(place_of="Death").get("id", ""),
+            "coords": self.get_coords(place_of="Death"),
+            "alt_names": self.get_place_alt_name(place_of="Death"),
+        }
 
     def __str__(self) -> str:
         return self.gnd_url
@@ -410,6 +982,7 @@ class PyLobidPerson(PyLobidClient):
     def __repr__(self) -> str:
         return f"<PyLobidPerson {self.gnd_url}>"
 
+    @metrics.instrument("process")
     def process_data(self, gnd_id: str = None, data: dict = None) -> None:
         """Fetch and/or process entity data.
 
@@ -423,30 +996,286 @@ class PyLobidPerson(PyLobidClient):
         super().process_data(gnd_id=gnd_id, data=data)
         if self.ent_dict == {}:
             return
-        if self.is_person:
-            self.ent_dict.update(pylobid_born={}, pylobid_died={})
-        self.pref_name_xpath = parse("$.preferredName")
+        born, died = {}, {}
         if self.fetch_related and self.is_person:
-            self.ent_dict["pylobid_born"] = self.place_of_dict()
+            born = self.place_of_dict()
             if self.place_of_values().get("id", "") == self.place_of_values(
                 place_of="Death"
             ).get("id", ""):
-                self.ent_dict["pylobid_died"] = self.ent_dict["pylobid_born"]
+                died = born
             else:
-                self.ent_dict["pylobid_died"] = self.place_of_dict(place_of="Death")
-
-        self.birth_place = {
-            "person_id": self.gnd_id,
-            "name": self.place_of_values().get("label", ""),
-            "id": self.place_of_values().get("id", ""),
-            "coords": self.get_coords(),
-            "alt_names": self.get_place_alt_name(),
-        }
-        self.death_place = {
-            "person_id": self.gnd_id,
-            "name": self.place_of_values(place_of="Death").get("label", ""),
-            "id": self.place_of_values(place_of="Death").get("id", ""),
-            "coords": self.get_coords(place_of="Death"),
-            "alt_names": self.get_place_alt_name(place_of="Death"),
-        }
+                died = self.place_of_dict(place_of="Death")
+        self.set_related_places(born=born, died=died)
         self.life_span = self.get_life_dates()
+
+
+GND_ID_PATTERN = re.compile(
+    r"1[0123]?\d{7}[0-9X]|[1-9]\d{0,7}-[0-9X]|3\d{7}[0-9X]"
+)
+
+
+def is_valid_gnd_id(gnd_id: str) -> bool:
+    """Check the syntax and the check digit of a GND-ID without any request.
+
+    GND-IDs with a hyphen (e.g. 4066009-6) use the check digit of the
+    former SWD and GKD, all others (e.g. 118650130) that of the former PND;
+    both are modulo 11 sums with 'X' for 10. Use `extract_id` to get the
+    GND-ID of a GND-URL first.
+
+    :param gnd_id: A GND-ID, e.g. 118650130
+    :type gnd_id: str
+
+    :return: True if `gnd_id` can be a GND-ID, False otherwise
+    :rtype: bool
+    """
+    if not isinstance(gnd_id, str) or GND_ID_PATTERN.fullmatch(gnd_id) is None:
+        return False
+    number, _, check = gnd_id.rpartition("-")
+    if not number:
+        number, check = gnd_id[:-1], gnd_id[-1]
+    total = sum(
+        int(digit) * weight for weight, digit in enumerate(reversed(number), 2)
+    )
+    expected = total % 11 if "-" in gnd_id else (11 - total % 11) % 11
+    return check == ("X" if expected == 10 else str(expected))
+
+
+def are_valid_gnd_ids(gnd_ids: Iterable) -> list:
+    """Check many GND-IDs with `is_valid_gnd_id`.
+
+    :param gnd_ids: GND-IDs, e.g. ['118650130', '4066009-6']
+    :type gnd_ids: Iterable
+
+    :return: A bool for every GND-ID, in input order
+    :rtype: list
+    """
+    return [is_valid_gnd_id(gnd_id) for gnd_id in gnd_ids]
+
+
+def _factory_or_error(
+    gnd_id: str, fetch_related: bool, transport: PyLobidTransport
+) -> object:
+    try:
+        return PyLobidClient(
+            gnd_id, fetch_related=fetch_related, transport=transport
+        ).factory()
+    except (ValueError, GNDNotFoundError, GNDAPIError) as error:
+        return error
+    except TypeError as error:
+        # e.g. an int instead of a str, `fetch_many` reports it as not found
+        id_error = GNDIdError(f'Could not find GND-ID in "{gnd_id}"')
+        id_error.__cause__ = error
+        return id_error
+    except requests.RequestException as error:
+        api_error = GNDAPIError(f"GND API request failed: {error}")
+        api_error.__cause__ = error
+        return api_error
+
+
+def factory_many(
+    ids: Iterable,
+    max_workers: int = 16,
+    ordered: bool = True,
+    fetch_related: bool = False,
+    transport: PyLobidTransport = None,
+) -> Iterator:
+    """Run `PyLobidClient(gnd_id).factory()` for many IDs on a thread pool.
+
+    At most `2 * max_workers` IDs are submitted at any time, so `ids` may be
+    a long or lazy iterable. A failing ID does not abort the batch, its
+    exception is yielded in place of the entity instead.
+
+    :param ids: GND_URIs/URLs or GND-IDs
+    :type ids: Iterable
+    :param max_workers: The number of worker threads
+    :type max_workers: int, optional
+    :param ordered: yield results in input order instead of completion order
+    :type ordered: bool, optional
+    :param fetch_related: fetch related place entities of persons
+    :type fetch_related: bool, optional
+    :param transport: HTTP transport to use, defaults to the shared one
+    :type transport: PyLobidTransport, optional
+
+    :return: Tuples of the input ID and its matching entity or the \
+    `GNDIdError`, `GNDNotFoundError`, `GNDAPIError` (or `ValueError`) raised
+    :rtype: Iterator
+    """
+    ids = iter(ids)
+    pending = {}
+    order = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def submit(item):
+            future = executor.submit(_factory_or_error, item, fetch_related, transport)
+            pending[future] = item
+            if ordered:
+                order.append(future)
+
+        for item in islice(ids, 2 * max_workers):
+            submit(item)
+        try:
+            while pending:
+                if ordered:
+                    done = [order.popleft()]
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    result = future.result()
+                    for next_item in islice(ids, 1):
+                        submit(next_item)
+                    yield item, result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def coords_array(items: Iterable, place_of: str = "Birth") -> tuple:
+    """Get the coordinates of many entities as a NumPy array. Requires `numpy`.
+
+    `PyLobidPerson` instances contribute the coordinates of their
+    PlaceOfBirth|Death, other entities and raw LOBID-JSON dicts their own.
+
+    :param items: Entities or LOBID-JSON dicts
+    :type items: Iterable
+    :param place_of: Passed in value concatenates to 'PlaceOfBirth|Death' \
+    defaults to 'Birth'
+    :type place_of: str
+
+    :return: A (N, 2) float array of longitudes and latitudes (NaN for \
+    missing coordinates) and a boolean (N,) array marking the valid rows
+    :rtype: tuple
+    """
+    points = []
+    for item in items:
+        if isinstance(item, PyLobidPerson):
+            points.append(item.get_point(place_of=place_of))
+        elif isinstance(item, PyLobidClient):
+            points.append(extract_point(item.ent_dict))
+        else:
+            points.append(extract_point(item))
+    return points_array(points)
+
+
+def fetch_related_places(
+    persons: Iterable, chunk_size: int = 100, max_workers: int = 4
+) -> dict:
+    """Fetch and attach the places of birth and death of many persons.
+
+    The distinct place IDs of all persons are collected first and every
+    place is fetched once, with batched search requests in parallel. The
+    places are then attached with `PyLobidPerson.set_related_places`, places
+    which cannot be found are attached as empty dicts. Entities other than
+    `PyLobidPerson` instances are skipped.
+
+    :param persons: `PyLobidPerson` instances
+    :type persons: Iterable
+    :param chunk_size: The number of IDs looked up per request
+    :type chunk_size: int, optional
+    :param max_workers: The number of chunks requested in parallel
+    :type max_workers: int, optional
+
+    :return: A dict mapping the place GND-IDs to their LOBID-JSON
+    :rtype: dict
+    """
+    persons = [
+        person
+        for person in persons
+        if isinstance(person, PyLobidPerson) and person.is_person
+    ]
+    if not persons:
+        return {}
+    client = persons[0]
+
+    def place_id(person, place_of):
+        url = person.place_of_values(place_of=place_of).get("id")
+        return None if url is None else client.extract_id(url)
+
+    place_ids = [(place_id(x, "Birth"), place_id(x, "Death")) for x in persons]
+    places = client.get_entities_json(
+        [gnd_id for pair in place_ids for gnd_id in pair if gnd_id is not None],
+        chunk_size=chunk_size,
+        max_workers=max_workers,
+    )
+    for person, (born_id, died_id) in zip(persons, place_ids):
+        born = places.get(born_id, {})
+        died = born if died_id == born_id else places.get(died_id, {})
+        person.fetch_related = True
+        person.set_related_places(born=born, died=died)
+    return places
+
+
+def ref(gnd_id: str, **kwargs) -> PyLobidClient:
+    """Return a lazy client which fetches its entity on first data access.
+
+    Shortcut for `PyLobidClient(gnd_id, lazy=True, **kwargs)`. Once loaded,
+    the properties of the matching entity, e.g. `coords` of places or
+    `birth_place` of persons, are read from the instance `factory()` returns.
+
+    :param gnd_id: any kind of GND_URI/URL
+    :type gnd_id: str
+
+    :raises: GNDIdError if no GND-ID is found.
+    :return: A lazy client
+    :rtype: PyLobidClient
+    """
+    return PyLobidClient(gnd_id, lazy=True, **kwargs)
+
+
+def prefetch(entities: Iterable, chunk_size: int = 100) -> list:
+    """Load many lazy entities with batched search requests.
+
+    The requests are sent with the transport and cache of the first
+    entity that is not loaded yet.
+
+    :param entities: Lazy clients, e.g. created with `ref()`
+    :type entities: Iterable
+    :param chunk_size: The number of IDs looked up per request
+    :type chunk_size: int, optional
+
+    :return: The entities which could not be found, they stay lazy
+    :rtype: list
+    """
+    pending = [entity for entity in entities if not entity.is_loaded]
+    if not pending:
+        return []
+    found = pending[0].get_entities_json(
+        [entity.gnd_id for entity in pending], chunk_size=chunk_size
+    )
+    not_found = []
+    for entity in pending:
+        if entity.gnd_id in found:
+            entity.load(data=found[entity.gnd_id])
+        else:
+            not_found.append(entity)
+    return not_found
+
+
+def iter_dump(path: str, types: Iterable = None, compact: bool = False) -> Iterator:
+    """Stream the typed entities of a local LOBID-GND JSON-lines dump.
+
+    Entities are built with `process_data(data=...)` and `factory()`
+    without any network request. Filtering by type happens before the
+    entities are built, see `pylobid.dump.iter_records`. Records without a
+    type are yielded as untyped `PyLobidClient`, like in `fetch_many`.
+
+    :param path: The path of a `.jsonl` or `.jsonl.gz` file
+    :type path: str
+    :param types: LOBID types to keep, e.g. ['Person', 'PlaceOrGeographicName']
+    :type types: Iterable, optional
+    :param compact: yield compact records instead, see `pylobid.records`
+    :type compact: bool, optional
+
+    :return: The matching entities in file order
+    :rtype: Iterator
+    """
+    for data in iter_records(path, types=types):
+        if compact:
+            yield records.from_json(data)
+            continue
+        client = PyLobidClient()
+        client.process_data(data=data)
+        try:
+            yield client.factory()
+        except ValueError:
+            yield client
@@ -0,0 +1,316 @@
+"""Compact, read-only records of LOBID entities.
+
+A record keeps only the fields the entity classes of `pylobid.pylobid`
+expose, in `__slots__` and tuples of interned strings, and drops the
+LOBID-JSON. Records offer the same properties as `PyLobidPlace`,
+`PyLobidOrg`, `PyLobidPerson` and `PyLobidWork`, so they can stand in for
+them when many entities are held in memory at once.
+"""
+import sys
+
+from .transport import DEFAULT_BASE_URL
+from .utils import extract_coords, extract_point, find_key
+
+CREATOR_ROLES = ("firstAuthor", "author", "firstComposer", "librettist")
+
+_type_tuples = {}
+
+
+def _intern(value) -> str:
+    return sys.intern(value) if isinstance(value, str) else ""
+
+
+def _types(data: dict) -> tuple:
+    types = tuple(data.get("type", []))
+    interned = _type_tuples.get(types)
+    if interned is None:
+        interned = _type_tuples[types] = tuple(_intern(x) for x in types)
+    return interned
+
+
+def _refs(values: list) -> tuple:
+    return tuple(
+        (_intern(x.get("id", "")), _intern(x.get("label", "")))
+        for x in values
+        if isinstance(x, dict)
+    )
+
+
+def _coords(data: dict) -> tuple:
+    # the strings `PyLobidPlace.get_coords()` returns, of all geometries
+    coords = extract_coords(f"{find_key(data, 'hasGeometry')}")
+    return tuple(sys.intern(x) for x in coords)
+
+
+class EntityRecord:
+    """The compact counterpart of `PyLobidClient`.
+
+    :param data: The LOBID-JSON of the entity
+    :type data: dict
+    """
+
+    __slots__ = ("gnd_id", "ent_type", "pref_name", "_alt_names", "_same_as")
+    BASE_URL = DEFAULT_BASE_URL
+
+    def __init__(self, data: dict) -> None:
+        """Class constructor."""
+        self.gnd_id = _intern(
+            data.get("gndIdentifier") or data["id"].rstrip("/").rsplit("/", 1)[-1]
+        )
+        self.ent_type = _types(data)
+        self.pref_name = data.get("preferredName", "")
+        self._alt_names = tuple(data.get("variantName", []))
+        self._same_as = tuple(
+            (_intern(x["collection"].get("abbr", "no_abbr")), x["id"])
+            for x in data.get("sameAs", [])
+        )
+
+    @property
+    def gnd_url(self) -> str:
+        """Return the LOBID URL e.g. http://lobid.org/gnd/118650130"""
+        return f"{self.BASE_URL}/{self.gnd_id}"
+
+    @property
+    def is_place(self) -> bool:
+        """Return True if this record is a place entity, False otherwise."""
+        return "PlaceOrGeographicName" in self.ent_type
+
+    @property
+    def is_org(self) -> bool:
+        """Return True if this record is an organization entity, False otherwise."""
+        return "CorporateBody" in self.ent_type
+
+    @property
+    def is_person(self) -> bool:
+        """Return True if this record is a person entity, False otherwise."""
+        return "Person" in self.ent_type
+
+    @property
+    def is_work(self) -> bool:
+        """Return True if this record is a work entity, False otherwise."""
+        return "Work" in self.ent_type
+
+    @property
+    def alt_names(self) -> list:
+        """Return a list of alternative names."""
+        return list(self._alt_names)
+
+    @property
+    def same_as(self) -> list:
+        """Return a list of alternative norm-data-ids."""
+        return list(self._same_as)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.gnd_url}>"
+
+
+class PlaceRecord(EntityRecord):
+    """The compact counterpart of `PyLobidPlace`."""
+
+    __slots__ = ("point", "_coords")
+
+    def __init__(self, data: dict) -> None:
+        """Class constructor."""
+        super().__init__(data)
+        self.point = extract_point(data)
+        self._coords = _coords(data)
+
+    def get_point(self) -> tuple:
+        """Get the coordinates as floats.
+
+        :return: A tuple of longitude and latitude, `None` if unknown
+        :rtype: tuple
+        """
+        return self.point
+
+    def get_coords(self) -> list:
+        """Get a list of the coordinates of all geometries as in the LOBID-JSON.
+
+        :return: A list of longitude, latitude coords like ['+009.689780', '+051.210970']
+        :rtype: list
+        """
+        return list(self._coords)
+
+    @property
+    def coords(self) -> list:
+        """Return a list of coordinates."""
+        return self.get_coords()
+
+
+class OrgRecord(EntityRecord):
+    """The compact counterpart of `PyLobidOrg`."""
+
+    __slots__ = ("_located_in",)
+
+    def __init__(self, data: dict) -> None:
+        """Class constructor."""
+        super().__init__(data)
+        self._located_in = _refs(data.get("placeOfBusiness", []))
+
+    @property
+    def located_in(self) -> list:
+        """Return a list of locations."""
+        return [{"id": x, "label": label} for x, label in self._located_in]
+
+
+class WorkRecord(EntityRecord):
+    """The compact counterpart of `PyLobidWork`."""
+
+    __slots__ = ("_creators", "date_of_production", "date_of_publication")
+
+    def __init__(self, data: dict) -> None:
+        """Class constructor."""
+        super().__init__(data)
+        self._creators = tuple(
+            ref + (role,)
+            for role in CREATOR_ROLES
+            for ref in _refs(data.get(role, []))
+        )
+        self.date_of_production = next(iter(data.get("dateOfProduction", [])), "")
+        self.date_of_publication = next(iter(data.get("dateOfPublication", [])), "")
+
+    @property
+    def creators(self) -> list:
+        """Return the persons involved in the creation of the work and their role."""
+        return [
+            {"id": x, "label": label, "role": role}
+            for x, label, role in self._creators
+        ]
+
+    @property
+    def date_of_creation(self) -> str:
+        """Return the publication date, or the production date if unknown."""
+        return self.date_of_publication or self.date_of_production
+
+
+class PersonRecord(EntityRecord):
+    """The compact counterpart of `PyLobidPerson`.
+
+    Places of birth and death are kept as tuples of their ID, label, point,
+    coordinates and alternative names. The point, coordinates and alternative
+    names are only known if the person was fetched with `fetch_related`.
+    """
+
+    __slots__ = ("birth_date_str", "death_date_str", "_born", "_died")
+
+    def __init__(self, data: dict) -> None:
+        """Class constructor."""
+        super().__init__(data)
+        self.birth_date_str = next(iter(data.get("dateOfBirth", [])), "")
+        self.death_date_str = next(iter(data.get("dateOfDeath", [])), "")
+        self._born = self._place(data, "placeOfBirth", "pylobid_born")
+        self._died = self._place(data, "placeOfDeath", "pylobid_died")
+        if self._died == self._born:
+            self._died = self._born
+
+    @staticmethod
+    def _place(data: dict, key: str, related_key: str) -> tuple:
+        refs = _refs(data.get(key, [])[:1])
+        if not refs:
+            return None
+        related = data.get(related_key) or {}
+        return refs[0] + (
+            extract_point(related),
+            _coords(related),
+            tuple(_intern(x) for x in related.get("variantName", [])),
+        )
+
+    def _place_of(self, place_of: str) -> tuple:
+        place = self._born if place_of == "Birth" else self._died
+        return place or ("", "", None, (), ())
+
+    def place_of_values(self, place_of: str = "Birth") -> dict:
+        """Return the ID and label of the PlaceOfBirth|Death (if present).
+
+        :param place_of: 'Birth' or 'Death', defaults to 'Birth'
+        :type place_of: str
+
+        :return: A dict with the keys id and label, empty if unknown
+        :rtype: dict
+        """
+        place = self._born if place_of == "Birth" else self._died
+        return {} if place is None else {"id": place[0], "label": place[1]}
+
+    def get_point(self, place_of: str = "Birth") -> tuple:
+        """Get the coordinates of the PlaceOfBirth|Death as floats.
+
+        :param place_of: 'Birth' or 'Death', defaults to 'Birth'
+        :type place_of: str
+
+        :return: A tuple of longitude and latitude, `None` if unknown
+        :rtype: tuple
+        """
+        return self._place_of(place_of)[2]
+
+    def get_coords(self, place_of: str = "Birth") -> list:
+        """Get a list of coordinates of the PlaceOfBirth|Death.
+
+        :param place_of: 'Birth' or 'Death', defaults to 'Birth'
+        :type place_of: str
+
+        :return: A list of longitude, latitude coords like ['+009.689780', '+051.210970']
+        :rtype: list
+        """
+        return list(self._place_of(place_of)[3])
+
+    def get_place_alt_name(self, place_of: str = "Birth") -> list:
+        """Get the alternative names of the PlaceOfBirth|Death.
+
+        :param place_of: 'Birth' or 'Death', defaults to 'Birth'
+        :type place_of: str
+
+        :return: a list of alternative names
+        :rtype: list
+        """
+        return list(self._place_of(place_of)[4])
+
+    def _place_dict(self, place_of: str) -> dict:
+        place_id, label, _, coords, alt_names = self._place_of(place_of)
+        return {
+            "person_id": self.gnd_id,
+            "name": label,
+            "id": place_id,
+            "coords": list(coords),
+            "alt_names": list(alt_names),
+        }
+
+    @property
+    def birth_place(self) -> dict:
+        """Return the PlaceOfBirth like `PyLobidPerson.birth_place`."""
+        return self._place_dict("Birth")
+
+    @property
+    def death_place(self) -> dict:
+        """Return the PlaceOfDeath like `PyLobidPerson.death_place`."""
+        return self._place_dict("Death")
+
+    @property
+    def life_span(self) -> dict:
+        """Return a dict with the keys birth_date_str and death_date_str."""
+        return {
+            "birth_date_str": self.birth_date_str,
+            "death_date_str": self.death_date_str,
+        }
+
+
+def from_json(data: dict) -> EntityRecord:
+    """Return the compact record of LOBID-JSON, dispatched like `factory()`.
+
+    :param data: The LOBID-JSON of an entity, for persons optionally with \
+    the related places in `pylobid_born` and `pylobid_died`
+    :type data: dict
+
+    :return: A matching record
+    :rtype: `PlaceRecord`, `OrgRecord`, `PersonRecord`, `WorkRecord`, \
+    `EntityRecord`
+    """
+    types = data.get("type", [])
+    if "Person" in types:
+        return PersonRecord(data)
+    if "CorporateBody" in types:
+        return OrgRecord(data)
+    if "Work" in types:
+        return WorkRecord(data)
+    if "PlaceOrGeographicName" in types:
+        return PlaceRecord(data)
+    return EntityRecord(data)
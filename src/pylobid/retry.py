@@ -0,0 +1,188 @@
+"""Retry policy for transient LOBID-API errors."""
+import random
+import threading
+import time
+from collections import defaultdict
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+import requests
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def parse_retry_after(value: str) -> float:
+    """Parse a Retry-After header into seconds to wait.
+
+    :param value: The header value, either seconds or an HTTP date
+    :type value: str
+
+    :return: The seconds to wait, `None` if the value is missing or invalid
+    :rtype: float
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if date is None:
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """Retry transient errors with exponential backoff, jitter and a budget.
+
+    A request answered with one of `statuses` or failing with one of
+    `errors` is sent again after `backoff_factor * 2 ** attempt` seconds
+    (at most `max_backoff`), randomized with full jitter. A `Retry-After`
+    header takes precedence, up to `max_retry_after` seconds. 404 Not Found
+    is never retried.
+
+    The retry budget caps the extra load: every request earns
+    `budget_ratio` retry tokens and every retry spends one, with at most
+    `budget_reserve` tokens saved up. Once the budget is spent, failures are
+    returned right away instead of being retried.
+
+    :param max_retries: The maximum number of retries per request
+    :type max_retries: int, optional
+    :param backoff_factor: Seconds to wait before the first retry
+    :type backoff_factor: float, optional
+    :param max_backoff: The maximum seconds to wait between attempts
+    :type max_backoff: float, optional
+    :param jitter: randomize the backoff between 0 and its full value
+    :type jitter: bool, optional
+    :param statuses: The response status codes to retry
+    :type statuses: tuple, optional
+    :param errors: The exceptions to retry
+    :type errors: tuple, optional
+    :param max_retry_after: The maximum seconds a Retry-After may delay
+    :type max_retry_after: float, optional
+    :param budget_ratio: Retries earned per request, e.g. 0.2 for 20%
+    :type budget_ratio: float, optional
+    :param budget_reserve: The maximum number of saved up retries
+    :type budget_reserve: float, optional
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        statuses: tuple = RETRY_STATUSES,
+        errors: tuple = (requests.ConnectionError, requests.Timeout),
+        max_retry_after: float = 60.0,
+        budget_ratio: float = 0.2,
+        budget_reserve: float = 10.0,
+    ) -> None:
+        """Class constructor."""
+        if 404 in statuses:
+            raise ValueError("404 Not Found must not be retried")
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.errors = tuple(errors)
+        self.max_retry_after = max_retry_after
+        self.budget_ratio = budget_ratio
+        self.budget_reserve = budget_reserve
+        self._lock = threading.Lock()
+        self._random = random.Random()
+        self.reset()
+
+    def reset(self) -> None:
+        """Refill the budget and reset the statistics."""
+        with self._lock:
+            self.tokens = self.budget_reserve
+            self.requests = 0
+            self.retries = 0
+            self.gave_up = 0
+            self.budget_exhausted = 0
+            self.waited = 0.0
+            self.reasons = defaultdict(int)
+
+    def backoff(self, attempt: int) -> float:
+        """Return the seconds to wait before retry number `attempt + 1`.
+
+        :param attempt: The number of retries done so far
+        :type attempt: int
+
+        :return: The (jittered) backoff
+        :rtype: float
+        """
+        delay = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        return self._random.uniform(0, delay) if self.jitter else delay
+
+    def send(self, request: Callable, sleep: Callable = time.sleep):
+        """Call `request` until it succeeds or must not be retried.
+
+        :param request: A callable sending the request and returning the \
+        response, e.g. a `requests.Response`
+        :type request: Callable
+        :param sleep: The function used to wait between attempts
+        :type sleep: Callable, optional
+
+        :return: The last response, an exception is raised if the last \
+        attempt failed with one
+        """
+        with self._lock:
+            self.requests += 1
+            self.tokens = min(self.budget_reserve, self.tokens + self.budget_ratio)
+        attempt = 0
+        while True:
+            try:
+                response = request()
+            except self.errors as error:
+                if not self._allow(attempt, type(error).__name__):
+                    raise
+                delay = self.backoff(attempt)
+            else:
+                status = response.status_code
+                if status not in self.statuses or not self._allow(attempt, status):
+                    return response
+                delay = parse_retry_after(response.headers.get("Retry-After"))
+                if delay is None:
+                    delay = self.backoff(attempt)
+                delay = min(delay, self.max_retry_after)
+                response.close()
+            with self._lock:
+                self.waited += delay
+            sleep(delay)
+            attempt += 1
+
+    def _allow(self, attempt: int, reason) -> bool:
+        with self._lock:
+            if attempt >= self.max_retries:
+                self.gave_up += 1
+                return False
+            if self.tokens < 1:
+                self.budget_exhausted += 1
+                return False
+            self.tokens -= 1
+            self.retries += 1
+            self.reasons[reason] += 1
+            return True
+
+    @property
+    def stats(self) -> dict:
+        """Return retry statistics."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "gave_up": self.gave_up,
+                "budget_exhausted": self.budget_exhausted,
+                "budget": self.tokens,
+                "waited": self.waited,
+                "reasons": dict(self.reasons),
+                "retry_ratio": self.retries / self.requests if self.requests else 0.0,
+            }
+
+    def __repr__(self) -> str:
+        return f"<RetryPolicy max_retries={self.max_retries}>"
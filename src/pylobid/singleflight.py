@@ -0,0 +1,157 @@
+"""Coalescing of concurrent calls for the same key.
+
+While a call for a key is in flight, later callers for the same key wait
+for its result instead of starting a call of their own, e.g. many threads
+resolving the same popular GND-ID share a single request.
+
+    flights = SingleFlight()
+    data, shared = flights.do(gnd_id, lambda: fetch(gnd_id))
+"""
+import asyncio
+import threading
+from typing import Callable, Hashable
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "duplicates", "task")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.duplicates = 0
+        self.task = None
+
+
+def _stats(calls: int, coalesced: int, in_flight: int) -> dict:
+    total = calls + coalesced
+    return {
+        "calls": calls,
+        "coalesced": coalesced,
+        "in_flight": in_flight,
+        "coalesced_ratio": coalesced / total if total else 0.0,
+    }
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key across threads.
+
+    Exceptions are passed to every waiting caller, nothing is cached once
+    a call returned.
+    """
+
+    def __init__(self) -> None:
+        """Class constructor."""
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, function: Callable, copy: Callable = None) -> tuple:
+        """Call `function()` unless a call for `key` is already in flight.
+
+        :param key: The key of the call, e.g. a GND-ID
+        :type key: Hashable
+        :param function: The call without arguments
+        :type function: Callable
+        :param copy: Applied to the result for every caller if it is shared, \
+        so no caller sees the changes of another
+        :type copy: Callable, optional
+
+        :return: The result and whether it came from another caller's call
+        :rtype: tuple
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+                leader = True
+            else:
+                call.duplicates += 1
+                self.coalesced += 1
+                leader = False
+        if leader:
+            try:
+                call.result = function()
+            except BaseException as error:
+                call.error = error
+                raise
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        else:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+        result = call.result
+        if copy is not None and call.duplicates:
+            result = copy(result)
+        return result, not leader
+
+    @property
+    def stats(self) -> dict:
+        """Return the number of calls, coalesced calls and calls in flight."""
+        with self._lock:
+            return _stats(self.calls, self.coalesced, len(self._calls))
+
+    def __repr__(self) -> str:
+        return f"<SingleFlight {len(self._calls)} in flight>"
+
+
+class AsyncSingleFlight:
+    """Coalesce concurrent calls for the same key within an event loop.
+
+    The call runs as a task of its own, so cancelling one waiting caller
+    does not cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        """Class constructor."""
+        self._calls = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(
+        self, key: Hashable, function: Callable, copy: Callable = None
+    ) -> tuple:
+        """Await `function()` unless a call for `key` is already in flight.
+
+        :param key: The key of the call, e.g. a GND-ID
+        :type key: Hashable
+        :param function: A coroutine function without arguments
+        :type function: Callable
+        :param copy: Applied to the result for every caller if it is shared, \
+        so no caller sees the changes of another
+        :type copy: Callable, optional
+
+        :return: The result and whether it came from another caller's call
+        :rtype: tuple
+        """
+        call = self._calls.get(key)
+        leader = call is None
+        if leader:
+            call = self._calls[key] = _Call()
+            call.task = asyncio.ensure_future(function())
+            call.task.add_done_callback(lambda _: self._finish(key, call))
+            self.calls += 1
+        else:
+            call.duplicates += 1
+            self.coalesced += 1
+        result = await asyncio.shield(call.task)
+        if copy is not None and call.duplicates:
+            result = copy(result)
+        return result, not leader
+
+    def _finish(self, key: Hashable, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    @property
+    def stats(self) -> dict:
+        """Return the number of calls, coalesced calls and calls in flight."""
+        return _stats(self.calls, self.coalesced, len(self._calls))
+
+    def __repr__(self) -> str:
+        return f"<AsyncSingleFlight {len(self._calls)} in flight>"
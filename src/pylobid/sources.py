@@ -0,0 +1,136 @@
+"""Pluggable sources of LOBID entity JSON."""
+from typing import Iterable, Mapping, Protocol, Union, runtime_checkable
+
+from . import jsonlib
+from .cache import _copy_json
+from .exceptions import GNDAPIError
+from .transport import PyLobidTransport, get_default_transport
+
+
+@runtime_checkable
+class EntitySource(Protocol):
+    """The interface of the sources `PyLobidClient` accepts as `source`.
+
+    A source maps a GND-ID to its LOBID-JSON and returns `None` for GND-IDs
+    it does not know, so the next source (or the LOBID-API) can be asked.
+    Every call must return a fresh object, as clients modify their data.
+    """
+
+    def get(self, gnd_id: str) -> dict:
+        """Return the LOBID-JSON of a GND-ID, `None` if unknown."""
+
+
+class HTTPSource:
+    """Fetch entities from a LOBID-GND API, e.g. a mirror.
+
+    Unlike the built-in API access of `PyLobidClient` this source does not
+    use the entity cache; put a `MemorySource` or `DumpSource` in front of it
+    with `ChainedSource` instead.
+
+    :param transport: HTTP transport to use, defaults to the shared one
+    :type transport: PyLobidTransport, optional
+    """
+
+    def __init__(self, transport: PyLobidTransport = None) -> None:
+        """Class constructor."""
+        self.transport = transport or get_default_transport()
+
+    def get(self, gnd_id: str) -> dict:
+        """Return the LOBID-JSON of a GND-ID.
+
+        :param gnd_id: A GND-ID, e.g. 118650130
+        :type gnd_id: str
+
+        :raises: GNDAPIError
+        :return: The fetched document, `None` if the API returns Not Found
+        :rtype: dict
+        """
+        response = self.transport.get(
+            f"{self.transport.base_url}/{gnd_id}",
+            headers={"Accept": "application/json"},
+        )
+        if response.status_code == 404:
+            return None
+        if not response.ok:
+            raise GNDAPIError(f"GND API error code: {response.status_code}")
+        return jsonlib.loads(response.content)
+
+    def __repr__(self) -> str:
+        return f"<HTTPSource {self.transport.base_url}>"
+
+
+class MemorySource:
+    """Serve entities from memory, e.g. recorded fixtures in tests.
+
+    :param entities: LOBID-JSON documents, or a mapping of GND-IDs to them
+    :type entities: Iterable, Mapping
+    """
+
+    def __init__(self, entities: Union[Iterable, Mapping] = ()) -> None:
+        """Class constructor."""
+        self.entities = {}
+        if isinstance(entities, Mapping):
+            self.entities.update(entities)
+        else:
+            for data in entities:
+                self.add(data)
+
+    def add(self, data: dict) -> None:
+        """Add a LOBID-JSON document.
+
+        :param data: A document with a `gndIdentifier` or `id`
+        :type data: dict
+        """
+        gnd_id = data.get("gndIdentifier") or data["id"].rsplit("/", 1)[-1]
+        self.entities[gnd_id] = data
+
+    def get(self, gnd_id: str) -> dict:
+        """Return the LOBID-JSON of a GND-ID.
+
+        :param gnd_id: A GND-ID, e.g. 118650130
+        :type gnd_id: str
+
+        :return: A copy of the document, `None` if unknown
+        :rtype: dict
+        """
+        data = self.entities.get(gnd_id)
+        return None if data is None else _copy_json(data)
+
+    def __contains__(self, gnd_id: str) -> bool:
+        return gnd_id in self.entities
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def __repr__(self) -> str:
+        return f"<MemorySource {len(self)}>"
+
+
+class ChainedSource:
+    """Ask several sources in turn, e.g. a dump first and a mirror second.
+
+    :param sources: The sources in the order they are asked
+    :type sources: EntitySource
+    """
+
+    def __init__(self, *sources: EntitySource) -> None:
+        """Class constructor."""
+        self.sources = list(sources)
+
+    def get(self, gnd_id: str) -> dict:
+        """Return the LOBID-JSON of the first source knowing a GND-ID.
+
+        :param gnd_id: A GND-ID, e.g. 118650130
+        :type gnd_id: str
+
+        :return: The document, `None` if no source knows the GND-ID
+        :rtype: dict
+        """
+        for source in self.sources:
+            data = source.get(gnd_id)
+            if data is not None:
+                return data
+        return None
+
+    def __repr__(self) -> str:
+        return f"<ChainedSource {self.sources!r}>"
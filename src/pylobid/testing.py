@@ -0,0 +1,277 @@
+"""A local stub of the LOBID-GND API for tests and benchmarks."""
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterable
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .dump import iter_records
+
+GND_IDENTIFIER_PATTERN = r"gndIdentifier:\(?([^()]*)\)?"
+TYPE_FILTER_PATTERN = r"type:\(?([^()]*)\)?"
+
+
+class StubLobidServer:
+    """Serve recorded LOBID entity JSON over a local HTTP server.
+
+    The server answers `/gnd/<GND-ID>` with the matching entity (honoring
+    `If-None-Match`) and `/gnd/search` for `gndIdentifier:(...)` queries,
+    plain words matched against the names, and `type:(...)` filters, with
+    `from`/`size` paging or as JSON lines (`format=jsonl`).
+    Use it as a context manager and point a `PyLobidTransport` to its
+    `base_url`. Latency and failing requests can be simulated to benchmark
+    clients under realistic, yet reproducible conditions.
+
+    :param entities: The recorded LOBID-JSON documents to serve
+    :type entities: Iterable
+    :param host: The interface to bind to, defaults to 127.0.0.1
+    :type host: str, optional
+    :param port: The port to bind to, defaults to a free port
+    :type port: int, optional
+    :param latency: Seconds every response is delayed
+    :type latency: float, optional
+    :param error_rate: The share of requests answered with `error_status`
+    :type error_rate: float, optional
+    :param error_status: The status code of the simulated errors
+    :type error_status: int, optional
+    :param retry_after: Retry-After header value sent with the simulated \
+    errors, e.g. '1'
+    :type retry_after: str, optional
+    :param seed: Seed of the random errors, for reproducible runs
+    :type seed: int, optional
+    :param jsonl: support `format=jsonl` searches, otherwise answer them \
+    with 400 Bad Request
+    :type jsonl: bool, optional
+    :param compress: gzip the bodies of requests accepting it
+    :type compress: bool, optional
+    """
+
+    def __init__(
+        self,
+        entities: Iterable,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        retry_after: str = None,
+        seed: int = None,
+        jsonl: bool = True,
+        compress: bool = False,
+    ) -> None:
+        """Class constructor."""
+        self.entities = {
+            item.get("gndIdentifier", item["id"].rsplit("/", 1)[-1]): item
+            for item in entities
+        }
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.jsonl = jsonl
+        self.compress = compress
+        self.request_log = []
+        self.status_log = []
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @classmethod
+    def from_dump(cls, path: str, **kwargs) -> "StubLobidServer":
+        """Create a server for the records of a JSON-lines dump.
+
+        :param path: The path of a `.jsonl` or `.jsonl.gz` file
+        :type path: str
+
+        :return: A server which is not started yet
+        :rtype: StubLobidServer
+        """
+        return cls(iter_records(path), **kwargs)
+
+    @property
+    def base_url(self) -> str:
+        """Return the LOBID-GND base URL of this server."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/gnd"
+
+    def start(self) -> "StubLobidServer":
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def search(self, params: dict) -> list:
+        """Return the entities matching a search request.
+
+        :param params: The parsed query parameters
+        :type params: dict
+
+        :return: A list of matching LOBID-JSON documents
+        :rtype: list
+        """
+        query = params.get("q", ["*"])[0]
+        match = re.search(GND_IDENTIFIER_PATTERN, query)
+        if match is not None:
+            gnd_ids = [x.strip('"') for x in match.group(1).split(" OR ")]
+            members = [self.entities[x] for x in gnd_ids if x in self.entities]
+        else:
+            words = [x for x in query.lower().split() if x != "*"]
+            members = [
+                item
+                for item in self.entities.values()
+                if all(x in self._names(item) for x in words)
+            ]
+        match = re.search(TYPE_FILTER_PATTERN, params.get("filter", [""])[0])
+        if match is not None:
+            types = {x.strip('"') for x in match.group(1).split(" OR ")}
+            members = [x for x in members if not types.isdisjoint(x.get("type", []))]
+        return members
+
+    @staticmethod
+    def _names(item: dict) -> str:
+        names = [item.get("preferredName", "")] + item.get("variantName", [])
+        return " ".join(names).lower()
+
+    def _fails(self) -> bool:
+        if not self.error_rate:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def _log(self, path: str, status: int) -> None:
+        with self._lock:
+            self.request_log.append(path)
+            self.status_log.append(status)
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # headers and body are written separately, avoid delayed ACKs
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+                if server._fails():
+                    status = server.error_status
+                    return self._send(
+                        status,
+                        {"message": f"Simulated {status}"},
+                        retry_after=server.retry_after,
+                    )
+                url = urlsplit(self.path)
+                path = unquote(url.path).rstrip("/")
+                if path == "/gnd/search":
+                    params = parse_qs(url.query)
+                    members = server.search(params)
+                    if params.get("format") == ["jsonl"]:
+                        if not server.jsonl:
+                            return self._send(400, {"message": "Unsupported"})
+                        return self._send(200, members, lines=True)
+                    start = int(params.get("from", ["0"])[0])
+                    end = start + int(params.get("size", ["10"])[0])
+                    body = {"totalItems": len(members), "member": members[start:end]}
+                    return self._send(200, body)
+                gnd_id = path.rsplit("/", 1)[-1]
+                if path.startswith("/gnd/") and gnd_id in server.entities:
+                    return self._send(200, server.entities[gnd_id], etag=True)
+                return self._send(404, {"message": f"Not found: {gnd_id}"})
+
+            def _send(self, status, body, etag=False, lines=False, retry_after=None):
+                if lines:
+                    payload = "".join(json.dumps(x) + "\n" for x in body).encode()
+                    headers = {"Content-Type": "application/x-jsonlines"}
+                else:
+                    payload = json.dumps(body).encode("utf-8")
+                    headers = {"Content-Type": "application/json"}
+                if etag:
+                    headers["ETag"] = f'"{hashlib.sha1(payload).hexdigest()}"'
+                    if self.headers.get("If-None-Match") == headers["ETag"]:
+                        status, payload = 304, b""
+                if retry_after is not None:
+                    headers["Retry-After"] = str(retry_after)
+                accepted = self.headers.get("Accept-Encoding", "")
+                if server.compress and status != 304 and "gzip" in accepted:
+                    payload = gzip.compress(payload)
+                    headers["Content-Encoding"] = "gzip"
+                server._log(self.path, status)
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                if status != 304:
+                    self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self) -> "StubLobidServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        return f"<StubLobidServer {self.base_url}>"
+
+
+def main(argv: list = None) -> None:
+    """Serve the records of a dump from the command line until interrupted."""
+    parser = argparse.ArgumentParser(
+        prog="python -m pylobid.testing",
+        description="Serve a LOBID-GND JSON-lines dump as a local stub API.",
+    )
+    parser.add_argument("dump", help="path of the .jsonl or .jsonl.gz dump")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--retry-after")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--compress", action="store_true", help="gzip bodies")
+    args = parser.parse_args(argv)
+    server = StubLobidServer.from_dump(
+        args.dump,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        retry_after=args.retry_after,
+        seed=args.seed,
+        compress=args.compress,
+    )
+    with server:
+        print(f"Serving {len(server.entities)} entities at {server.base_url}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
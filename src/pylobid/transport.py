@@ -0,0 +1,425 @@
+"""Pooled HTTP transport shared by all `PyLobidClient` instances."""
+import importlib.util
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import jsonlib
+from .retry import RetryPolicy
+
+DEFAULT_BASE_URL = "http://lobid.org/gnd"
+HTTPS_BASE_URL = "https://lobid.org/gnd"
+
+
+def _accept_encoding() -> str:
+    encodings = ["gzip", "deflate"]
+    if any(importlib.util.find_spec(x) for x in ("brotli", "brotlicffi")):
+        encodings.insert(0, "br")
+    return ", ".join(encodings)
+
+
+# the content codings both requests and httpx decode with the installed packages
+ACCEPT_ENCODING = _accept_encoding()
+
+
+class _TransferStats:
+    """Thread-safe counters of the bytes received by a transport."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.clear()
+
+    def record(self, wire: int, decoded: int, http_version: str) -> None:
+        with self._lock:
+            self.responses += 1
+            self.bytes_on_wire += wire
+            self.bytes_decoded += decoded
+            self.http_versions[http_version] = (
+                self.http_versions.get(http_version, 0) + 1
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self.responses = 0
+            self.bytes_on_wire = 0
+            self.bytes_decoded = 0
+            self.http_versions = {}
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "responses": self.responses,
+                "bytes_on_wire": self.bytes_on_wire,
+                "bytes_decoded": self.bytes_decoded,
+                "compression_ratio": (
+                    self.bytes_on_wire / self.bytes_decoded
+                    if self.bytes_decoded
+                    else 1.0
+                ),
+                "http_versions": dict(self.http_versions),
+            }
+
+
+class PyLobidTransport:
+    """A keep-alive HTTP transport backed by a `requests.Session`.
+
+    One transport holds a connection pool per host, so every client using it
+    reuses already established TCP/TLS connections instead of opening a new
+    one per request.
+
+    :param base_url: The LOBID-GND base URL, defaults to http://lobid.org/gnd
+    :type base_url: str, optional
+    :param pool_connections: Number of per-host connection pools to cache
+    :type pool_connections: int, optional
+    :param pool_maxsize: Maximum number of connections kept open per host
+    :type pool_maxsize: int, optional
+    :param pool_block: Block instead of opening extra connections once \
+    `pool_maxsize` connections to a host are in use
+    :type pool_block: bool, optional
+    :param keep_alive: Keep connections open between requests
+    :type keep_alive: bool, optional
+    :param timeout: Timeout in seconds passed to every request
+    :type timeout: float, optional
+    :param retry: Retry transient errors like 503 or 429 with this policy, \
+    `None` sends every request once
+    :type retry: RetryPolicy, optional
+    :param accept_encoding: The Accept-Encoding header sent with every \
+    request, defaults to the installed decoders, e.g. 'br, gzip, deflate'
+    :type accept_encoding: str, optional
+    """
+
+    http2 = False
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        pool_connections: int = 10,
+        pool_maxsize: int = 32,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        timeout: float = None,
+        retry: RetryPolicy = None,
+        accept_encoding: str = ACCEPT_ENCODING,
+    ) -> None:
+        """Class constructor."""
+        self.base_url = base_url.rstrip("/")
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.retry = retry
+        self.accept_encoding = accept_encoding
+        self._transfer = _TransferStats()
+        self.session = requests.Session()
+        self.session.headers["Accept-Encoding"] = accept_encoding
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request over the pooled session.
+
+        Transient errors are retried if the transport has a retry policy.
+
+        :param url: The URL to fetch
+        :type url: str
+
+        :return: The response
+        :rtype: requests.Response
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        if self.retry is None:
+            response = self.session.get(url, **kwargs)
+        else:
+            response = self.retry.send(lambda: self.session.get(url, **kwargs))
+        if not kwargs.get("stream"):
+            self._transfer.record(
+                response.raw.tell(),
+                len(response.content),
+                f"HTTP/{response.raw.version / 10:.1f}",
+            )
+        return response
+
+    @property
+    def stats(self) -> dict:
+        """Return the bytes received on the wire and after decoding.
+
+        Only responses read in full are counted, not streamed ones.
+        """
+        return self._transfer.snapshot()
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<PyLobidTransport {self.base_url}>"
+
+
+class HTTPXResponse:
+    """A `httpx.Response` offering the `requests.Response` API pylobid uses.
+
+    :param response: The wrapped response
+    :type response: httpx.Response
+    """
+
+    def __init__(self, response) -> None:
+        """Class constructor."""
+        self.response = response
+
+    @property
+    def status_code(self) -> int:
+        """Return the status code."""
+        return self.response.status_code
+
+    @property
+    def ok(self) -> bool:
+        """Return True unless the status code is 400 or above."""
+        return self.response.status_code < 400
+
+    @property
+    def headers(self):
+        """Return the case-insensitive response headers."""
+        return self.response.headers
+
+    @property
+    def content(self) -> bytes:
+        """Return the decoded body."""
+        return self.response.content
+
+    @property
+    def http_version(self) -> str:
+        """Return the negotiated HTTP version, e.g. 'HTTP/2'."""
+        return self.response.http_version
+
+    def json(self):
+        """Decode the JSON body."""
+        return jsonlib.loads(self.response.content)
+
+    def iter_lines(self):
+        """Iterate over the lines of a streamed body."""
+        return self.response.iter_lines()
+
+    def close(self) -> None:
+        """Release the connection of a streamed response."""
+        self.response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<HTTPXResponse [{self.status_code}] {self.http_version}>"
+
+
+def http2_available() -> bool:
+    """Return True if httpx and its HTTP/2 support (h2) are installed."""
+    return all(importlib.util.find_spec(x) is not None for x in ("httpx", "h2"))
+
+
+class HTTP2Transport:
+    """An HTTP/2 transport backed by a `httpx.Client`.
+
+    Concurrent requests, e.g. from the threads of `fetch_many`, are
+    multiplexed as streams over a single connection per host instead of
+    one connection per request in flight. HTTP/2 is negotiated via TLS, so
+    the base URL defaults to https://lobid.org/gnd; servers without HTTP/2
+    are spoken to with HTTP/1.1. Responses offer the `requests.Response`
+    API and httpx errors are raised as `requests` exceptions, so this is a
+    drop-in replacement of `PyLobidTransport`.
+
+    :param base_url: The LOBID-GND base URL, defaults to https://lobid.org/gnd
+    :type base_url: str, optional
+    :param max_connections: Maximum number of connections kept open
+    :type max_connections: int, optional
+    :param timeout: Timeout in seconds passed to every request
+    :type timeout: float, optional
+    :param retry: Retry transient errors like 503 or 429 with this policy, \
+    `None` sends every request once
+    :type retry: RetryPolicy, optional
+    :param accept_encoding: The Accept-Encoding header sent with every \
+    request, defaults to the installed decoders, e.g. 'br, gzip, deflate'
+    :type accept_encoding: str, optional
+    """
+
+    http2 = True
+
+    def __init__(
+        self,
+        base_url: str = HTTPS_BASE_URL,
+        max_connections: int = 10,
+        timeout: float = None,
+        retry: RetryPolicy = None,
+        accept_encoding: str = ACCEPT_ENCODING,
+    ) -> None:
+        """Class constructor."""
+        if not http2_available():
+            raise ModuleNotFoundError(
+                "HTTP2Transport requires httpx with HTTP/2 support, "
+                "install it with `pip install pylobid[http2]`"
+            )
+        import httpx
+
+        self.base_url = base_url.rstrip("/")
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.retry = retry
+        self.accept_encoding = accept_encoding
+        self._transfer = _TransferStats()
+        self.client = httpx.Client(
+            http2=True,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            headers={"Accept-Encoding": accept_encoding},
+        )
+
+    def _send(self, url: str, params: dict, headers: dict, stream: bool):
+        import httpx
+
+        request = self.client.build_request("GET", url, params=params, headers=headers)
+        try:
+            return HTTPXResponse(self.client.send(request, stream=stream))
+        except httpx.TimeoutException as error:
+            raise requests.Timeout(str(error)) from error
+        except httpx.TransportError as error:
+            raise requests.ConnectionError(str(error)) from error
+
+    def get(
+        self, url: str, params: dict = None, headers: dict = None, stream: bool = False
+    ) -> HTTPXResponse:
+        """Send a GET request, multiplexed with the requests in flight.
+
+        Transient errors are retried if the transport has a retry policy.
+
+        :param url: The URL to fetch
+        :type url: str
+        :param params: The query parameters
+        :type params: dict, optional
+        :param headers: Additional request headers
+        :type headers: dict, optional
+        :param stream: Do not read the body yet, e.g. to use `iter_lines()`
+        :type stream: bool, optional
+
+        :raises: requests.ConnectionError, requests.Timeout
+        :return: The response
+        :rtype: HTTPXResponse
+        """
+        if self.retry is None:
+            response = self._send(url, params, headers, stream)
+        else:
+            response = self.retry.send(
+                lambda: self._send(url, params, headers, stream)
+            )
+        if not stream:
+            self._transfer.record(
+                response.response.num_bytes_downloaded,
+                len(response.content),
+                response.http_version,
+            )
+        return response
+
+    @property
+    def stats(self) -> dict:
+        """Return the bytes received on the wire and after decoding.
+
+        Only responses read in full are counted, not streamed ones.
+        """
+        return self._transfer.snapshot()
+
+    def close(self) -> None:
+        """Close all connections."""
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<HTTP2Transport {self.base_url}>"
+
+
+# options of `PyLobidTransport` without a counterpart in `HTTP2Transport`, which
+# multiplexes all requests to a host over one kept-alive connection
+_HTTP1_OPTIONS = ("pool_connections", "pool_block", "keep_alive")
+
+
+def create_transport(
+    http2: bool = True, base_url: str = None, max_connections: int = None, **kwargs
+):
+    """Return an HTTP/2 transport, or a `PyLobidTransport` if unavailable.
+
+    :param http2: use HTTP/2 if httpx and h2 are installed
+    :type http2: bool, optional
+    :param base_url: The LOBID-GND base URL, defaults to https://lobid.org/gnd \
+    for HTTP/2 and http://lobid.org/gnd otherwise
+    :type base_url: str, optional
+    :param max_connections: Maximum number of connections kept open, passed \
+    as `pool_maxsize` to a `PyLobidTransport`
+    :type max_connections: int, optional
+
+    Other keyword arguments, e.g. `timeout` or `retry`, are passed to the
+    transport. The `PyLobidTransport` options `pool_maxsize` (used as
+    `max_connections`), `pool_connections`, `pool_block` and `keep_alive`
+    are accepted for both, so falling back needs no other arguments.
+
+    :return: The transport
+    :rtype: `HTTP2Transport`, `PyLobidTransport`
+    """
+    if max_connections is not None:
+        kwargs["pool_maxsize"] = max_connections
+    if http2 and http2_available():
+        options = {x: y for x, y in kwargs.items() if x not in _HTTP1_OPTIONS}
+        if "pool_maxsize" in options:
+            options["max_connections"] = options.pop("pool_maxsize")
+        return HTTP2Transport(base_url=base_url or HTTPS_BASE_URL, **options)
+    return PyLobidTransport(base_url=base_url or DEFAULT_BASE_URL, **kwargs)
+
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> PyLobidTransport:
+    """Return the process-wide transport, creating it on first use.
+
+    :return: The shared transport
+    :rtype: PyLobidTransport
+    """
+    global _default_transport
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                _default_transport = PyLobidTransport()
+    return _default_transport
+
+
+def set_default_transport(transport: PyLobidTransport) -> None:
+    """Replace the process-wide transport used by clients created afterwards.
+
+    :param transport: The new shared transport, `None` resets to the default
+    :type transport: PyLobidTransport
+    """
+    global _default_transport
+    with _default_transport_lock:
+        _default_transport = transport
@@ -1,4 +1,15 @@
 import re
+from functools import lru_cache
+from typing import Iterable
+
+from jsonpath_ng import parse
+
+REQUIRED_FIELDS = ("id", "gndIdentifier", "type")
+
+WKT_POINT_PATTERN = re.compile(
+    r"^\s*Point\s*\(\s*([+-]?\d+(?:\.\d*)?)\s+([+-]?\d+(?:\.\d*)?)\s*\)\s*$",
+    re.IGNORECASE,
+)
 
 
 def extract_coords(some_str: str) -> list:
@@ -14,3 +25,121 @@ def extract_coords(some_str: str) -> list:
     regex = r"[+|-]\d+(?:\.\d*)?"
     matches = re.findall(regex, some_str, re.MULTILINE)
     return matches
+
+
+@lru_cache(maxsize=None)
+def compile_path(expression: str):
+    """Parse a JSONPath expression once and reuse the result.
+
+    :param expression: A JSONPath expression, e.g. '$..hasGeometry'
+    :type expression: str
+
+    :return: The parsed JSONPath
+    :rtype: jsonpath_ng.JSONPath
+    """
+    return parse(expression)
+
+
+def find_key(data, key: str) -> list:
+    """Find all values of a key in nested JSON data, like `$..key` does.
+
+    :param data: Decoded JSON data
+    :type data: dict, list
+    :param key: The key to look for, e.g. 'hasGeometry'
+    :type key: str
+
+    :return: The matching values in document order
+    :rtype: list
+    """
+    matches = []
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            if key in value:
+                matches.append(value[key])
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+    return matches
+
+
+def project(data: dict, fields: Iterable) -> dict:
+    """Keep only some top-level keys of a LOBID-JSON document.
+
+    The keys in `REQUIRED_FIELDS` are always kept, as clients need them to
+    identify and dispatch an entity. The projection works on the decoded
+    document, so it saves the memory of the dropped keys, not the download
+    or the decoding of the document.
+
+    :param data: A LOBID-JSON document
+    :type data: dict
+    :param fields: The top-level keys to keep, e.g. ['preferredName']
+    :type fields: Iterable
+
+    :return: A new dict with the requested keys present in `data`
+    :rtype: dict
+    """
+    keys = REQUIRED_FIELDS + tuple(x for x in fields if x not in REQUIRED_FIELDS)
+    return {key: data[key] for key in keys if key in data}
+
+
+def parse_wkt_point(wkt: str) -> tuple:
+    """Parse a WKT point into floats.
+
+    :param wkt: A WKT point, e.g. 'Point ( +016.371690 +048.208199 )'
+    :type wkt: str
+
+    :return: A tuple of longitude and latitude like (16.37169, 48.208199), \
+    `None` if `wkt` is not a valid WKT point
+    :rtype: tuple
+    """
+    match = WKT_POINT_PATTERN.match(wkt)
+    if match is None:
+        return None
+    return float(match.group(1)), float(match.group(2))
+
+
+def extract_point(data: dict) -> tuple:
+    """Get the first valid point of the `hasGeometry` values of an entity.
+
+    :param data: A LOBID-JSON document
+    :type data: dict
+
+    :return: A tuple of longitude and latitude, `None` if there is none
+    :rtype: tuple
+    """
+    for geometries in find_key(data, "hasGeometry"):
+        for geometry in geometries if isinstance(geometries, list) else [geometries]:
+            if not isinstance(geometry, dict):
+                continue
+            for wkt in geometry.get("asWKT", []):
+                point = parse_wkt_point(wkt)
+                if point is not None:
+                    return point
+    return None
+
+
+def points_array(points: list) -> tuple:
+    """Stack points into a NumPy array. Requires `numpy`.
+
+    :param points: (longitude, latitude) tuples or `None` for missing points
+    :type points: list
+
+    :return: A (N, 2) float array of longitudes and latitudes (NaN for \
+    missing points) and a boolean (N,) array marking the valid rows
+    :rtype: tuple
+    """
+    try:
+        import numpy as np
+    except ModuleNotFoundError as error:
+        raise ModuleNotFoundError(
+            "points_array requires numpy, install it with `pip install pylobid[numpy]`"
+        ) from error
+    points = list(points)
+    nan = (float("nan"), float("nan"))
+    mask = np.fromiter((point is not None for point in points), bool, len(points))
+    array = np.array(
+        [nan if point is None else point for point in points], dtype=float
+    ).reshape(-1, 2)
+    return array, mask
@@ -1,6 +1,7 @@
 """WTForms GND validator module."""
 
 from typing import Union
+import requests
 import wtforms
 from pylobid import pylobid
 
@@ -27,11 +28,17 @@ class GNDValidator:
         :raises: ValidationError is the GND type does not match the set entity type.
         """
         try:
-            gnd_entity = pylobid.PyLobidClient(field.data).factory()
+            gnd_id = pylobid.PyLobidClient().extract_id(field.data or "")
         except pylobid.GNDIdError as error:
             raise wtforms.validators.ValidationError(
                 f"{field.data} is not a valid GND Id/URL"
             ) from error
+        if not pylobid.is_valid_gnd_id(gnd_id):
+            raise wtforms.validators.ValidationError(
+                f"{field.data} is not a valid GND Id/URL"
+            )
+        try:
+            gnd_entity = pylobid.PyLobidClient(gnd_id).factory()
         except pylobid.GNDNotFoundError as error:
             raise wtforms.validators.ValidationError(error) from error
         if not gnd_entity.ent_type:
@@ -82,3 +89,126 @@ class GNDOrgEntity(GNDValidator):
         """Class constructor."""
         super().__init__(entity_flag="is_org", message=message)
         self.message = message or "The provided GND ID is not an organization entity"
+
+
+class GNDListValidator:
+    """Base class for validators of a `FieldList` of GND IDs.
+
+    All IDs of the list are resolved with one batched lookup (see
+    `PyLobidClient.fetch_many`) instead of one request per entry. Errors are
+    added to the entries they belong to.
+
+    :param: Message to display if an entity type does not match.
+    :param chunk_size: The number of IDs looked up per request
+    :param max_workers: The number of chunks requested in parallel
+    """
+
+    def __init__(
+        self,
+        entity_flag: str = None,
+        message: str = None,
+        chunk_size: int = 100,
+        max_workers: int = 4,
+    ) -> None:
+        """Class constructor."""
+        self.entity_flag = entity_flag
+        self.message = message
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+
+    def __call__(self, form: wtforms.form.Form, field: wtforms.fields.FieldList) -> None:
+        """Class call method.
+
+        :param form: A WTForms Form instance.
+        :param field: A WTForm FieldList instance.
+        """
+        client = pylobid.PyLobidClient()
+        errors = [list(entry.errors) for entry in field.entries]
+        gnd_ids = {}
+        for position, entry in enumerate(field.entries):
+            try:
+                gnd_id = client.extract_id(entry.data or "")
+            except pylobid.GNDIdError:
+                gnd_id = None
+            if gnd_id is None or not pylobid.is_valid_gnd_id(gnd_id):
+                errors[position].append(
+                    f"{entry.data or ''} is not a valid GND Id/URL"
+                )
+            else:
+                gnd_ids[position] = gnd_id
+        try:
+            entities, _ = pylobid.PyLobidClient.fetch_many(
+                list(dict.fromkeys(gnd_ids.values())),
+                chunk_size=self.chunk_size,
+                max_workers=self.max_workers,
+            )
+        except (pylobid.GNDAPIError, requests.RequestException) as error:
+            # e.g. an outage of the LOBID-API, reported for every looked up entry
+            entities, api_error = {}, f"Could not validate the GND Id: {error}"
+        else:
+            api_error = None
+        for position, gnd_id in gnd_ids.items():
+            entity = entities.get(gnd_id)
+            if api_error is not None:
+                errors[position].append(api_error)
+            elif entity is None:
+                errors[position].append(
+                    f'Could not find a GND Entity for ID "{gnd_id}"'
+                )
+            elif not entity.ent_type:
+                errors[position].append(f"Unknown GND type for {entity.gnd_url}")
+            elif self.entity_flag is not None and not getattr(
+                entity, self.entity_flag, False
+            ):
+                errors[position].append(
+                    self.message or f"Entity type {entity.ent_type}"
+                )
+        if any(errors):
+            for entry, entry_errors in zip(field.entries, errors):
+                entry.errors = entry_errors
+            field.errors = errors
+
+
+class GNDPlaceEntityList(GNDListValidator):
+    """List validator class for place entities.
+
+    :param: Message to display if validation fails.
+    """
+
+    def __init__(self, message: str = None, **kwargs) -> None:
+        """Class constructor."""
+        super().__init__(
+            entity_flag="is_place",
+            message=message or "The provided GND ID is not a place entity",
+            **kwargs,
+        )
+
+
+class GNDPersonEntityList(GNDListValidator):
+    """List validator class for person entities.
+
+    :param: Message to display if validation fails.
+    """
+
+    def __init__(self, message: str = None, **kwargs) -> None:
+        """Class constructor."""
+        super().__init__(
+            entity_flag="is_person",
+            message=message or "The provided GND ID is not a person entity",
+            **kwargs,
+        )
+
+
+class GNDOrgEntityList(GNDListValidator):
+    """List validator for org. entities.
+
+    :param: Message to display if validation fails.
+    """
+
+    def __init__(self, message: str = None, **kwargs) -> None:
+        """Class constructor."""
+        super().__init__(
+            entity_flag="is_org",
+            message=message or "The provided GND ID is not an organization entity",
+            **kwargs,
+        )
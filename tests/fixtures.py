@@ -1,3 +1,12 @@
+import json
+import unittest
+
+import requests
+
+from pylobid import cache
+from pylobid.testing import StubLobidServer
+from pylobid.transport import PyLobidTransport
+
 TEST_PERSON_DICTS = [
     {
         "id": "http://d-nb.info/gnd/119315122",
@@ -240,3 +249,191 @@ TEST_WORK_FIXTURES = [
         "",
     ],
 ]
+
+
+def _same_as(gnd_id, *others):
+    same_as = [
+        {
+            "collection": {
+                "abbr": "DNB",
+                "name": "Gemeinsame Normdatei (GND) im Katalog der Deutschen Nationalbibliothek",
+                "publisher": "Deutsche Nationalbibliothek",
+                "id": "http://www.wikidata.org/entity/Q27302",
+            },
+            "id": f"https://d-nb.info/gnd/{gnd_id}/about",
+        }
+    ]
+    for abbr, uri in others:
+        same_as.append({"collection": {"abbr": abbr, "id": uri}, "id": uri})
+    return same_as
+
+
+TEST_ENTITY_JSON = [
+    {
+        "id": "https://d-nb.info/gnd/4066009-6",
+        "gndIdentifier": "4066009-6",
+        "preferredName": "Wien",
+        "variantName": ["Vienna", "Wenen", "Vindobona", "Bécs"],
+        "type": [
+            "TerritorialCorporateBodyOrAdministrativeUnit",
+            "AuthorityResource",
+            "PlaceOrGeographicName",
+        ],
+        "hasGeometry": [
+            {"type": "Point", "asWKT": ["Point ( +016.371690 +048.208199 )"]}
+        ],
+        "sameAs": _same_as(
+            "4066009-6",
+            ("WIKIDATA", "http://www.wikidata.org/entity/Q1741"),
+            ("GeoNames", "https://sws.geonames.org/2761369"),
+        ),
+    },
+    {
+        "id": "https://d-nb.info/gnd/4004168-2",
+        "gndIdentifier": "4004168-2",
+        "preferredName": "Baden (Niederösterreich)",
+        "variantName": [
+            "Baden (Wienerwald)",
+            "Baden bei Wien",
+            "Stadtgemeinde Baden",
+            "Stadtgemeinde Baden bei Wien",
+        ],
+        "type": [
+            "TerritorialCorporateBodyOrAdministrativeUnit",
+            "AuthorityResource",
+            "PlaceOrGeographicName",
+        ],
+        "hasGeometry": [
+            {"type": "Point", "asWKT": ["Point ( +016.233330 +048.008330 )"]}
+        ],
+        "sameAs": _same_as(
+            "4004168-2",
+            ("GeoNames", "https://sws.geonames.org/2782067"),
+        ),
+    },
+    {
+        "id": "https://d-nb.info/gnd/4051434-1",
+        "gndIdentifier": "4051434-1",
+        "preferredName": "Salzburg",
+        "variantName": ["Stadt Salzburg", "Iuvavum"],
+        "type": [
+            "TerritorialCorporateBodyOrAdministrativeUnit",
+            "AuthorityResource",
+            "PlaceOrGeographicName",
+        ],
+        "hasGeometry": [
+            {"type": "Point", "asWKT": ["Point ( +013.043990 +047.799410 )"]}
+        ],
+        "sameAs": _same_as("4051434-1"),
+    },
+    {
+        "id": "https://d-nb.info/gnd/118610961",
+        "gndIdentifier": "118610961",
+        "preferredName": "Schubert, Franz",
+        "variantName": ["Schubert, Franz Peter", "Schubert, Franz Seraph Peter"],
+        "type": ["Person", "DifferentiatedPerson", "AuthorityResource"],
+        "dateOfBirth": ["1797-01-31"],
+        "dateOfDeath": ["1828-11-19"],
+        "placeOfBirth": [{"id": "https://d-nb.info/gnd/4066009-6", "label": "Wien"}],
+        "placeOfDeath": [{"id": "https://d-nb.info/gnd/4066009-6", "label": "Wien"}],
+        "sameAs": _same_as(
+            "118610961", ("VIAF", "http://viaf.org/viaf/44300127")
+        ),
+    },
+    {
+        "id": "https://d-nb.info/gnd/118584596",
+        "gndIdentifier": "118584596",
+        "preferredName": "Mozart, Wolfgang Amadeus",
+        "variantName": ["Mozart, Wolfgang Amadé", "Mozart, Joannes Chrysostomus"],
+        "type": ["Person", "DifferentiatedPerson", "AuthorityResource"],
+        "dateOfBirth": ["1756-01-27"],
+        "dateOfDeath": ["1791-12-05"],
+        "placeOfBirth": [
+            {"id": "https://d-nb.info/gnd/4051434-1", "label": "Salzburg"}
+        ],
+        "placeOfDeath": [{"id": "https://d-nb.info/gnd/4066009-6", "label": "Wien"}],
+        "sameAs": _same_as("118584596", ("VIAF", "http://viaf.org/viaf/32197206")),
+    },
+    {
+        "id": "https://d-nb.info/gnd/600902-5",
+        "gndIdentifier": "600902-5",
+        "preferredName": "Akademisches Gymnasium (Wien)",
+        "variantName": ["Akademisches Gymnasium Wien"],
+        "type": ["CorporateBody", "AuthorityResource"],
+        "placeOfBusiness": [{"id": "https://d-nb.info/gnd/4066009-6", "label": "Wien"}],
+        "sameAs": _same_as("600902-5"),
+    },
+    {
+        "id": "https://d-nb.info/gnd/300109849",
+        "gndIdentifier": "300109849",
+        "preferredName": "Le nozze di Figaro",
+        "variantName": ["Die Hochzeit des Figaro"],
+        "type": ["Work", "MusicalWork", "AuthorityResource"],
+        "firstComposer": [
+            {
+                "id": "https://d-nb.info/gnd/118584596",
+                "label": "Mozart, Wolfgang Amadeus",
+            }
+        ],
+        "librettist": [
+            {"id": "https://d-nb.info/gnd/118678841", "label": "Da Ponte, Lorenzo"}
+        ],
+        "dateOfProduction": ["1786"],
+        "dateOfPublication": ["1786"],
+        "sameAs": _same_as("300109849"),
+    },
+]
+
+ENTITIES = {item["gndIdentifier"]: item for item in TEST_ENTITY_JSON}
+
+
+class RecordingTransport(PyLobidTransport):
+    """Transport answering from `TEST_ENTITY_JSON` and recording the URLs."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.urls = []
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        self.urls.append(url)
+        response = requests.Response()
+        gnd_id = url.rsplit("/", 1)[-1]
+        if gnd_id in ENTITIES:
+            response.status_code = 200
+            response._content = json.dumps(ENTITIES[gnd_id]).encode()
+        else:
+            response.status_code = 404
+            response._content = b"{}"
+        return response
+
+
+class StubServerTestCase(unittest.TestCase):
+    """Base class serving `TEST_ENTITY_JSON` from a local stub server.
+
+    Every test gets a fresh default cache built by `entity_cache` (`None`
+    disables caching), a started `StubLobidServer` for `entities` with
+    `server_options` as `self.server` and a `transport_class` instance for
+    it as `self.transport`.
+    """
+
+    entities = TEST_ENTITY_JSON
+    server_options = {}
+    entity_cache = cache.EntityCache
+    transport_class = PyLobidTransport
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.swap_default_cache(self.entity_cache and self.entity_cache())
+        self.server = self.serve(**self.server_options)
+        self.transport = self.transport_class(base_url=self.server.base_url)
+        self.addCleanup(self.transport.close)
+
+    def swap_default_cache(self, entity_cache) -> None:
+        self.addCleanup(cache.set_default_cache, cache.get_default_cache())
+        cache.set_default_cache(entity_cache)
+
+    def serve(self, entities: list = None, **options) -> StubLobidServer:
+        entities = self.entities if entities is None else entities
+        server = StubLobidServer(entities, **options).start()
+        self.addCleanup(server.stop)
+        return server
@@ -16,6 +16,7 @@ from tests.fixtures import (
     TEST_PERSON_DICTS,
     TEST_UNKNOWN_IDS,
     TEST_WORK_FIXTURES,
+    TEST_ENTITY_JSON,
 )
 
 BADEN_ALT_NAMES = [
@@ -35,6 +36,63 @@ class TestUtilsFunctions(unittest.TestCase):
             self.assertEqual(points[0], item[1][0], f"should be {item[0][0]}")
             self.assertEqual(points[1], item[1][1], f"should be {item[1][1]}")
 
+    def test_001_find_key(self):
+        person = dict(TEST_ENTITY_JSON[4], pylobid_born=TEST_ENTITY_JSON[2])
+        nested = {"a": [{"hasGeometry": 1}, {"b": {"hasGeometry": [2]}}], "hasGeometry": 0}
+        for data in TEST_ENTITY_JSON + [person, nested, [], {}]:
+            with self.subTest(data=data):
+                xpath = utils.compile_path("$..hasGeometry")
+                self.assertEqual(
+                    utils.find_key(data, "hasGeometry"),
+                    [match.value for match in xpath.find(data)],
+                )
+
+    def test_002_compile_path(self):
+        self.assertIs(
+            utils.compile_path("$.variantName"), utils.compile_path("$.variantName")
+        )
+
+
+class TestGndIdValidation(unittest.TestCase):
+    """Tests for `pylobid.is_valid_gnd_id`."""
+
+    VALID = [
+        "118650130",
+        "116616103X",
+        "1069009253",
+        "4066009-6",
+        "600902-5",
+        "16254097-8",
+        "300109849",
+        "80092-2",
+    ]
+    INVALID = [
+        "118650131",
+        "116616103x",
+        "4066009-7",
+        "01234-4321",
+        "0123abc-0123def",
+        "2118650130",
+        "1234",
+        "",
+        None,
+        118650130,
+    ]
+
+    def test_001_is_valid_gnd_id(self):
+        for gnd_id in self.VALID:
+            with self.subTest(gnd_id=gnd_id):
+                self.assertTrue(pl.is_valid_gnd_id(gnd_id))
+        for gnd_id in self.INVALID:
+            with self.subTest(gnd_id=gnd_id):
+                self.assertFalse(pl.is_valid_gnd_id(gnd_id))
+
+    def test_002_are_valid_gnd_ids(self):
+        self.assertEqual(
+            pl.are_valid_gnd_ids(iter(self.VALID + self.INVALID)),
+            [True] * len(self.VALID) + [False] * len(self.INVALID),
+        )
+
 
 class TestPylobidPlace(unittest.TestCase):
     """Tests for `pylobid` package."""
@@ -144,7 +202,7 @@ class TestPylobidClient(unittest.TestCase):
     def test_008_unknown_ids(self):
         for gnd_id in TEST_UNKNOWN_IDS:
             with self.subTest(gnd_id=gnd_id):
-                with self.assertRaises(pl.GNDNotFoundError):
+                with self.assertRaises(pl.GNDIdError):
                     _ = pl.PyLobidClient(gnd_id)
 
 
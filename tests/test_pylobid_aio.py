@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""Tests for `pylobid.aio` module."""
+
+import unittest
+
+from pylobid import pylobid as pl
+from pylobid.testing import StubLobidServer
+from tests.fixtures import TEST_ENTITY_JSON
+
+try:
+    import httpx
+except ModuleNotFoundError:
+    httpx = None
+else:
+    from pylobid import aio
+
+
+class TestAsyncPyLobidClient(unittest.IsolatedAsyncioTestCase):
+    """Tests for `pylobid.aio.AsyncPyLobidClient`."""
+
+    def setUp(self) -> None:
+        if not httpx:
+            self.skipTest("httpx not installed")
+        self.server = StubLobidServer(TEST_ENTITY_JSON).start()
+        self.addCleanup(self.server.stop)
+
+    async def test_001_get(self):
+        async with aio.AsyncPyLobidClient(base_url=self.server.base_url) as client:
+            place = await client.get("https://d-nb.info/gnd/4066009-6")
+            work = await client.get("300109849")
+        self.assertIsInstance(place, pl.PyLobidPlace)
+        self.assertEqual(place.coords, ["+016.371690", "+048.208199"])
+        self.assertIsInstance(work, pl.PyLobidWork)
+
+    async def test_002_fetch_related(self):
+        async with aio.AsyncPyLobidClient(
+            base_url=self.server.base_url, fetch_related=True
+        ) as client:
+            person = await client.get("118584596")
+        self.assertIsInstance(person, pl.PyLobidPerson)
+        self.assertEqual(person.ent_dict["pylobid_born"]["preferredName"], "Salzburg")
+        self.assertEqual(person.death_place["coords"], ["+016.371690", "+048.208199"])
+        self.assertEqual(len(self.server.request_log), 3)
+
+    async def test_003_not_found(self):
+        async with aio.AsyncPyLobidClient(base_url=self.server.base_url) as client:
+            with self.assertRaises(pl.GNDNotFoundError):
+                await client.get("1000000001")
+            for gnd_id in ["?!invalid_id", "01234-4321"]:
+                with self.assertRaises(pl.GNDIdError):
+                    await client.get(gnd_id)
+
+    async def test_004_resolve_many(self):
+        ids = [item["id"] for item in TEST_ENTITY_JSON]
+        async with aio.AsyncPyLobidClient(
+            base_url=self.server.base_url, max_concurrency=2
+        ) as client:
+            entities = [entity async for entity in client.resolve_many(ids)]
+        self.assertEqual(
+            sorted(entity.gnd_id for entity in entities),
+            sorted(item["gndIdentifier"] for item in TEST_ENTITY_JSON),
+        )
+
+    async def test_005_resolve_many_exceptions(self):
+        ids = ["4066009-6", "1000000001"]
+        async with aio.AsyncPyLobidClient(base_url=self.server.base_url) as client:
+            results = [
+                item async for item in client.resolve_many(ids, return_exceptions=True)
+            ]
+            with self.assertRaises(pl.GNDNotFoundError):
+                _ = [item async for item in client.resolve_many(ids)]
+        self.assertEqual(len(results), 2)
+        self.assertTrue(any(isinstance(x, pl.GNDNotFoundError) for x in results))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""Tests for `pylobid.autocomplete` module."""
+
+import os
+import tempfile
+import unittest
+
+from pylobid import autocomplete
+from pylobid import pylobid as pl
+from pylobid import records
+from tests.fixtures import TEST_ENTITY_JSON
+from tests.test_pylobid_dump import write_dump
+
+
+class TestNameIndex(unittest.TestCase):
+    """Tests for `pylobid.autocomplete.NameIndex`."""
+
+    def setUp(self) -> None:
+        self.index = autocomplete.NameIndex(TEST_ENTITY_JSON)
+
+    def test_001_normalize(self):
+        self.assertEqual(
+            autocomplete.normalize("Baden (Niederösterreich)"),
+            "baden niederosterreich",
+        )
+        self.assertEqual(autocomplete.normalize("  Mozart,  W. A."), "mozart w a")
+
+    def test_002_complete(self):
+        self.assertEqual(self.index.complete("wie"), ["4066009-6"])
+        self.assertEqual(self.index.complete("Vienna"), ["4066009-6"])
+        self.assertEqual(self.index.complete("baden nieder"), ["4004168-2"])
+        self.assertEqual(self.index.complete("MOZART, W"), ["118584596"])
+        self.assertEqual(self.index.complete("zzz"), [])
+        self.assertEqual(self.index.complete(" "), [])
+
+    def test_003_types_and_limit(self):
+        ids = self.index.complete("a", limit=None)
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(self.index.complete("akademisches", types=["Person"]), [])
+        self.assertEqual(
+            self.index.complete("akademisches", types=["CorporateBody"]),
+            ["600902-5"],
+        )
+        self.assertEqual(self.index.complete("s", types=["Unknown"]), [])
+        self.assertEqual(len(self.index.complete("", limit=None)), 0)
+        self.assertLessEqual(len(self.index.complete("s", limit=1)), 1)
+
+    def test_004_suggest_feeds_client(self):
+        (gnd_id, label), *_ = self.index.suggest("salzb")
+        self.assertEqual(label, "Salzburg")
+        self.assertEqual(pl.PyLobidClient().extract_id(gnd_id), "4051434-1")
+
+    def test_005_entities_and_records(self):
+        entities = []
+        for data in TEST_ENTITY_JSON:
+            entity = pl.PyLobidClient()
+            entity.process_data(data=data)
+            entities.append(entity.factory())
+        for items in [entities, [records.from_json(x) for x in TEST_ENTITY_JSON]]:
+            index = autocomplete.NameIndex(items)
+            self.assertEqual(index.keys, self.index.keys)
+            self.assertEqual(index.complete("s"), self.index.complete("s"))
+
+    def test_006_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "names.idx")
+            self.index.save(path)
+            loaded = autocomplete.NameIndex.load(path)
+            dump_path = write_dump(os.path.join(tmp_dir, "gnd.jsonl"), TEST_ENTITY_JSON)
+            from_dump = autocomplete.NameIndex.from_dump(
+                dump_path, types=["PlaceOrGeographicName"]
+            )
+            with self.assertRaises(ValueError):
+                autocomplete.NameIndex.load(dump_path)
+        self.assertEqual(loaded.keys, self.index.keys)
+        self.assertEqual(list(loaded.entries), list(self.index.entries))
+        self.assertEqual(loaded.labels, self.index.labels)
+        self.assertEqual(
+            loaded.suggest("w", types=["Person"], limit=None),
+            self.index.suggest("w", types=["Person"], limit=None),
+        )
+        self.assertEqual(len(from_dump), 3)
+        self.assertEqual(from_dump.complete("salzburg"), ["4051434-1"])
@@ -0,0 +1,363 @@
+#!/usr/bin/env python
+"""Tests for the batch APIs of `pylobid` package."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pylobid import pylobid as pl
+from pylobid.transport import PyLobidTransport
+from tests.fixtures import TEST_ENTITY_JSON, StubServerTestCase
+
+
+class TestFetchMany(StubServerTestCase):
+    """Tests for `pylobid.PyLobidClient.fetch_many`."""
+
+    def test_001_typed_entities(self):
+        ids = [
+            "https://d-nb.info/gnd/4066009-6",
+            "118610961",
+            "http://d-nb.info/gnd/600902-5",
+            "http://lobid.org/gnd/300109849",
+        ]
+        entities, not_found = pl.PyLobidClient.fetch_many(ids, transport=self.transport)
+        self.assertEqual(not_found, [])
+        self.assertEqual(
+            list(entities), ["4066009-6", "118610961", "600902-5", "300109849"]
+        )
+        self.assertIsInstance(entities["4066009-6"], pl.PyLobidPlace)
+        self.assertIsInstance(entities["118610961"], pl.PyLobidPerson)
+        self.assertIsInstance(entities["600902-5"], pl.PyLobidOrg)
+        self.assertIsInstance(entities["300109849"], pl.PyLobidWork)
+        self.assertEqual(entities["4066009-6"].coords, ["+016.371690", "+048.208199"])
+
+    def test_002_chunks(self):
+        ids = [item["id"] for item in TEST_ENTITY_JSON]
+        entities, _ = pl.PyLobidClient.fetch_many(
+            ids, chunk_size=3, transport=self.transport
+        )
+        self.assertEqual(len(entities), len(TEST_ENTITY_JSON))
+        self.assertEqual(len(self.server.request_log), 3)
+
+    def test_003_not_found_reported(self):
+        ids = ["4066009-6", "01234-4321", "?!invalid_id", "4066009-6"]
+        entities, not_found = pl.PyLobidClient.fetch_many(ids, transport=self.transport)
+        self.assertEqual(list(entities), ["4066009-6"])
+        self.assertEqual(not_found, ["?!invalid_id", "01234-4321"])
+
+    def test_004_untyped_document(self):
+        untyped = {"id": "https://d-nb.info/gnd/118540238", "gndIdentifier": "118540238"}
+        server = self.serve(TEST_ENTITY_JSON + [untyped])
+        with PyLobidTransport(base_url=server.base_url) as transport:
+            entities, not_found = pl.PyLobidClient.fetch_many(
+                ["118540238", "4066009-6"], transport=transport
+            )
+        self.assertEqual(not_found, ["118540238"])
+        self.assertIs(type(entities["118540238"]), pl.PyLobidClient)
+        self.assertEqual(entities["118540238"].ent_type, [])
+        self.assertIsInstance(entities["4066009-6"], pl.PyLobidPlace)
+
+
+class TestFactoryMany(StubServerTestCase):
+    """Tests for `pylobid.factory_many`."""
+
+    def test_001_ordered(self):
+        ids = [item["id"] for item in TEST_ENTITY_JSON] * 3
+        results = list(pl.factory_many(ids, max_workers=2, transport=self.transport))
+        self.assertEqual([item for item, _ in results], ids)
+        for item, entity in results:
+            with self.subTest(gnd_id=item):
+                self.assertEqual(entity.ent_dict["id"], item)
+        self.assertIsInstance(results[0][1], pl.PyLobidPlace)
+        self.assertIsInstance(results[3][1], pl.PyLobidPerson)
+
+    def test_002_unordered(self):
+        ids = [item["id"] for item in TEST_ENTITY_JSON]
+        results = list(
+            pl.factory_many(ids, max_workers=4, ordered=False, transport=self.transport)
+        )
+        self.assertEqual(sorted(item for item, _ in results), sorted(ids))
+
+    def test_003_errors_per_item(self):
+        ids = [
+            "?!invalid_id",
+            "01234-4321",
+            118610961,
+            4066009.6,
+            "1000000001",
+            "4066009-6",
+        ]
+        results = dict(pl.factory_many(ids, transport=self.transport))
+        self.assertIsInstance(results["?!invalid_id"], pl.GNDIdError)
+        self.assertIsInstance(results[118610961], pl.GNDIdError)
+        self.assertIsInstance(results[4066009.6], pl.GNDIdError)
+        self.assertIsInstance(results["01234-4321"], pl.GNDIdError)
+        self.assertIsInstance(results["1000000001"], pl.GNDNotFoundError)
+        self.assertIsInstance(results["4066009-6"], pl.PyLobidPlace)
+
+    def test_004_api_errors_per_item(self):
+        transport = PyLobidTransport(base_url="http://127.0.0.1:9/gnd")
+        self.addCleanup(transport.close)
+        results = list(pl.factory_many(["4066009-6"], transport=transport))
+        self.assertIsInstance(results[0][1], pl.GNDAPIError)
+
+
+class TestLazy(StubServerTestCase):
+    """Tests for lazy clients, `pylobid.ref` and `pylobid.prefetch`."""
+
+    def test_001_deferred_fetch(self):
+        client = pl.PyLobidClient(
+            "https://d-nb.info/gnd/4066009-6", lazy=True, transport=self.transport
+        )
+        self.assertFalse(client.is_loaded)
+        self.assertEqual(client.gnd_id, "4066009-6")
+        self.assertEqual(self.server.request_log, [])
+        self.assertTrue(client.is_place)
+        self.assertTrue(client.is_loaded)
+        self.assertEqual(client.pref_name, "Wien")
+        self.assertEqual(len(self.server.request_log), 1)
+
+    def test_002_invalid_id(self):
+        with self.assertRaises(pl.GNDIdError):
+            pl.ref("?!invalid_id", transport=self.transport)
+
+    def test_003_not_found_on_access(self):
+        client = pl.ref("1000000001", transport=self.transport)
+        for _ in range(2):
+            with self.assertRaises(pl.GNDNotFoundError):
+                _ = client.ent_type
+        self.assertFalse(client.is_loaded)
+
+    def test_004_lazy_person(self):
+        person = pl.PyLobidPerson(
+            "118584596", lazy=True, fetch_related=True, transport=self.transport
+        )
+        self.assertEqual(self.server.request_log, [])
+        self.assertEqual(person.birth_place["name"], "Salzburg")
+        self.assertEqual(person.death_place["coords"], ["+016.371690", "+048.208199"])
+        self.assertIsInstance(
+            pl.ref("118584596", transport=self.transport).factory(), pl.PyLobidPerson
+        )
+        with self.assertRaises(AttributeError):
+            _ = person.no_such_attribute
+
+    def test_005_prefetch(self):
+        handles = [
+            pl.ref(item["id"], transport=self.transport) for item in TEST_ENTITY_JSON
+        ]
+        unknown = pl.ref("01234-4321", transport=self.transport)
+        not_found = pl.prefetch(handles + [unknown], chunk_size=4)
+        self.assertEqual(not_found, [unknown])
+        self.assertEqual(len(self.server.request_log), 2)
+        self.assertTrue(all(handle.is_loaded for handle in handles))
+        self.assertEqual(
+            [handle.pref_name for handle in handles[:2]],
+            ["Wien", "Baden (Niederösterreich)"],
+        )
+        self.assertEqual(len(self.server.request_log), 2)
+        self.assertEqual(pl.prefetch(handles), [])
+
+    def test_006_typed_properties(self):
+        place = pl.ref("4066009-6", transport=self.transport)
+        self.assertEqual(self.server.request_log, [])
+        self.assertEqual(place.coords, ["+016.371690", "+048.208199"])
+        self.assertEqual(place.get_point(), (16.37169, 48.208199))
+        self.assertEqual(len(self.server.request_log), 1)
+        person = pl.ref("118584596", fetch_related=True, transport=self.transport)
+        self.assertEqual(person.birth_place["name"], "Salzburg")
+        self.assertEqual(person.death_place["coords"], ["+016.371690", "+048.208199"])
+        self.assertEqual(person.life_span["birth_date_str"], "1756-01-27")
+        with self.assertRaises(AttributeError):
+            _ = place.birth_place
+        with self.assertRaises(AttributeError):
+            _ = pl.PyLobidClient("4066009-6", transport=self.transport).coords
+
+    def test_007_concurrent_access(self):
+        barrier = threading.Barrier(3)
+        server = self.serve(latency=0.2)
+        with PyLobidTransport(base_url=server.base_url) as transport:
+            place = pl.ref("4066009-6", transport=transport)
+
+            def read():
+                barrier.wait()
+                return place.pref_name, place.coords
+
+            with ThreadPoolExecutor(3) as pool:
+                futures = [pool.submit(read) for _ in range(3)]
+            results = [x.result() for x in futures]
+        self.assertEqual(results, [("Wien", ["+016.371690", "+048.208199"])] * 3)
+        self.assertEqual(server.request_log, ["/gnd/4066009-6"])
+
+
+class TestFetchRelatedPlaces(StubServerTestCase):
+    """Tests for `pylobid.fetch_related_places`."""
+
+    def test_001_fetch_many_related(self):
+        entities, _ = pl.PyLobidClient.fetch_many(
+            ["118610961", "118584596", "4066009-6"],
+            fetch_related=True,
+            transport=self.transport,
+        )
+        self.assertEqual(len(self.server.request_log), 2)
+        self.assertIn("4051434-1", self.server.request_log[1])
+        self.assertNotIn("4066009-6", self.server.request_log[1])
+        schubert, mozart = entities["118610961"], entities["118584596"]
+        self.assertTrue(schubert.fetch_related)
+        self.assertIs(
+            schubert.ent_dict["pylobid_born"], schubert.ent_dict["pylobid_died"]
+        )
+        self.assertEqual(mozart.ent_dict["pylobid_born"]["preferredName"], "Salzburg")
+        self.assertEqual(mozart.birth_place["coords"], ["+013.043990", "+047.799410"])
+        self.assertEqual(mozart.death_place["alt_names"][0], "Vienna")
+
+    def test_002_matches_fetch_related(self):
+        entities, _ = pl.PyLobidClient.fetch_many(
+            ["118584596"], fetch_related=True, transport=self.transport
+        )
+        person = pl.PyLobidPerson(
+            "118584596", fetch_related=True, transport=self.transport, use_cache=False
+        )
+        batch_person = entities["118584596"]
+        self.assertEqual(batch_person.ent_dict, person.ent_dict)
+        self.assertEqual(batch_person.birth_place, person.birth_place)
+        self.assertEqual(batch_person.death_place, person.death_place)
+
+    def test_003_parallel_chunks(self):
+        persons = [
+            pl.PyLobidClient("118610961", transport=self.transport).factory(),
+            pl.PyLobidClient("118584596", transport=self.transport).factory(),
+        ]
+        places = pl.fetch_related_places(persons, chunk_size=1, max_workers=2)
+        self.assertEqual(sorted(places), ["4051434-1", "4066009-6"])
+        self.assertEqual(persons[0].birth_place["name"], "Wien")
+
+    def test_004_distinct_places(self):
+        entities, _ = pl.PyLobidClient.fetch_many(
+            ["118610961", "118584596"], fetch_related=True, transport=self.transport
+        )
+        self.assertEqual(len(self.server.request_log), 2)
+        self.assertEqual(self.server.request_log[1].count("4066009-6"), 1)
+
+
+class TestFields(StubServerTestCase):
+    """Tests for the `fields` projection of `pylobid.PyLobidClient`."""
+
+    FIELDS = ["preferredName", "variantName", "sameAs", "hasGeometry"]
+
+    def test_001_projection(self):
+        place = pl.PyLobidClient(
+            "4066009-6", transport=self.transport, fields=self.FIELDS
+        ).factory()
+        self.assertIsInstance(place, pl.PyLobidPlace)
+        self.assertEqual(
+            set(place.ent_dict),
+            {"id", "gndIdentifier", "type"} | set(self.FIELDS),
+        )
+        self.assertEqual(place.coords, ["+016.371690", "+048.208199"])
+        self.assertEqual(place.pref_name, "Wien")
+        self.assertEqual(place.alt_names[0], "Vienna")
+        self.assertTrue(place.same_as)
+
+    def test_002_cache_keeps_full_document(self):
+        pl.PyLobidClient("4066009-6", transport=self.transport, fields=["type"])
+        place = pl.PyLobidClient("4066009-6", transport=self.transport)
+        self.assertEqual(place.ent_dict, TEST_ENTITY_JSON[0])
+        self.assertEqual(len(self.server.request_log), 1)
+
+    def test_003_related_places(self):
+        person = pl.PyLobidPerson(
+            "118584596",
+            fetch_related=True,
+            transport=self.transport,
+            fields=["placeOfBirth", "placeOfDeath", "hasGeometry"],
+        )
+        self.assertEqual(person.birth_place["name"], "Salzburg")
+        self.assertEqual(person.birth_place["coords"], ["+013.043990", "+047.799410"])
+        self.assertEqual(person.birth_place["alt_names"], [])
+        self.assertEqual(person.pref_name, "")
+
+    def test_004_fetch_many_and_search(self):
+        expected = {
+            "id": "https://d-nb.info/gnd/300109849",
+            "gndIdentifier": "300109849",
+            "type": TEST_ENTITY_JSON[6]["type"],
+            "preferredName": "Le nozze di Figaro",
+        }
+        client = pl.PyLobidClient(transport=self.transport, fields=["preferredName"])
+        found = client.get_entities_json(["4066009-6", "300109849"])
+        self.assertEqual(found["300109849"], expected)
+        entities, _ = pl.PyLobidClient.fetch_many(
+            ["4066009-6", "300109849"],
+            transport=self.transport,
+            fields=["preferredName"],
+        )
+        self.assertEqual(entities["300109849"].ent_dict, expected)
+        self.assertIsInstance(entities["300109849"], pl.PyLobidWork)
+        works = list(
+            pl.PyLobidClient.search(
+                "Figaro", transport=self.transport, fields=["preferredName"]
+            )
+        )
+        self.assertEqual([x.ent_dict for x in works], [expected])
+        entities, _ = pl.PyLobidClient.fetch_many(
+            ["300109849"], transport=self.transport
+        )
+        self.assertEqual(entities["300109849"].ent_dict, TEST_ENTITY_JSON[6])
+
+    def test_005_fetch_many_related(self):
+        entities, _ = pl.PyLobidClient.fetch_many(
+            ["118584596"],
+            fetch_related=True,
+            transport=self.transport,
+            fields=["placeOfBirth", "placeOfDeath", "hasGeometry"],
+        )
+        person = entities["118584596"]
+        self.assertEqual(person.pref_name, "")
+        self.assertEqual(person.birth_place["name"], "Salzburg")
+        self.assertEqual(person.birth_place["coords"], ["+013.043990", "+047.799410"])
+        self.assertEqual(person.birth_place["alt_names"], [])
+
+
+class TestSearch(StubServerTestCase):
+    """Tests for `pylobid.PyLobidClient.search`."""
+
+    def test_001_jsonl(self):
+        entities = list(pl.PyLobidClient.search("*", transport=self.transport))
+        self.assertEqual(len(entities), len(TEST_ENTITY_JSON))
+        self.assertIsInstance(entities[0], pl.PyLobidPlace)
+        self.assertIsInstance(entities[-1], pl.PyLobidWork)
+        self.assertEqual(len(self.server.request_log), 1)
+        self.assertIn("format=jsonl", self.server.request_log[0])
+
+    def test_002_filter_and_types(self):
+        places = pl.PyLobidClient.search(
+            "*", types=["PlaceOrGeographicName"], transport=self.transport
+        )
+        self.assertEqual(
+            [x.pref_name for x in places],
+            ["Wien", "Baden (Niederösterreich)", "Salzburg"],
+        )
+        entities = pl.PyLobidClient.search(
+            "wien", filter="type:CorporateBody", transport=self.transport
+        )
+        self.assertEqual([x.gnd_id for x in entities], ["600902-5"])
+
+    def test_003_limit(self):
+        results = pl.PyLobidClient.search("*", limit=2, transport=self.transport)
+        self.assertEqual([x.gnd_id for x in results], ["4066009-6", "4004168-2"])
+        self.assertEqual(list(pl.PyLobidClient.search("*", limit=0)), [])
+
+    def test_004_paging_fallback(self):
+        server = self.serve(jsonl=False)
+        transport = PyLobidTransport(base_url=server.base_url)
+        self.addCleanup(transport.close)
+        results = pl.PyLobidClient.search(
+            "*", page_size=3, limit=5, transport=transport
+        )
+        self.assertEqual(len(list(results)), 5)
+        self.assertEqual(server.status_log, [400, 200, 200])
+        self.assertIn("size=2", server.request_log[-1])
+        results = pl.PyLobidClient.search(
+            "*", page_size=3, stream=False, transport=self.transport
+        )
+        self.assertEqual(len(list(results)), len(TEST_ENTITY_JSON))
+        self.assertEqual(len(self.server.request_log), 3)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+"""Tests for `pylobid.cache` module."""
+
+import os
+import tempfile
+import time
+import unittest
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from pylobid import cache
+from pylobid import pylobid as pl
+from tests.fixtures import TEST_ENTITY_JSON, StubServerTestCase
+
+
+class TestEntityCache(unittest.TestCase):
+    """Tests for `pylobid.cache.EntityCache`."""
+
+    def test_001_get_set(self):
+        entity_cache = cache.EntityCache()
+        self.assertIsNone(entity_cache.get("4066009-6"))
+        entity_cache.set("4066009-6", TEST_ENTITY_JSON[0])
+        self.assertEqual(entity_cache.get("4066009-6"), TEST_ENTITY_JSON[0])
+        self.assertEqual(entity_cache.stats["hits"], 1)
+        self.assertEqual(entity_cache.stats["misses"], 1)
+        self.assertEqual(entity_cache.stats["hit_ratio"], 0.5)
+
+    def test_002_copies(self):
+        entity_cache = cache.EntityCache()
+        entity_cache.set("4066009-6", TEST_ENTITY_JSON[0])
+        data = entity_cache.get("4066009-6")
+        data["variantName"].append("Wean")
+        data["pylobid_born"] = {}
+        self.assertEqual(entity_cache.get("4066009-6"), TEST_ENTITY_JSON[0])
+
+    def test_003_lru_eviction(self):
+        entity_cache = cache.EntityCache(maxsize=2)
+        entity_cache.set("a", {"id": "a"})
+        entity_cache.set("b", {"id": "b"})
+        entity_cache.get("a")
+        entity_cache.set("c", {"id": "c"})
+        self.assertIsNone(entity_cache.get("b"))
+        self.assertEqual(entity_cache.get("a"), {"id": "a"})
+        self.assertEqual(entity_cache.stats["evictions"], 1)
+
+    def test_004_ttl(self):
+        entity_cache = cache.EntityCache(ttl=0.01)
+        entity_cache.set("a", {"id": "a"})
+        time.sleep(0.02)
+        self.assertIsNone(entity_cache.get("a"))
+        self.assertEqual(entity_cache.stats["expirations"], 1)
+        self.assertEqual(len(entity_cache), 0)
+
+
+class TestClientCache(StubServerTestCase):
+    """Tests for the entity cache of `pylobid.PyLobidClient`."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache = cache.EntityCache()
+
+    def test_001_related_places_cached(self):
+        for gnd_id in ["118610961", "118584596"]:
+            pl.PyLobidPerson(
+                gnd_id, fetch_related=True, transport=self.transport, cache=self.cache
+            )
+        paths = [path.rsplit("/", 1)[-1] for path in self.server.request_log]
+        self.assertEqual(paths.count("4066009-6"), 1)
+        self.assertEqual(self.cache.stats["hits"], 1)
+
+    def test_002_keyed_by_normalized_id(self):
+        for gnd_id in ["4066009-6", "https://d-nb.info/gnd/4066009-6"]:
+            place = pl.PyLobidPlace(gnd_id, transport=self.transport, cache=self.cache)
+            self.assertEqual(place.pref_name, "Wien")
+        self.assertEqual(len(self.server.request_log), 1)
+
+    def test_003_opt_out(self):
+        client = pl.PyLobidClient(
+            "4066009-6", transport=self.transport, cache=self.cache, use_cache=False
+        )
+        self.assertEqual(len(self.cache), 0)
+        client.get_entity_json(use_cache=True)
+        client.get_entity_json()
+        client.get_entity_json("4066009-6", use_cache=True)
+        self.assertEqual(len(self.server.request_log), 3)
+        self.assertEqual(self.cache.stats["hits"], 1)
+
+    def test_004_factory_shares_cache(self):
+        client = pl.PyLobidClient(
+            "118610961", fetch_related=True, transport=self.transport, cache=self.cache
+        )
+        person = client.factory()
+        self.assertIs(person.cache, self.cache)
+        self.assertEqual(person.birth_place["coords"], ["+016.371690", "+048.208199"])
+        self.assertEqual(len(self.server.request_log), 2)
+
+
+class TestSQLiteEntityCache(StubServerTestCase):
+    """Tests for `pylobid.cache.SQLiteEntityCache`."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, "gnd.sqlite")
+
+    def open_cache(self, **kwargs):
+        sqlite_cache = cache.SQLiteEntityCache(self.path, **kwargs)
+        self.addCleanup(sqlite_cache.close)
+        return sqlite_cache
+
+    def test_001_persistent(self):
+        pl.PyLobidPlace("4066009-6", transport=self.transport, cache=self.open_cache())
+        sqlite_cache = self.open_cache()
+        place = pl.PyLobidPlace(
+            "4066009-6", transport=self.transport, cache=sqlite_cache
+        )
+        self.assertEqual(place.ent_dict, TEST_ENTITY_JSON[0])
+        self.assertEqual(len(self.server.request_log), 1)
+        self.assertEqual(sqlite_cache.stats["hits"], 1)
+
+    def test_002_compressed(self):
+        sqlite_cache = self.open_cache()
+        sqlite_cache.set("4066009-6", TEST_ENTITY_JSON[0])
+        payload = sqlite_cache.connection.execute(
+            "SELECT data FROM entities WHERE gnd_id = ?", ("4066009-6",)
+        ).fetchone()[0]
+        self.assertEqual(zlib.decompress(payload)[:1], b"{")
+        self.assertEqual(sqlite_cache.get("4066009-6"), TEST_ENTITY_JSON[0])
+
+    def test_003_revalidation(self):
+        sqlite_cache = self.open_cache(ttl=0)
+        for _ in range(3):
+            place = pl.PyLobidPlace(
+                "4066009-6", transport=self.transport, cache=sqlite_cache
+            )
+            self.assertEqual(place.pref_name, "Wien")
+        self.assertEqual(self.server.status_log, [200, 304, 304])
+        self.assertEqual(sqlite_cache.stats["expirations"], 2)
+
+    def test_004_revalidation_in_memory(self):
+        entity_cache = cache.EntityCache(ttl=0)
+        for _ in range(2):
+            pl.PyLobidPlace("4066009-6", transport=self.transport, cache=entity_cache)
+        self.assertEqual(self.server.status_log, [200, 304])
+
+    def test_005_threads(self):
+        sqlite_cache = self.open_cache()
+        ids = [item["id"] for item in TEST_ENTITY_JSON] * 4
+
+        def fetch(gnd_id):
+            client = pl.PyLobidClient(transport=self.transport, cache=sqlite_cache)
+            return client.get_entity_json(gnd_id)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(fetch, ids))
+        self.assertEqual([item["id"] for item in results], ids)
+        self.assertEqual(len(self.open_cache()), len(TEST_ENTITY_JSON))
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""Tests for the float coordinate API of `pylobid` package."""
+
+import math
+import unittest
+
+from pylobid import pylobid as pl
+from pylobid import utils
+from tests.fixtures import TEST_ENTITY_JSON, TEST_STRINGS_WKT
+
+try:
+    import numpy
+except ModuleNotFoundError:
+    numpy = None
+
+ENTITIES = {item["gndIdentifier"]: item for item in TEST_ENTITY_JSON}
+
+
+def entity(cls, gnd_id, **kwargs):
+    item = cls(**kwargs)
+    item.process_data(data=dict(ENTITIES[gnd_id]))
+    return item
+
+
+class TestWKTPoints(unittest.TestCase):
+    """Tests for `pylobid.utils.parse_wkt_point`."""
+
+    def test_001_parse_wkt_point(self):
+        self.assertEqual(
+            utils.parse_wkt_point("Point ( +016.371690 +048.208199 )"),
+            (16.37169, 48.208199),
+        )
+        self.assertEqual(utils.parse_wkt_point("POINT(-23.5 38)"), (-23.5, 38.0))
+
+    def test_002_invalid_wkt(self):
+        for wkt in ["", "Point ( +016.371690 )", "LINESTRING (1 2, 3 4)"]:
+            with self.subTest(wkt=wkt):
+                self.assertIsNone(utils.parse_wkt_point(wkt))
+        self.assertIsNone(utils.parse_wkt_point(TEST_STRINGS_WKT[1][0]))
+
+    def test_003_matches_string_coords(self):
+        for item in TEST_ENTITY_JSON:
+            with self.subTest(gnd_id=item["id"]):
+                place = entity(pl.PyLobidPlace, item["gndIdentifier"])
+                point = place.point
+                if point is None:
+                    self.assertEqual(place.coords, [])
+                else:
+                    self.assertEqual(list(point), [float(x) for x in place.coords])
+
+
+class TestEntityPoints(unittest.TestCase):
+    """Tests for `get_point` of places and persons."""
+
+    def test_001_place_point(self):
+        place = entity(pl.PyLobidPlace, "4066009-6")
+        self.assertEqual(place.point, (16.37169, 48.208199))
+        self.assertIsNone(entity(pl.PyLobidPlace, "600902-5").point)
+
+    def test_002_person_point(self):
+        person = entity(pl.PyLobidPerson, "118584596")
+        self.assertIsNone(person.get_point())
+        person.set_related_places(born=ENTITIES["4051434-1"], died=ENTITIES["4066009-6"])
+        self.assertEqual(person.get_point(), (13.04399, 47.79941))
+        self.assertEqual(person.get_point(place_of="Death"), (16.37169, 48.208199))
+
+
+class TestCoordsArray(unittest.TestCase):
+    """Tests for `pylobid.coords_array`."""
+
+    def setUp(self) -> None:
+        if not numpy:
+            self.skipTest("numpy not installed")
+
+    def test_001_coords_array(self):
+        person = entity(pl.PyLobidPerson, "118584596")
+        person.set_related_places(born=ENTITIES["4051434-1"], died=ENTITIES["4066009-6"])
+        items = [
+            entity(pl.PyLobidPlace, "4066009-6"),
+            ENTITIES["4004168-2"],
+            ENTITIES["600902-5"],
+            person,
+        ]
+        array, mask = pl.coords_array(items)
+        self.assertEqual(array.shape, (4, 2))
+        self.assertEqual(array.dtype, numpy.float64)
+        self.assertEqual(mask.tolist(), [True, True, False, True])
+        self.assertEqual(array[0].tolist(), [16.37169, 48.208199])
+        self.assertTrue(all(math.isnan(x) for x in array[2]))
+        self.assertEqual(array[3].tolist(), [13.04399, 47.79941])
+        array, mask = pl.coords_array([person], place_of="Death")
+        self.assertEqual(array[0].tolist(), [16.37169, 48.208199])
+
+    def test_002_empty(self):
+        array, mask = pl.coords_array([])
+        self.assertEqual(array.shape, (0, 2))
+        self.assertEqual(mask.shape, (0,))
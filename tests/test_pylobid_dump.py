@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+"""Tests for `pylobid.dump` module."""
+
+import gzip
+import json
+import os
+import tempfile
+import unittest
+
+from pylobid import dump
+from pylobid import pylobid as pl
+from tests.fixtures import TEST_ENTITY_JSON, StubServerTestCase
+
+
+def write_dump(path, records):
+    lines = []
+    for item in records:
+        lines.append(json.dumps({"index": {"_id": item["id"]}}))
+        lines.append(json.dumps(item, ensure_ascii=False))
+    payload = ("\n".join(lines) + "\n\n").encode("utf-8")
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "wb") as dump_file:
+        dump_file.write(payload)
+    return path
+
+
+class DumpTestCase(unittest.TestCase):
+    """Base class writing `TEST_ENTITY_JSON` to JSON-lines dumps."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.jsonl = write_dump(
+            os.path.join(tmp_dir.name, "gnd.jsonl"), TEST_ENTITY_JSON
+        )
+        self.jsonl_gz = write_dump(
+            os.path.join(tmp_dir.name, "gnd.jsonl.gz"), TEST_ENTITY_JSON
+        )
+
+
+class TestIterDump(DumpTestCase):
+    """Tests for `pylobid.iter_dump`."""
+
+    def test_001_records(self):
+        for path in [self.jsonl, self.jsonl_gz]:
+            with self.subTest(path=path):
+                self.assertEqual(list(dump.iter_records(path)), TEST_ENTITY_JSON)
+
+    def test_002_typed_entities(self):
+        entities = list(pl.iter_dump(self.jsonl_gz))
+        self.assertEqual(
+            [type(x) for x in entities],
+            [
+                pl.PyLobidPlace,
+                pl.PyLobidPlace,
+                pl.PyLobidPlace,
+                pl.PyLobidPerson,
+                pl.PyLobidPerson,
+                pl.PyLobidOrg,
+                pl.PyLobidWork,
+            ],
+        )
+        self.assertEqual(entities[0].coords, ["+016.371690", "+048.208199"])
+        self.assertEqual(entities[3].life_span["birth_date_str"], "1797-01-31")
+
+    def test_003_types(self):
+        persons = list(pl.iter_dump(self.jsonl, types=["Person"]))
+        self.assertEqual([x.gnd_id for x in persons], ["118610961", "118584596"])
+        entities = list(pl.iter_dump(self.jsonl, types={"CorporateBody", "Work"}))
+        self.assertEqual([x.gnd_id for x in entities], ["600902-5", "300109849"])
+
+    def test_004_type_prefilter(self):
+        records = [dict(TEST_ENTITY_JSON[5], note="Person")]
+        write_dump(self.jsonl, records)
+        self.assertEqual(list(dump.iter_records(self.jsonl, types=["Person"])), [])
+
+    def test_005_compact(self):
+        persons = list(pl.iter_dump(self.jsonl_gz, types=["Person"], compact=True))
+        self.assertEqual([type(x).__name__ for x in persons], ["PersonRecord"] * 2)
+        self.assertEqual(persons[1].birth_place["name"], "Salzburg")
+
+    def test_006_untyped_record(self):
+        untyped = {"id": "https://d-nb.info/gnd/118540238", "gndIdentifier": "118540238"}
+        write_dump(self.jsonl, [TEST_ENTITY_JSON[0], untyped, TEST_ENTITY_JSON[3]])
+        entities = list(pl.iter_dump(self.jsonl))
+        self.assertEqual(
+            [type(x) for x in entities],
+            [pl.PyLobidPlace, pl.PyLobidClient, pl.PyLobidPerson],
+        )
+        self.assertEqual(entities[1].gnd_id, "118540238")
+        self.assertEqual(entities[1].ent_type, [])
+        records = list(pl.iter_dump(self.jsonl, compact=True))
+        self.assertEqual(type(records[1]).__name__, "EntityRecord")
+
+
+class TestDumpSource(DumpTestCase, StubServerTestCase):
+    """Tests for `pylobid.dump.build_index` and `pylobid.dump.DumpSource`."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.source = dump.DumpSource(self.jsonl)
+        self.addCleanup(self.source.close)
+
+    def test_001_build_index(self):
+        self.assertTrue(os.path.exists(f"{self.jsonl}.idx"))
+        index_path = dump.build_index(self.jsonl, f"{self.jsonl}.other")
+        with open(index_path, "rb") as index:
+            payload = index.read()
+        self.assertTrue(payload.startswith(dump.INDEX_MAGIC))
+        self.assertEqual(
+            len(payload),
+            len(dump.INDEX_MAGIC) + len(TEST_ENTITY_JSON) * dump.INDEX_RECORD.size,
+        )
+        with self.assertRaises(ValueError):
+            dump.build_index(self.jsonl_gz)
+
+    def test_002_lookup(self):
+        self.assertEqual(len(self.source), len(TEST_ENTITY_JSON))
+        for item in TEST_ENTITY_JSON:
+            with self.subTest(gnd_id=item["gndIdentifier"]):
+                self.assertIn(item["gndIdentifier"], self.source)
+                self.assertEqual(self.source.get(item["gndIdentifier"]), item)
+        for gnd_id in ["01234-4321", "1", "9999999999"]:
+            self.assertIsNone(self.source.get(gnd_id))
+            self.assertNotIn(gnd_id, self.source)
+
+    def test_003_offline_client(self):
+        place = pl.PyLobidClient(
+            "https://d-nb.info/gnd/4066009-6", source=self.source, offline=True
+        ).factory()
+        self.assertIsInstance(place, pl.PyLobidPlace)
+        self.assertEqual(place.coords, ["+016.371690", "+048.208199"])
+        person = pl.PyLobidPerson(
+            "118584596", fetch_related=True, source=self.source, offline=True
+        )
+        self.assertEqual(person.ent_dict["pylobid_born"]["preferredName"], "Salzburg")
+        with self.assertRaises(pl.GNDNotFoundError):
+            pl.PyLobidClient("1000000001", source=self.source, offline=True)
+        entities, not_found = pl.PyLobidClient.fetch_many(
+            ["4066009-6", "118610961", "01234-4321"], source=self.source, offline=True
+        )
+        self.assertEqual(list(entities), ["4066009-6", "118610961"])
+        self.assertEqual(not_found, ["01234-4321"])
+
+    def test_004_http_fallback(self):
+        write_dump(self.jsonl, TEST_ENTITY_JSON[:3])
+        with dump.DumpSource(self.jsonl, f"{self.jsonl}.small") as source:
+            place = pl.PyLobidClient(
+                "4066009-6", source=source, transport=self.transport
+            )
+            person = pl.PyLobidClient(
+                "118584596", source=source, transport=self.transport
+            )
+            self.assertEqual(place.pref_name, "Wien")
+            self.assertEqual(person.pref_name, "Mozart, Wolfgang Amadeus")
+            self.assertEqual(self.server.request_log, ["/gnd/118584596"])
+
+    def test_005_chunked_index(self):
+        with open(f"{self.jsonl}.idx", "rb") as index:
+            expected = index.read()
+        for chunk_size in [1, 2, 3, len(TEST_ENTITY_JSON)]:
+            with self.subTest(chunk_size=chunk_size):
+                index_path = dump.build_index(
+                    self.jsonl, f"{self.jsonl}.{chunk_size}", chunk_size=chunk_size
+                )
+                with open(index_path, "rb") as index:
+                    self.assertEqual(index.read(), expected)
+                with dump.DumpSource(self.jsonl, index_path) as source:
+                    for item in TEST_ENTITY_JSON:
+                        self.assertEqual(source.get(item["gndIdentifier"]), item)
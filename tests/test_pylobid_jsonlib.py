@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""Tests for `pylobid.jsonlib` module."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from pylobid import dump, jsonlib
+from pylobid import pylobid as pl
+from tests.fixtures import TEST_ENTITY_JSON, StubServerTestCase
+
+
+class TestJsonlib(StubServerTestCase):
+    """Tests for `pylobid.jsonlib`."""
+
+    entity_cache = None
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.addCleanup(jsonlib.set_backend, jsonlib.backend)
+
+    def test_001_default_backend(self):
+        backends = jsonlib.available_backends()
+        self.assertEqual(backends[-1], "json")
+        self.assertEqual(jsonlib.set_backend(), backends[0])
+        self.assertEqual(jsonlib.backend, backends[0])
+
+    def test_002_backends_agree(self):
+        for backend in jsonlib.available_backends():
+            jsonlib.set_backend(backend)
+            for item in TEST_ENTITY_JSON:
+                with self.subTest(backend=backend, gnd_id=item["gndIdentifier"]):
+                    payload = json.dumps(item, ensure_ascii=False).encode("utf-8")
+                    self.assertEqual(jsonlib.loads(payload), item)
+                    self.assertEqual(jsonlib.loads(payload.decode("utf-8")), item)
+
+    def test_003_invalid(self):
+        with self.assertRaises(ValueError):
+            jsonlib.set_backend("yaml")
+        for backend in jsonlib.available_backends():
+            jsonlib.set_backend(backend)
+            with self.assertRaises(ValueError):
+                jsonlib.loads(b'{"id": ')
+
+    def test_004_set_backend_everywhere(self):
+        jsonlib.set_backend("json")
+        self.assertIs(jsonlib.loads, json.loads)
+        place = pl.PyLobidClient("4066009-6", transport=self.transport)
+        self.assertEqual(place.ent_dict, TEST_ENTITY_JSON[0])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "dump.jsonl")
+            with open(path, "w", encoding="utf-8") as output:
+                output.writelines(json.dumps(x) + "\n" for x in TEST_ENTITY_JSON)
+            self.assertEqual(list(dump.iter_records(path)), TEST_ENTITY_JSON)
+
+
+if __name__ == "__main__":
+    unittest.main()
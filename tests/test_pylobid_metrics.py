@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""Tests for `pylobid.metrics` module."""
+
+from pylobid import metrics
+from pylobid import pylobid as pl
+from tests.fixtures import StubServerTestCase
+
+
+class TestMetrics(StubServerTestCase):
+    """Tests for `pylobid.metrics`."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.registry = metrics.MetricsRegistry().install()
+        self.addCleanup(self.registry.uninstall)
+
+    def test_001_request_events(self):
+        events = []
+        metrics.subscribe(events.append)
+        self.addCleanup(metrics.unsubscribe, events.append)
+        pl.PyLobidClient("4066009-6", transport=self.transport)
+        requests = [x for x in events if x["event"] == "request"]
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(requests[0]["gnd_id"], "4066009-6")
+        self.assertEqual(requests[0]["entity_type"], "PlaceOrGeographicName")
+        self.assertEqual(requests[0]["outcome"], "fetched")
+        self.assertEqual(requests[0]["status"], 200)
+        self.assertGreater(requests[0]["bytes"], 0)
+        self.assertGreater(requests[0]["duration"], 0)
+
+    def test_002_counters(self):
+        pl.PyLobidClient("4066009-6", transport=self.transport)
+        pl.PyLobidClient("4066009-6", transport=self.transport)
+        with self.assertRaises(pl.GNDNotFoundError):
+            pl.PyLobidClient("1000000001", transport=self.transport)
+        registry = self.registry
+        self.assertEqual(registry.counter("request"), 3)
+        self.assertEqual(registry.counter("request", outcome="fetched"), 1)
+        self.assertEqual(registry.counter("request", outcome="cache_hit"), 1)
+        self.assertEqual(registry.counter("request", outcome="not_found"), 1)
+        self.assertEqual(
+            registry.counter("request", entity_type="PlaceOrGeographicName"), 2
+        )
+        self.assertAlmostEqual(registry.cache_hit_ratio, 1 / 3)
+        histogram = registry.histogram("request")
+        self.assertEqual(histogram["count"], 3)
+        self.assertEqual(histogram["buckets"][float("inf")], 3)
+        snapshot = registry.snapshot()
+        self.assertEqual(snapshot["counters"]["request:unknown:not_found"], 1)
+        self.assertGreater(snapshot["bytes"]["request:PlaceOrGeographicName"], 0)
+
+    def test_003_process_and_factory(self):
+        person = pl.PyLobidClient("118584596", transport=self.transport).factory()
+        self.assertIsInstance(person, pl.PyLobidPerson)
+        # the client and the person returned by `factory` each process once
+        self.assertEqual(self.registry.counter("process", entity_type="Person"), 2)
+        self.assertEqual(self.registry.counter("factory", outcome="ok"), 1)
+        with self.assertRaises(ValueError):
+            pl.PyLobidClient().factory()
+        self.assertEqual(self.registry.counter("factory", outcome="error"), 1)
+
+    def test_004_unsubscribed(self):
+        self.registry.uninstall()
+        pl.PyLobidClient("4066009-6", transport=self.transport).factory()
+        self.assertEqual(self.registry.snapshot()["counters"], {})
+        self.assertEqual(metrics.subscribers, [])
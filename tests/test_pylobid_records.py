@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""Tests for `pylobid.records` module."""
+
+import unittest
+
+from pylobid import pylobid as pl
+from pylobid import records
+from pylobid.sources import MemorySource
+from tests.fixtures import TEST_ENTITY_JSON
+
+COMMON = ["gnd_id", "gnd_url", "is_place", "is_org", "is_person", "is_work"]
+PROPERTIES = {
+    pl.PyLobidPlace: ["coords", "point"],
+    pl.PyLobidOrg: ["located_in"],
+    pl.PyLobidWork: [
+        "creators",
+        "date_of_creation",
+        "date_of_production",
+        "date_of_publication",
+    ],
+    pl.PyLobidPerson: ["life_span", "birth_place", "death_place"],
+}
+
+
+class TestRecords(unittest.TestCase):
+    """Tests for `pylobid.records`."""
+
+    def setUp(self) -> None:
+        self.source = MemorySource(TEST_ENTITY_JSON)
+
+    def entity(self, data: dict, fetch_related: bool = False):
+        entity = pl.PyLobidClient(
+            source=self.source, offline=True, fetch_related=fetch_related
+        )
+        entity.process_data(data=data)
+        return entity.factory()
+
+    def test_001_same_properties(self):
+        for data in TEST_ENTITY_JSON:
+            for fetch_related in [False, True]:
+                entity = self.entity(data, fetch_related=fetch_related)
+                record = entity.to_record()
+                names = COMMON + PROPERTIES[type(entity)]
+                names += ["pref_name", "alt_names", "same_as"]
+                for name in names:
+                    with self.subTest(gnd_id=entity.gnd_id, name=name):
+                        self.assertEqual(getattr(record, name), getattr(entity, name))
+                self.assertEqual(list(record.ent_type), entity.ent_type)
+
+    def test_002_person_places(self):
+        person = self.entity(TEST_ENTITY_JSON[4], fetch_related=True)
+        record = person.to_record()
+        self.assertIsInstance(record, records.PersonRecord)
+        for place_of in ["Birth", "Death"]:
+            self.assertEqual(
+                record.place_of_values(place_of), person.place_of_values(place_of)
+            )
+            self.assertEqual(record.get_point(place_of), person.get_point(place_of))
+            self.assertEqual(
+                record.get_place_alt_name(place_of),
+                person.get_place_alt_name(place_of),
+            )
+        self.assertEqual(record.get_point("Death"), (16.37169, 48.208199))
+
+    def test_003_compact(self):
+        record = records.from_json(TEST_ENTITY_JSON[3])
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertFalse(hasattr(record, "ent_dict"))
+        with self.assertRaises(AttributeError):
+            record.note = "no room for this"
+        self.assertEqual(repr(record), "<PersonRecord http://lobid.org/gnd/118610961>")
+
+    def test_004_to_record_without_data(self):
+        with self.assertRaises(ValueError):
+            pl.PyLobidClient().to_record()
+
+    def test_005_coords_as_in_source(self):
+        geometry = [
+            {"type": "Point", "asWKT": ["Point ( +16.37169 +48.2 )"]},
+            {"type": "Point", "asWKT": ["Point ( +017.000000 +049.000000 )"]},
+        ]
+        place = dict(TEST_ENTITY_JSON[0], hasGeometry=geometry)
+        expected = ["+16.37169", "+48.2", "+017.000000", "+049.000000"]
+        entity = self.entity(place)
+        record = entity.to_record()
+        self.assertEqual(entity.coords, expected)
+        self.assertEqual(record.coords, expected)
+        self.assertEqual(record.point, entity.point)
+        self.source.add(place)
+        person = self.entity(TEST_ENTITY_JSON[4], fetch_related=True)
+        record = person.to_record()
+        self.assertEqual(person.death_place["coords"], expected)
+        self.assertEqual(record.death_place, person.death_place)
+        self.assertEqual(record.get_coords("Death"), expected)
+        self.assertEqual(record.get_point("Death"), (16.37169, 48.2))
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""Tests for `pylobid.retry` module."""
+
+import email.utils
+import socket
+import time
+import unittest
+
+import requests
+
+from pylobid import cache
+from pylobid import pylobid as pl
+from pylobid.retry import RetryPolicy, parse_retry_after
+from pylobid.transport import PyLobidTransport
+from tests.fixtures import TEST_ENTITY_JSON, StubServerTestCase
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Tests for `pylobid.retry.RetryPolicy` without a server."""
+
+    def test_001_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        date = email.utils.formatdate(time.time() + 30, usegmt=True)
+        self.assertAlmostEqual(parse_retry_after(date), 30, delta=2)
+        date = email.utils.formatdate(time.time() - 30, usegmt=True)
+        self.assertEqual(parse_retry_after(date), 0.0)
+
+    def test_002_backoff(self):
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+        self.assertEqual([policy.backoff(x) for x in range(4)], [0.5, 1, 2, 3])
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3)
+        for attempt in range(6):
+            self.assertTrue(0 <= policy.backoff(attempt) <= min(3, 0.5 * 2**attempt))
+
+    def test_003_never_retry_404(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(statuses=(404, 503))
+
+    def test_004_connection_errors(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        policy = RetryPolicy(max_retries=2, backoff_factor=0)
+        base_url = f"http://127.0.0.1:{port}/gnd"
+        with PyLobidTransport(base_url=base_url, retry=policy) as transport:
+            with self.assertRaises(requests.ConnectionError):
+                transport.get(f"{base_url}/4066009-6")
+        self.assertEqual(policy.stats["retries"], 2)
+        self.assertEqual(policy.stats["gave_up"], 1)
+        self.assertEqual(policy.stats["reasons"], {"ConnectionError": 2})
+
+
+class TestRetryTransport(StubServerTestCase):
+    """Tests for retries of a `PyLobidTransport` against a stub API."""
+
+    def setUp(self) -> None:
+        # every test serves the entities with its own error options
+        self.swap_default_cache(cache.EntityCache())
+
+    def retry_transport(self, server, **kwargs) -> PyLobidTransport:
+        kwargs.setdefault("backoff_factor", 0)
+        retry = RetryPolicy(**kwargs)
+        transport = PyLobidTransport(base_url=server.base_url, retry=retry)
+        self.addCleanup(transport.close)
+        return transport
+
+    def test_001_retry_transient_errors(self):
+        server = self.serve(error_rate=0.5, seed=3)
+        transport = self.retry_transport(server, max_retries=10, budget_reserve=100)
+        for item in TEST_ENTITY_JSON:
+            client = pl.PyLobidClient(item["gndIdentifier"], transport=transport)
+            self.assertEqual(client.ent_dict, item)
+        stats = transport.retry.stats
+        self.assertEqual(stats["requests"], len(TEST_ENTITY_JSON))
+        self.assertEqual(stats["retries"], server.status_log.count(503))
+        self.assertGreater(stats["retries"], 0)
+        self.assertEqual(stats["reasons"], {503: stats["retries"]})
+
+    def test_002_give_up(self):
+        server = self.serve(error_rate=1.0, error_status=502)
+        transport = self.retry_transport(server, max_retries=2)
+        with self.assertRaises(pl.GNDAPIError):
+            pl.PyLobidClient("4066009-6", transport=transport)
+        self.assertEqual(len(server.request_log), 3)
+        self.assertEqual(transport.retry.stats["gave_up"], 1)
+
+    def test_003_no_retry_on_404(self):
+        server = self.serve()
+        transport = self.retry_transport(server)
+        with self.assertRaises(pl.GNDNotFoundError):
+            pl.PyLobidClient("1000000001", transport=transport)
+        self.assertEqual(len(server.request_log), 1)
+        self.assertEqual(transport.retry.stats["retries"], 0)
+
+    def test_004_retry_after(self):
+        server = self.serve(error_rate=1.0, error_status=429, retry_after="1")
+        transport = self.retry_transport(server, max_retries=1, max_retry_after=0.2)
+        start = time.perf_counter()
+        response = transport.get(f"{transport.base_url}/4066009-6")
+        self.assertGreaterEqual(time.perf_counter() - start, 0.2)
+        self.assertEqual(response.status_code, 429)
+        self.assertAlmostEqual(transport.retry.stats["waited"], 0.2)
+
+    def test_005_retry_budget(self):
+        server = self.serve(error_rate=1.0)
+        transport = self.retry_transport(
+            server, max_retries=3, budget_ratio=0.5, budget_reserve=2
+        )
+        for _ in range(4):
+            response = transport.get(f"{transport.base_url}/4066009-6")
+            self.assertEqual(response.status_code, 503)
+        stats = transport.retry.stats
+        self.assertEqual(stats["retries"], 3)
+        self.assertEqual(stats["budget_exhausted"], 4)
+        self.assertEqual(len(server.request_log), 4 + 3)
+        transport.retry.reset()
+        self.assertEqual(transport.retry.stats["retries"], 0)
+
+    def test_006_fetch_many(self):
+        server = self.serve(error_rate=0.3, seed=1)
+        transport = self.retry_transport(server, max_retries=10, budget_reserve=100)
+        ids = [x["gndIdentifier"] for x in TEST_ENTITY_JSON]
+        entities, not_found = pl.PyLobidClient.fetch_many(
+            ids, chunk_size=2, transport=transport
+        )
+        self.assertEqual(sorted(entities), sorted(ids))
+        self.assertEqual(not_found, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+"""Tests for `pylobid.singleflight` module."""
+
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pylobid import metrics
+from pylobid import pylobid as pl
+from pylobid.singleflight import AsyncSingleFlight, SingleFlight
+from tests.fixtures import TEST_ENTITY_JSON, StubServerTestCase
+
+try:
+    import httpx
+except ModuleNotFoundError:
+    httpx = None
+else:
+    from pylobid import aio
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Tests for `pylobid.singleflight.SingleFlight`."""
+
+    def run_concurrently(self, flights, function, number=8, copy=None):
+        barrier = threading.Barrier(number)
+
+        def call():
+            barrier.wait()
+            return flights.do("key", function, copy=copy)
+
+        with ThreadPoolExecutor(number) as pool:
+            futures = [pool.submit(call) for _ in range(number)]
+        return futures
+
+    def test_001_coalesce(self):
+        flights = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def function():
+            calls.append(1)
+            release.wait(5)
+            return {"calls": len(calls)}
+
+        threading.Timer(0.2, release.set).start()
+        futures = self.run_concurrently(flights, function, copy=dict)
+        results = [x.result() for x in futures]
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(shared for _, shared in results), [False] + [True] * 7)
+        self.assertEqual(len({id(data) for data, _ in results}), 8)
+        self.assertEqual(flights.stats["calls"], 1)
+        self.assertEqual(flights.stats["coalesced"], 7)
+        self.assertEqual(flights.stats["in_flight"], 0)
+        self.assertEqual(flights.do("key", lambda: "again"), ("again", False))
+
+    def test_002_errors(self):
+        flights = SingleFlight()
+        release = threading.Event()
+
+        def function():
+            release.wait(5)
+            raise pl.GNDAPIError("GND API error code: 503")
+
+        threading.Timer(0.2, release.set).start()
+        for future in self.run_concurrently(flights, function, number=4):
+            self.assertIsInstance(future.exception(), pl.GNDAPIError)
+        self.assertEqual(flights.stats["calls"], 1)
+        self.assertEqual(flights.stats["in_flight"], 0)
+
+
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+    """Tests for `pylobid.singleflight.AsyncSingleFlight`."""
+
+    async def test_001_coalesce(self):
+        flights = AsyncSingleFlight()
+        calls = []
+
+        async def function():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"calls": len(calls)}
+
+        results = await asyncio.gather(
+            *[flights.do("key", function, copy=dict) for _ in range(8)]
+        )
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sum(shared for _, shared in results), 7)
+        self.assertEqual(len({id(data) for data, _ in results}), 8)
+        self.assertEqual(flights.stats["in_flight"], 0)
+
+    async def test_002_cancel_one_caller(self):
+        flights = AsyncSingleFlight()
+
+        async def function():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.ensure_future(flights.do("key", function))
+        second = asyncio.ensure_future(flights.do("key", function))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertEqual(await second, ("done", True))
+        self.assertTrue(first.cancelled())
+
+
+class TestCoalescedRequests(StubServerTestCase):
+    """Tests for coalesced requests of `PyLobidClient`."""
+
+    server_options = {"latency": 0.2}
+    entity_cache = None
+
+    def resolve(self, gnd_id: str, number: int = 8) -> list:
+        barrier = threading.Barrier(number)
+
+        def resolve():
+            barrier.wait()
+            return pl.PyLobidClient(gnd_id, transport=self.transport)
+
+        with ThreadPoolExecutor(number) as pool:
+            futures = [pool.submit(resolve) for _ in range(number)]
+        return futures
+
+    def test_001_threads(self):
+        with metrics.MetricsRegistry() as registry:
+            clients = [x.result() for x in self.resolve("4066009-6")]
+        self.assertEqual(self.server.request_log, ["/gnd/4066009-6"])
+        self.assertTrue(all(x.ent_dict == TEST_ENTITY_JSON[0] for x in clients))
+        clients[0].ent_dict["preferredName"] = "Vienna"
+        self.assertEqual(clients[1].ent_dict["preferredName"], "Wien")
+        self.assertEqual(registry.counter("request", outcome="fetched"), 1)
+        self.assertEqual(registry.counter("request", outcome="coalesced"), 7)
+
+    def test_002_not_found(self):
+        for future in self.resolve("1000000001", number=4):
+            self.assertIsInstance(future.exception(), pl.GNDNotFoundError)
+        self.assertEqual(len(self.server.request_log), 1)
+
+    def test_003_async(self):
+        if not httpx:
+            self.skipTest("httpx not installed")
+
+        async def resolve():
+            async with aio.AsyncPyLobidClient(base_url=self.server.base_url) as client:
+                return await asyncio.gather(
+                    *[client.get("4066009-6") for _ in range(8)]
+                )
+
+        places = asyncio.run(resolve())
+        self.assertEqual(self.server.request_log, ["/gnd/4066009-6"])
+        self.assertEqual({x.pref_name for x in places}, {"Wien"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""Tests for `pylobid.sources` and `pylobid.testing` modules."""
+
+import time
+import unittest
+
+import requests
+
+from pylobid import pylobid as pl
+from pylobid import sources
+from pylobid.testing import StubLobidServer
+from pylobid.transport import PyLobidTransport
+from tests.fixtures import TEST_ENTITY_JSON, StubServerTestCase
+
+
+class TestSources(StubServerTestCase):
+    """Tests for `pylobid.sources`."""
+
+    entities = TEST_ENTITY_JSON[3:]
+
+    def test_001_memory_source(self):
+        source = sources.MemorySource(TEST_ENTITY_JSON)
+        self.assertIsInstance(source, sources.EntitySource)
+        self.assertEqual(len(source), len(TEST_ENTITY_JSON))
+        data = source.get("4066009-6")
+        data["preferredName"] = "Vienna"
+        self.assertEqual(source.get("4066009-6")["preferredName"], "Wien")
+        self.assertIsNone(source.get("01234-4321"))
+
+    def test_002_http_source(self):
+        source = sources.HTTPSource(self.transport)
+        self.assertEqual(source.get("118584596"), TEST_ENTITY_JSON[4])
+        self.assertIsNone(source.get("4066009-6"))
+
+    def test_003_chained_source(self):
+        source = sources.ChainedSource(
+            sources.MemorySource(TEST_ENTITY_JSON[:3]),
+            sources.HTTPSource(self.transport),
+        )
+        person = pl.PyLobidPerson(
+            "118584596", fetch_related=True, source=source, offline=True
+        )
+        self.assertEqual(person.birth_place["name"], "Salzburg")
+        self.assertEqual(self.server.request_log, ["/gnd/118584596"])
+        self.assertIsNone(source.get("01234-4321"))
+
+    def test_004_source_before_api(self):
+        source = sources.MemorySource(TEST_ENTITY_JSON[:3])
+        entities, not_found = pl.PyLobidClient.fetch_many(
+            ["4066009-6", "118610961", "01234-4321"],
+            transport=self.transport,
+            source=source,
+        )
+        self.assertEqual(list(entities), ["4066009-6", "118610961"])
+        self.assertEqual(not_found, ["01234-4321"])
+        self.assertEqual(len(self.server.request_log), 1)
+        self.assertIs(entities["4066009-6"].source, source)
+
+
+class TestStubLobidServer(unittest.TestCase):
+    """Tests for `pylobid.testing.StubLobidServer`."""
+
+    def test_001_latency(self):
+        with StubLobidServer(TEST_ENTITY_JSON, latency=0.1) as server:
+            start = time.perf_counter()
+            response = requests.get(f"{server.base_url}/4066009-6")
+            elapsed = time.perf_counter() - start
+        self.assertEqual(response.status_code, 200)
+        self.assertGreaterEqual(elapsed, 0.1)
+
+    def test_002_error_rate(self):
+        with StubLobidServer(TEST_ENTITY_JSON, error_rate=0.5, seed=1) as server:
+            for _ in range(40):
+                requests.get(f"{server.base_url}/4066009-6")
+        self.assertEqual(set(server.status_log), {200, 503})
+        with StubLobidServer(TEST_ENTITY_JSON, error_rate=1.0) as server:
+            transport = PyLobidTransport(base_url=server.base_url)
+            self.addCleanup(transport.close)
+            with self.assertRaises(pl.GNDAPIError):
+                pl.PyLobidClient("4066009-6", transport=transport, use_cache=False)
+
+    def test_003_reproducible_errors(self):
+        logs = []
+        for _ in range(2):
+            with StubLobidServer(TEST_ENTITY_JSON, error_rate=0.3, seed=7) as server:
+                for _ in range(20):
+                    requests.get(f"{server.base_url}/4066009-6")
+            logs.append(server.status_log)
+        self.assertEqual(logs[0], logs[1])
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+"""Tests for `pylobid.transport` module."""
+
+import json
+import socket
+import unittest
+
+import requests
+
+from pylobid import cache
+from pylobid import pylobid as pl
+from pylobid import transport
+from pylobid.retry import RetryPolicy
+from tests.fixtures import TEST_ENTITY_JSON, RecordingTransport, StubServerTestCase
+
+
+class TestPyLobidTransport(unittest.TestCase):
+    """Tests for `pylobid.transport.PyLobidTransport`."""
+
+    def setUp(self) -> None:
+        self.addCleanup(cache.set_default_cache, cache.get_default_cache())
+        cache.set_default_cache(cache.EntityCache())
+
+    def test_001_default_transport_shared(self):
+        client_a = pl.PyLobidClient()
+        client_b = pl.PyLobidPlace()
+        self.assertIs(client_a.transport, client_b.transport)
+        self.assertIs(client_a.transport, transport.get_default_transport())
+
+    def test_002_set_default_transport(self):
+        previous = transport.get_default_transport()
+        custom = transport.PyLobidTransport(base_url="http://localhost/gnd/")
+        try:
+            transport.set_default_transport(custom)
+            client = pl.PyLobidClient()
+            self.assertIs(client.transport, custom)
+            self.assertEqual(client.BASE_URL, "http://localhost/gnd")
+        finally:
+            transport.set_default_transport(previous)
+
+    def test_003_pool_settings(self):
+        with transport.PyLobidTransport(pool_connections=2, pool_maxsize=4) as tp:
+            adapter = tp.session.get_adapter(tp.base_url)
+            self.assertEqual(adapter._pool_connections, 2)
+            self.assertEqual(adapter._pool_maxsize, 4)
+
+    def test_004_injected_transport(self):
+        tp = RecordingTransport()
+        client = pl.PyLobidClient("4066009-6", transport=tp)
+        self.assertEqual(tp.urls, ["http://lobid.org/gnd/4066009-6"])
+        self.assertIs(client.factory().transport, tp)
+
+    def test_005_related_places_use_transport(self):
+        tp = RecordingTransport()
+        person = pl.PyLobidPerson("118584596", fetch_related=True, transport=tp)
+        self.assertEqual(len(tp.urls), 3)
+        self.assertEqual(person.ent_dict["pylobid_born"]["preferredName"], "Salzburg")
+        self.assertEqual(person.ent_dict["pylobid_died"]["preferredName"], "Wien")
+
+    def test_006_not_found(self):
+        with self.assertRaises(pl.GNDNotFoundError):
+            _ = pl.PyLobidClient("1000000001", transport=RecordingTransport())
+
+    def test_007_invalid_check_digit(self):
+        tp = RecordingTransport()
+        for gnd_id in ["118610962", "4066009-5", "0123abc-0123def"]:
+            with self.subTest(gnd_id=gnd_id):
+                with self.assertRaises(pl.GNDIdError):
+                    _ = pl.PyLobidClient(gnd_id, transport=tp)
+        entities, not_found = pl.PyLobidClient.fetch_many(
+            ["118610962", "https://d-nb.info/gnd/4066009-5"], transport=tp
+        )
+        self.assertEqual(entities, {})
+        self.assertEqual(not_found, ["118610962", "4066009-5"])
+        self.assertEqual(tp.urls, [])
+
+
+class TestTransferStats(StubServerTestCase):
+    """Tests for the content encoding and byte counters of transports."""
+
+    server_options = {"compress": True}
+    entity_cache = None
+
+    def test_001_accept_encoding(self):
+        self.assertIn("gzip", transport.ACCEPT_ENCODING)
+        tp = transport.PyLobidTransport(accept_encoding="gzip")
+        self.addCleanup(tp.close)
+        self.assertEqual(tp.session.headers["Accept-Encoding"], "gzip")
+
+    def test_002_bytes_on_wire(self):
+        tp = self.transport
+        place = pl.PyLobidClient("4066009-6", transport=tp)
+        self.assertEqual(place.ent_dict, TEST_ENTITY_JSON[0])
+        stats = tp.stats
+        self.assertEqual(stats["responses"], 1)
+        self.assertEqual(stats["bytes_decoded"], len(json.dumps(TEST_ENTITY_JSON[0])))
+        self.assertLess(stats["bytes_on_wire"], stats["bytes_decoded"])
+        self.assertLess(stats["compression_ratio"], 1)
+        self.assertEqual(stats["http_versions"], {"HTTP/1.1": 1})
+
+    def test_003_create_transport(self):
+        tp = transport.create_transport(http2=False, base_url=self.server.base_url)
+        self.addCleanup(tp.close)
+        self.assertIsInstance(tp, transport.PyLobidTransport)
+        tp = transport.create_transport(base_url=self.server.base_url)
+        self.addCleanup(tp.close)
+        expected = (
+            transport.HTTP2Transport
+            if transport.http2_available()
+            else transport.PyLobidTransport
+        )
+        self.assertIsInstance(tp, expected)
+        self.assertEqual(tp.base_url, self.server.base_url)
+
+    def test_004_create_transport_options(self):
+        options = {"max_connections": 4, "pool_block": True, "keep_alive": False}
+        tp = transport.create_transport(
+            http2=False, base_url=self.server.base_url, timeout=5, **options
+        )
+        self.addCleanup(tp.close)
+        self.assertEqual(
+            (tp.pool_maxsize, tp.pool_block, tp.keep_alive, tp.timeout),
+            (4, True, False, 5),
+        )
+        place = pl.PyLobidClient("4066009-6", transport=tp)
+        self.assertEqual(place.pref_name, "Wien")
+        tp = transport.create_transport(
+            base_url=self.server.base_url, pool_maxsize=4, keep_alive=False
+        )
+        self.addCleanup(tp.close)
+        if transport.http2_available():
+            self.assertEqual(tp.max_connections, 4)
+        else:
+            self.assertEqual(tp.pool_maxsize, 4)
+
+
+class TestHTTP2Transport(StubServerTestCase):
+    """Tests for `pylobid.transport.HTTP2Transport`.
+
+    The stub API speaks HTTP/1.1 only, so these tests cover the fallback
+    and the `requests` compatible API.
+    """
+
+    server_options = {"compress": True}
+    entity_cache = None
+    transport_class = transport.HTTP2Transport
+
+    def setUp(self) -> None:
+        if not transport.http2_available():
+            self.skipTest("httpx with HTTP/2 support not installed")
+        super().setUp()
+
+    def test_001_entities(self):
+        place = pl.PyLobidClient("4066009-6", transport=self.transport)
+        self.assertIsInstance(place.factory(), pl.PyLobidPlace)
+        with self.assertRaises(pl.GNDNotFoundError):
+            pl.PyLobidClient("1000000001", transport=self.transport)
+        stats = self.transport.stats
+        self.assertEqual(stats["http_versions"], {"HTTP/1.1": 2})
+        self.assertLess(stats["bytes_on_wire"], stats["bytes_decoded"])
+
+    def test_002_fetch_many_and_search(self):
+        ids = [x["gndIdentifier"] for x in TEST_ENTITY_JSON]
+        entities, not_found = pl.PyLobidClient.fetch_many(
+            ids, chunk_size=2, transport=self.transport
+        )
+        self.assertEqual(sorted(entities), sorted(ids))
+        persons = list(
+            pl.PyLobidClient.search(
+                "Mozart", types=["Person"], transport=self.transport
+            )
+        )
+        self.assertEqual([x.gnd_id for x in persons], ["118584596"])
+
+    def test_003_errors(self):
+        self.server.error_rate = 1.0
+        tp = transport.HTTP2Transport(
+            base_url=self.server.base_url,
+            retry=RetryPolicy(max_retries=2, backoff_factor=0),
+        )
+        self.addCleanup(tp.close)
+        with self.assertRaises(pl.GNDAPIError):
+            pl.PyLobidClient("4066009-6", transport=tp)
+        self.assertEqual(tp.retry.stats["retries"], 2)
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        with transport.HTTP2Transport(base_url=f"http://127.0.0.1:{port}/gnd") as tp:
+            with self.assertRaises(requests.ConnectionError):
+                tp.get(f"{tp.base_url}/4066009-6")
@@ -2,6 +2,8 @@
 """Tests for `pylobid_validators` package."""
 
 import unittest
+
+from pylobid import transport
 from tests.fixtures import (
     TEST_PLACE_IDS,
     TEST_ORG_IDS,
@@ -9,6 +11,9 @@ from tests.fixtures import (
     TEST_PERSON_IDS,
     TEST_INVALID_URLS,
     TEST_FACTORY,
+    TEST_ENTITY_JSON,
+    RecordingTransport,
+    StubServerTestCase,
 )
 
 try:
@@ -95,3 +100,113 @@ class TestPylobidValidators(unittest.TestCase):
                 form = self.GNDForm()
                 form.gnd_str.data = gnd_str
                 self.assertTrue(form.validate())
+
+    def test_007_invalid_ids_offline(self):
+        previous = transport.get_default_transport()
+        recording = RecordingTransport()
+        transport.set_default_transport(recording)
+        self.addCleanup(transport.set_default_transport, previous)
+        for gnd_str in ["118610962", "http://d-nb.info/gnd/4066009-5", None]:
+            with self.subTest(gnd_str=gnd_str):
+                form = self.GNDForm()
+                form.gnd_str.data = gnd_str
+                self.assertFalse(form.validate())
+                self.assertIn("not a valid GND Id/URL", form.errors["gnd_str"][0])
+        self.assertEqual(recording.urls, [])
+
+
+class TestPylobidListValidators(StubServerTestCase):
+    """Tests for the `FieldList` validators of `pylobid_validators` package."""
+
+    def setUp(self) -> None:
+        if not wtforms:
+            self.skipTest("wtforms not installed")
+        super().setUp()
+        previous = transport.get_default_transport()
+        transport.set_default_transport(self.transport)
+        self.addCleanup(transport.set_default_transport, previous)
+
+        class PlacesForm(wtforms.Form):
+            places = wtforms.FieldList(
+                wtforms.StringField("GND Id"),
+                validators=[validators.GNDPlaceEntityList()],
+            )
+
+        self.PlacesForm = PlacesForm
+
+    def test_001_valid(self):
+        ids = ["4066009-6", "https://d-nb.info/gnd/4004168-2", "4051434-1"]
+        form = self.PlacesForm(data={"places": ids * 10})
+        self.assertTrue(form.validate(), form.errors)
+        self.assertEqual(len(self.server.request_log), 1)
+
+    def test_002_entry_errors(self):
+        ids = ["4066009-6", "118584596", "4066009-5", "", "1000000001"]
+        form = self.PlacesForm(data={"places": ids})
+        self.assertFalse(form.validate())
+        errors = [entry.errors for entry in form.places.entries]
+        self.assertEqual(errors[0], [])
+        self.assertEqual(errors[1], ["The provided GND ID is not a place entity"])
+        self.assertEqual(errors[2], ["4066009-5 is not a valid GND Id/URL"])
+        self.assertEqual(errors[3], [" is not a valid GND Id/URL"])
+        self.assertEqual(errors[4], ['Could not find a GND Entity for ID "1000000001"'])
+        self.assertEqual(form.errors["places"], errors)
+        self.assertEqual(len(self.server.request_log), 1)
+
+    def test_003_person_and_org(self):
+        class Form(wtforms.Form):
+            persons = wtforms.FieldList(
+                wtforms.StringField(), validators=[validators.GNDPersonEntityList()]
+            )
+            orgs = wtforms.FieldList(
+                wtforms.StringField(),
+                validators=[validators.GNDOrgEntityList(message="No org")],
+            )
+
+        form = Form(data={"persons": ["118610961", "118584596"], "orgs": ["4066009-6"]})
+        self.assertFalse(form.validate())
+        self.assertNotIn("persons", form.errors)
+        self.assertEqual(form.errors["orgs"], [["No org"]])
+
+    def test_004_untyped_document(self):
+        untyped = {"id": "https://d-nb.info/gnd/118540238", "gndIdentifier": "118540238"}
+        server = self.serve(TEST_ENTITY_JSON + [untyped])
+        stub = transport.PyLobidTransport(base_url=server.base_url)
+        transport.set_default_transport(stub)
+        self.addCleanup(stub.close)
+        form = self.PlacesForm(data={"places": ["4066009-6", "118540238"]})
+        self.assertFalse(form.validate())
+        self.assertEqual(
+            form.errors["places"],
+            [[], [f"Unknown GND type for {server.base_url}/118540238"]],
+        )
+
+    def test_005_api_errors(self):
+        ids = ["4066009-6", "4066009-5"]
+        server = self.serve(error_rate=1.0)
+        for base_url in [server.base_url, "http://127.0.0.1:9/gnd"]:
+            with self.subTest(base_url=base_url):
+                stub = transport.PyLobidTransport(base_url=base_url)
+                transport.set_default_transport(stub)
+                self.addCleanup(stub.close)
+                form = self.PlacesForm(data={"places": ids})
+                self.assertFalse(form.validate())
+                errors = form.errors["places"]
+                self.assertEqual(len(errors[0]), 1)
+                self.assertTrue(
+                    errors[0][0].startswith("Could not validate the GND Id: ")
+                )
+                self.assertEqual(errors[1], ["4066009-5 is not a valid GND Id/URL"])
+
+    def test_006_empty_entry(self):
+        class Form(wtforms.Form):
+            places = wtforms.FieldList(
+                wtforms.StringField(),
+                min_entries=1,
+                validators=[validators.GNDPlaceEntityList()],
+            )
+
+        form = Form()
+        self.assertIsNone(form.places.entries[0].data)
+        self.assertFalse(form.validate())
+        self.assertEqual(form.errors["places"], [[" is not a valid GND Id/URL"]])